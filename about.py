@@ -4,60 +4,10 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QLabel,
     QHBoxLayout,
-    QScrollArea,
 )
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QPixmap
-
-
-class SmoothScrollArea(QScrollArea):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.verticalScrollBar().setSingleStep(15)  # Set the scrolling step size
-
-        # Variables for mouse-based scrolling
-        self._mousePressPos = None
-        self._scrollBarValueAtMousePress = None
-
-        # Animation setup for smooth scrolling
-        self._animation = QPropertyAnimation(self.verticalScrollBar(), b"value")
-        self._animation.setEasingCurve(QEasingCurve.OutQuad)
-        self._animation.setDuration(500)
-
-    def mousePressEvent(self, event):
-        # Handle mouse press for scrolling
-        if event.button() == Qt.LeftButton:
-            self._mousePressPos = event.globalPos()
-            self._scrollBarValueAtMousePress = self.verticalScrollBar().value()
-            self._animation.stop()  # Stop any ongoing animation when the user interacts
-        super().mousePressEvent(event)
-
-    def mouseMoveEvent(self, event):
-        # Handle mouse movement for scrolling
-        if self._mousePressPos:
-            delta = event.globalPos() - self._mousePressPos
-            self.verticalScrollBar().setValue(
-                self._scrollBarValueAtMousePress - delta.y()
-            )
-        super().mouseMoveEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        # Handle mouse release and trigger smooth scrolling
-        if self._mousePressPos:
-            delta = event.globalPos() - self._mousePressPos
-            target_value = self._scrollBarValueAtMousePress - delta.y()
-            self.smoothScrollTo(target_value)
-        self._mousePressPos = None
-        self._scrollBarValueAtMousePress = None
-        super().mouseReleaseEvent(event)
-
-    def smoothScrollTo(self, target_value):
-        # Animate scrolling to the target value
-        self._animation.setStartValue(self.verticalScrollBar().value())
-        self._animation.setEndValue(target_value)
-        self._animation.start()
+from kinetic_scroll import SmoothScrollArea
 
 
 class AboutWidget(QWidget):
@@ -104,7 +54,7 @@ class AboutWidget(QWidget):
         self.layout.addLayout(back_button_layout)
 
         # Set up the smooth scrolling area
-        scroll_area = SmoothScrollArea(self)
+        self.scroll_area = scroll_area = SmoothScrollArea(self)
         scroll_area.setStyleSheet("background-color: transparent; border: none;")
         scroll_area.setWidgetResizable(True)
 
@@ -130,6 +80,10 @@ class AboutWidget(QWidget):
         self.buttons_widget.show()
         self.back_bt.show()
 
+    def reset(self):
+        # Start from the top when the screen is shown again
+        self.scroll_area.verticalScrollBar().setValue(0)
+
     def go_back(self):
         # Emit signal and hide the widget when back button is clicked
         self.setVisible(False)
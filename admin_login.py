@@ -1,4 +1,3 @@
-import sqlite3
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -6,10 +5,11 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QLineEdit,
     QGridLayout,
-    QGraphicsDropShadowEffect,
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 from custom_message_box import CustomMessageBox
+from kiosk_settings import get_settings
+from shadows import ShadowEffect
 
 
 class AdminLoginWidget(QWidget):
@@ -53,13 +53,6 @@ class AdminLoginWidget(QWidget):
         back_button_layout.addWidget(self.back_bt, alignment=Qt.AlignLeft)
         layout.addLayout(back_button_layout)
 
-        # Connect to the database to retrieve the admin password
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT admin_password FROM kiosk_settings LIMIT 1")
-        self.admin_password = cursor.fetchone()[0]
-        conn.close()
-
         # Create a white background square layout for the keypad and input field
         self.square_layout = QWidget()
         self.square_layout.setStyleSheet(
@@ -73,10 +66,11 @@ class AdminLoginWidget(QWidget):
         self.square_layout.setFixedSize(800, 800)
 
         # Add a drop shadow effect to the square layout
-        shadow_effect = QGraphicsDropShadowEffect()
+        shadow_effect = ShadowEffect()
         shadow_effect.setBlurRadius(50)
         shadow_effect.setColor(Qt.gray)
         shadow_effect.setOffset(0, 12)
+        shadow_effect.setRadius(30)
         self.square_layout.setGraphicsEffect(shadow_effect)
 
         # Create the input field for the password
@@ -169,6 +163,10 @@ class AdminLoginWidget(QWidget):
             current_text = self.input_edit.text()
             self.input_edit.setText(current_text + clicked_text)
 
+    def reset(self):
+        # Start with an empty password field when the screen is shown again
+        self.input_edit.clear()
+
     def go_back(self):
         # Emit signal and clear the input field when back button is clicked
         self.setVisible(False)
@@ -179,7 +177,7 @@ class AdminLoginWidget(QWidget):
         # Handle login button click and validate the password
         input_password = self.input_edit.text()
 
-        if input_password == self.admin_password:
+        if input_password == get_settings().admin_password:
             self.setVisible(False)
             self.input_edit.clear()
             self.login_clicked.emit()
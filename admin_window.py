@@ -1,13 +1,11 @@
 import os
 import sys
-import cups
 import time
 import sqlite3
-import datetime
+from datetime import datetime
 from PyQt5.QtWidgets import (
     QApplication,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QPushButton,
@@ -16,15 +14,12 @@ from PyQt5.QtWidgets import (
     QLabel,
     QSizePolicy,
     QFrame,
-    QGraphicsDropShadowEffect,
     QTabWidget,
-    QAbstractScrollArea,
     QSpacerItem,
     QAbstractItemView,
     QScrollArea,
     QLineEdit,
     QComboBox,
-    QSpinBox,
     QTextEdit,
     QFileDialog,
     QDialog,
@@ -34,70 +29,48 @@ from PyQt5.QtWidgets import (
     QListView,
     QTextBrowser,
     QGridLayout,
+    QTableWidget,
+    QTableWidgetItem,
 )
 from PyQt5.QtCore import (
     Qt,
+    QSize,
     QTimer,
-    QThread,
-    QPropertyAnimation,
-    QEasingCurve,
     pyqtSignal,
     pyqtSlot,
 )
-from PyQt5.QtGui import QPixmap, QMovie, QColor
+from PyQt5.QtGui import QMovie, QColor
 from virtual_keyboard import AlphaNeumericVirtualKeyboard
+from kinetic_scroll import SmoothScrollArea
 from helpers import (
-    upload_form_file,
-    upload_process_file,
-    edit_form_file,
-    edit_process_file,
     delete_form_file,
     delete_process_file,
     delete_form_preview,
 )
 from custom_message_box import CustomMessageBox
-
-
-class SmoothScrollArea(QScrollArea):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.verticalScrollBar().setSingleStep(15)  # Set the scrolling step size
-        self._mousePressPos = None
-        self._scrollBarValueAtMousePress = None
-        self._animation = QPropertyAnimation(self.verticalScrollBar(), b"value")
-        self._animation.setEasingCurve(QEasingCurve.OutQuad)
-        self._animation.setDuration(500)
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._mousePressPos = event.globalPos()
-            self._scrollBarValueAtMousePress = self.verticalScrollBar().value()
-            self._animation.stop()  # Stop any ongoing animation when the user interacts
-        super().mousePressEvent(event)
-
-    def mouseMoveEvent(self, event):
-        if self._mousePressPos:
-            delta = event.globalPos() - self._mousePressPos
-            self.verticalScrollBar().setValue(
-                self._scrollBarValueAtMousePress - delta.y()
-            )
-        super().mouseMoveEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        if self._mousePressPos:
-            delta = event.globalPos() - self._mousePressPos
-            target_value = self._scrollBarValueAtMousePress - delta.y()
-            self.smoothScrollTo(target_value)
-        self._mousePressPos = None
-        self._scrollBarValueAtMousePress = None
-        super().mouseReleaseEvent(event)
-
-    def smoothScrollTo(self, target_value):
-        self._animation.setStartValue(self.verticalScrollBar().value())
-        self._animation.setEndValue(target_value)
-        self._animation.start()
+import database
+import sales_rollup
+import form_search
+import process_images
+import tracing
+from printer_monitor import get_printer_monitor
+from kiosk_settings import get_settings
+from form_ingest import get_ingest_queue
+from print_history import PrintHistoryModel, period_bounds
+from report_export import ExportThread
+from data_changes import get_data_changes, FORMS, PRINT_RESULTS
+from form_catalog import get_form_catalog
+from assets import get_assets, set_button_images
+from shadows import ShadowEffect
+
+
+# Taps on the status bar, within this many seconds, that open the hidden
+# Performance page
+PERFORMANCE_TAPS = 5
+PERFORMANCE_TAP_WINDOW = 3.0
+
+# Index of the Performance page in the admin window's tabs
+PERFORMANCE_TAB = 6
 
 
 class MessageBox(QDialog):
@@ -373,7 +346,7 @@ class DeleteButtonWidget(QWidget):
         self.num_pages_layout = QHBoxLayout()
 
         self.bondpaper_img = QLabel()
-        self.pixmap = QPixmap("./img/static/paper_img.png")
+        self.pixmap = get_assets().static_pixmap("paper_img.png")
         self.bondpaper_img.setPixmap(self.pixmap)
 
         self.page_number_label = QLabel(self.page_number_text)
@@ -484,7 +457,7 @@ class EditButtonWidget(QWidget):
         self.num_pages_layout = QHBoxLayout()
 
         self.bondpaper_img = QLabel()
-        self.pixmap = QPixmap("./img/static/paper_img.png")
+        self.pixmap = get_assets().static_pixmap("paper_img.png")
         self.bondpaper_img.setPixmap(self.pixmap)
 
         self.page_number_label = QLabel(self.page_number_text)
@@ -596,11 +569,12 @@ class FormWidget(QWidget):
             QSpacerItem(20, 10, QSizePolicy.Minimum, QSizePolicy.Fixed)
         )
 
-        # Create a QGraphicsDropShadowEffect
-        shadow_effect = QGraphicsDropShadowEffect()
+        # Create a ShadowEffect
+        shadow_effect = ShadowEffect()
         shadow_effect.setBlurRadius(50)
         shadow_effect.setColor(Qt.gray)
         shadow_effect.setOffset(0, 0)  # Adjust the shadow's offset as needed
+        shadow_effect.setRadius(15)
 
         # Apply the effect to the rectangle
         frame.setGraphicsEffect(shadow_effect)
@@ -681,14 +655,11 @@ class FormWidget(QWidget):
             }
             """
         )
+        # Controlled forms are not added through the admin window
         self.form_category = [
-            "Accreditation",
-            "Clearance",
-            "Enrollment",
-            "Graduation",
-            "Petition",
-            "Research",
-            "Other",
+            category
+            for category, _ in get_form_catalog().categories
+            if category != "Controlled Forms"
         ]
         self.category_input.addItems(self.form_category)
         self.category_input.setFixedWidth(300)
@@ -702,55 +673,10 @@ class FormWidget(QWidget):
         category_layout.addWidget(category_label)
         category_layout.addWidget(self.category_input)
 
-        # Page number layout
-        page_number_layout = QVBoxLayout()
-        pages_label = QLabel("Number of Pages:")
-        pages_label.setStyleSheet(
-            """
-            margin-top: 20px;
-            font-family: Roboto;
-            font-size: 16px;
-            font-weight: bold;
-            """
-        )
-        self.page_input = QSpinBox()
-        self.page_input.setStyleSheet(
-            """
-            QSpinBox {
-                border: 2px solid #B3B3B3;
-                padding-left: 10px;
-                padding-top: 15px;
-                padding-bottom: 15px;
-                font-size: 14px;
-                color: #444444;
-                border-radius: 0px;
-            }
-            QSpinBox:focus {
-                border: 2px solid #7C2F3E;
-            }
-            QSpinBox::up-button {
-                subcontrol-origin: border;
-                subcontrol-position: top right;
-                width: 25px;
-            }
-            QSpinBox::down-button {
-                subcontrol-origin: border;
-                subcontrol-position: bottom right;
-                width: 25px;
-            }
-            """
-        )
-        self.page_input.setMinimum(1)
-        self.page_input.setMaximum(10)
-        self.page_input.setFixedWidth(300)
-        page_number_layout.addWidget(pages_label)
-        page_number_layout.addWidget(self.page_input)
-
         # Upper form layout
         upper_form_layout = QHBoxLayout()
         upper_form_layout.addLayout(title_layout)
         upper_form_layout.addLayout(category_layout)
-        upper_form_layout.addLayout(page_number_layout)
 
         upper_form_layout.setContentsMargins(15, 0, 15, 0)
         form_layout.addLayout(upper_form_layout)
@@ -896,7 +822,6 @@ class FormWidget(QWidget):
     def clear(self):
         self.title_input.clear()
         self.category_input.setCurrentIndex(0)
-        self.page_input.setValue(1)
         self.description_input.clear()
 
         self.upload_form_widget.clearSelectedFile()
@@ -910,28 +835,6 @@ class FormWidget(QWidget):
             ]
         )
 
-    def add_sql_data(self, form_title, num_page, form_description, form_category):
-        try:
-            conn = sqlite3.connect("./database/kiosk.db")
-            cursor = conn.cursor()
-
-            cursor.execute(
-                "INSERT INTO kiosk_forms (form_name, number_of_pages, form_description, form_category) VALUES (?,?,?,?)",
-                (form_title, num_page, form_description, form_category),
-            )
-
-            # Commit the transaction to save changes
-            conn.commit()
-
-            print("Data inserted successfully.")
-
-        except sqlite3.Error as e:
-            print("SQLite error:", e)
-
-        finally:
-            # Close the connection
-            conn.close()
-
     def add_file(self):
         if (
             self.upload_form_widget.check_input()
@@ -939,28 +842,26 @@ class FormWidget(QWidget):
             and self.upload_process_widget.check_input()
         ):
             form_title = self.title_input.text().title().strip()
-            num_page = self.page_input.value()
             form_description = self.description_input.toPlainText().strip()
             form_category = self.category_input.currentText()
 
-            self.add_sql_data(
+            # The files are converted in the background and the form is
+            # listed once its previews are ready
+            form_file_path = self.upload_form_widget.get_file()
+            process_file_path = self.upload_process_widget.get_file()
+            get_ingest_queue().add_form(
+                form_file_path,
+                process_file_path,
                 str(form_title),
-                int(num_page),
                 str(form_description),
                 str(form_category),
             )
 
-            form_file_path = self.upload_form_widget.get_file()
-            upload_form_file(form_file_path, form_title)
-
-            process_file_path = self.upload_process_widget.get_file()
-            upload_process_file(process_file_path, form_title)
-
             self.add_button_clicked.emit()
 
             message_box = CustomMessageBox(
                 "Success",
-                f"{form_title} has been successfully added.",
+                f"{form_title} is being added. It will be listed once its preview pages are generated.",
                 parent=self,
             )
             message_box.exec_()
@@ -1007,11 +908,12 @@ class EditFormWidget(QWidget):
             QSpacerItem(20, 10, QSizePolicy.Minimum, QSizePolicy.Fixed)
         )
 
-        # Create a QGraphicsDropShadowEffect
-        shadow_effect = QGraphicsDropShadowEffect()
+        # Create a ShadowEffect
+        shadow_effect = ShadowEffect()
         shadow_effect.setBlurRadius(50)
         shadow_effect.setColor(Qt.gray)
         shadow_effect.setOffset(0, 0)  # Adjust the shadow's offset as needed
+        shadow_effect.setRadius(15)
 
         # Apply the effect to the rectangle
         frame.setGraphicsEffect(shadow_effect)
@@ -1092,14 +994,11 @@ class EditFormWidget(QWidget):
             }
             """
         )
+        # Controlled forms are not added through the admin window
         self.form_category = [
-            "Accreditation",
-            "Clearance",
-            "Enrollment",
-            "Graduation",
-            "Petition",
-            "Research",
-            "Other",
+            category
+            for category, _ in get_form_catalog().categories
+            if category != "Controlled Forms"
         ]
         self.category_input.addItems(self.form_category)
         self.category_input.setFixedWidth(300)
@@ -1113,55 +1012,10 @@ class EditFormWidget(QWidget):
         category_layout.addWidget(category_label)
         category_layout.addWidget(self.category_input)
 
-        # Page number layout
-        page_number_layout = QVBoxLayout()
-        pages_label = QLabel("Number of Pages:")
-        pages_label.setStyleSheet(
-            """
-            margin-top: 20px;
-            font-family: Roboto;
-            font-size: 16px;
-            font-weight: bold;
-            """
-        )
-        self.page_input = QSpinBox()
-        self.page_input.setStyleSheet(
-            """
-            QSpinBox {
-                border: 2px solid #B3B3B3;
-                padding-left: 10px;
-                padding-top: 15px;
-                padding-bottom: 15px;
-                font-size: 14px;
-                color: #444444;
-                border-radius: 0px;
-            }
-            QSpinBox:focus {
-                border: 2px solid #7C2F3E;
-            }
-            QSpinBox::up-button {
-                subcontrol-origin: border;
-                subcontrol-position: top right;
-                width: 25px;
-            }
-            QSpinBox::down-button {
-                subcontrol-origin: border;
-                subcontrol-position: bottom right;
-                width: 25px;
-            }
-            """
-        )
-        self.page_input.setMinimum(1)
-        self.page_input.setMaximum(10)
-        self.page_input.setFixedWidth(300)
-        page_number_layout.addWidget(pages_label)
-        page_number_layout.addWidget(self.page_input)
-
         # Upper form layout
         upper_form_layout = QHBoxLayout()
         upper_form_layout.addLayout(title_layout)
         upper_form_layout.addLayout(category_layout)
-        upper_form_layout.addLayout(page_number_layout)
 
         upper_form_layout.setContentsMargins(15, 0, 15, 0)
         form_layout.addLayout(upper_form_layout)
@@ -1307,7 +1161,6 @@ class EditFormWidget(QWidget):
     def clear(self):
         self.title_input.clear()
         self.category_input.setCurrentIndex(0)
-        self.page_input.setValue(1)
         self.description_input.clear()
 
         self.upload_form_widget.clearSelectedFile()
@@ -1321,37 +1174,6 @@ class EditFormWidget(QWidget):
             ]
         )
 
-    def add_sql_data(self, form_title, num_page, form_description, form_category):
-        try:
-            conn = sqlite3.connect("./database/kiosk.db")
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                UPDATE kiosk_forms 
-                SET 
-                    form_name = ?, 
-                    number_of_pages = ?, 
-                    form_description = ?, 
-                    form_category = ?
-                WHERE 
-                    id = ?
-                """,
-                (form_title, num_page, form_description, form_category, self.id_num),
-            )
-
-            # Commit the transaction to save changes
-            conn.commit()
-
-            print("Data updated successfully.")
-
-        except sqlite3.Error as e:
-            print("SQLite error:", e)
-
-        finally:
-            # Close the connection
-            conn.close()
-
     def add_file(self):
         if (
             self.upload_form_widget.check_input()
@@ -1359,28 +1181,27 @@ class EditFormWidget(QWidget):
             and self.upload_process_widget.check_input()
         ):
             form_title = self.title_input.text().title().strip()
-            num_page = self.page_input.value()
             form_description = self.description_input.toPlainText().strip()
             form_category = self.category_input.currentText()
 
-            self.add_sql_data(
+            # The form keeps its old row until its new files are converted
+            form_file_path = self.upload_form_widget.get_file()
+            process_file_path = self.upload_process_widget.get_file()
+            get_ingest_queue().edit_form(
+                form_file_path,
+                process_file_path,
+                self.id_num,
                 str(form_title),
-                int(num_page),
+                self.form_name,
                 str(form_description),
                 str(form_category),
             )
 
-            form_file_path = self.upload_form_widget.get_file()
-            edit_form_file(form_file_path, form_title, self.form_name)
-
-            process_file_path = self.upload_process_widget.get_file()
-            edit_process_file(process_file_path, form_title, self.form_name)
-
             self.edit_form_success.emit()
 
             message_box = CustomMessageBox(
                 "Success",
-                f"{form_title} has been successfully updated.",
+                f"{form_title} is being updated. The changes will be listed once its preview pages are generated.",
                 parent=self,
             )
             message_box.exec_()
@@ -1433,9 +1254,8 @@ class UploadFormWidget(QWidget):
         layout.addWidget(form_upload_label, alignment=Qt.AlignCenter)
 
         self.image_label = QLabel()
-        pixmap = QPixmap("./img/static/upload_img.png")
-        scaled_pixmap = pixmap.scaled(
-            120, 120, Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+        scaled_pixmap = get_assets().static_pixmap(
+            "upload_img.png", 120, 120, Qt.IgnoreAspectRatio
         )
         self.image_label.setPixmap(scaled_pixmap)
         self.image_label.setStyleSheet("border: none")
@@ -1578,9 +1398,8 @@ class UploadProcessWidget(QWidget):
         layout.addWidget(form_upload_label, alignment=Qt.AlignCenter)
 
         self.image_label = QLabel()
-        pixmap = QPixmap("./img/static/upload_img.png")
-        scaled_pixmap = pixmap.scaled(
-            120, 120, Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+        scaled_pixmap = get_assets().static_pixmap(
+            "upload_img.png", 120, 120, Qt.IgnoreAspectRatio
         )
         self.image_label.setPixmap(scaled_pixmap)
         self.image_label.setStyleSheet("border: none")
@@ -1706,10 +1525,7 @@ class CustomButton(QPushButton):
             """
         )
 
-        pixmap = QPixmap(image_path)
-        scaled_pixmap = pixmap.scaled(
-            35, 35, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        scaled_pixmap = get_assets().pixmap(image_path, QSize(35, 35))
 
         self.image_label = QLabel()
         self.image_label.setPixmap(scaled_pixmap)
@@ -1765,29 +1581,8 @@ class TotalAmountDropButton(QPushButton):
     def sort_daily(self):
         self.setText("Daily")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        # Get the current date
-        current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-
-        # Execute the SQL query to sum the total amount based on the current date
-        cursor.execute(
-            """
-            SELECT COALESCE(SUM(total_amount), 0) AS total_amount
-            FROM kiosk_print_results
-            WHERE date(date_printed) = ? AND result = 'Success'
-            """,
-            (current_date,),
-        )
-
-        # Fetch the result
-        self.total_amount = cursor.fetchone()[0]
-
-        # Close the cursor and database connection
-        cursor.close()
-        conn.close()
+        # Read the amount from the daily sales totals
+        self.total_amount = sales_rollup.total_amount("daily")
 
         self.daily_selected.emit(self.total_amount)
 
@@ -1797,92 +1592,36 @@ class TotalAmountDropButton(QPushButton):
     def sort_weekly(self):
         self.setText("Weekly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        # Get the current week's start and end dates
-        current_date = datetime.datetime.now()
-        start_of_week = current_date - datetime.timedelta(days=current_date.weekday())
-        end_of_week = start_of_week + datetime.timedelta(days=6)
-
-        # Execute the SQL query to sum the total amount based on the current week
-        cursor.execute(
-            """
-            SELECT COALESCE(SUM(total_amount), 0) AS total_amount
-            FROM kiosk_print_results
-            WHERE date(date_printed) BETWEEN ? AND ? AND result = 'Success'
-            """,
-            (start_of_week.strftime("%Y-%m-%d"), end_of_week.strftime("%Y-%m-%d")),
-        )
-
-        # Fetch the result
-        self.total_amount = cursor.fetchone()[0]
-
-        # Close the cursor and database connection
-        cursor.close()
-        conn.close()
+        # Read the amount from the daily sales totals
+        self.total_amount = sales_rollup.total_amount("weekly")
 
         self.weekly_selected.emit(self.total_amount)
 
     def sort_monthly(self):
         self.setText("Monthly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        # Get the current month and year
-        current_month = datetime.datetime.now().strftime("%Y-%m")
-
-        # Execute the SQL query to sum the total amount based on the current month
-        cursor.execute(
-            """
-            SELECT COALESCE(SUM(total_amount), 0) AS total_amount
-            FROM kiosk_print_results
-            WHERE strftime('%Y-%m', date_printed) = ? AND result = 'Success'
-            """,
-            (current_month,),
-        )
-
-        # Fetch the result
-        total_amount = cursor.fetchone()[0]
-
-        # Close the cursor and database connection
-        cursor.close()
-        conn.close()
+        # Read the amount from the daily sales totals
+        total_amount = sales_rollup.total_amount("monthly")
 
         self.monthly_selected.emit(total_amount)
 
     def sort_yearly(self):
         self.setText("Yearly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        # Get the current year
-        current_year = datetime.datetime.now().strftime("%Y")
-
-        # Execute the SQL query to sum the total amount based on the current year
-        cursor.execute(
-            """
-            SELECT COALESCE(SUM(total_amount), 0) AS total_amount
-            FROM kiosk_print_results
-            WHERE strftime('%Y', date_printed) = ? AND result = 'Success'
-            """,
-            (current_year,),
-        )
-
-        # Fetch the result
-        total_amount = cursor.fetchone()[0]
-
-        # Close the cursor and database connection
-        cursor.close()
-        conn.close()
+        # Read the amount from the daily sales totals
+        total_amount = sales_rollup.total_amount("yearly")
 
         self.yearly_selected.emit(total_amount)
 
+    def refresh(self):
+        # Reads the selected period again
+        {
+            "Daily": self.sort_daily,
+            "Weekly": self.sort_weekly,
+            "Monthly": self.sort_monthly,
+            "Yearly": self.sort_yearly,
+        }[self.text()]()
+
 
 class TotalFormDropButton(QPushButton):
     daily_selected = pyqtSignal(str)
@@ -1927,33 +1666,8 @@ class TotalFormDropButton(QPushButton):
     def sort_daily(self):
         self.setText("Daily")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        # Get the start and end dates for the current day
-        current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-
-        cursor.execute(
-            """
-            SELECT COALESCE(
-                    (SELECT form_name
-                        FROM kiosk_print_results
-                        WHERE strftime('%Y-%m-%d', date_printed) = ? 
-                            AND result = 'Success'
-                        GROUP BY form_name
-                        ORDER BY SUM(number_of_copies) DESC
-                        LIMIT 1
-                    ), 'None'
-                )
-        """,
-            (current_date,),
-        )
-
-        self.total_form = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the most printed form from the daily sales totals
+        self.total_form = sales_rollup.top_form("daily")
 
         self.daily_selected.emit(self.total_form)
 
@@ -1963,102 +1677,36 @@ class TotalFormDropButton(QPushButton):
     def sort_weekly(self):
         self.setText("Weekly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        # Get the start and end dates for the current week
-        today = datetime.datetime.now()
-        start_of_week = today - datetime.timedelta(days=today.weekday())
-        end_of_week = start_of_week + datetime.timedelta(days=6)
-
-        cursor.execute(
-            """
-            SELECT COALESCE(
-                    (SELECT form_name
-                        FROM kiosk_print_results
-                        WHERE strftime('%Y-%m-%d', date_printed) BETWEEN ? AND ? 
-                            AND result = 'Success'
-                        GROUP BY form_name
-                        ORDER BY SUM(number_of_copies) DESC
-                        LIMIT 1
-                    ), 'None'
-                )
-        """,
-            (start_of_week.strftime("%Y-%m-%d"), end_of_week.strftime("%Y-%m-%d")),
-        )
-
-        self.total_form = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the most printed form from the daily sales totals
+        self.total_form = sales_rollup.top_form("weekly")
 
         self.weekly_selected.emit(self.total_form)
 
     def sort_monthly(self):
         self.setText("Monthly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        current_month = datetime.datetime.now().strftime("%Y-%m")
-
-        cursor.execute(
-            """
-            SELECT COALESCE(
-                    (SELECT form_name
-                        FROM kiosk_print_results
-                        WHERE strftime('%Y-%m', date_printed) = ? 
-                            AND result = 'Success'
-                        GROUP BY form_name
-                        ORDER BY SUM(number_of_copies) DESC
-                        LIMIT 1
-                    ), 'None'
-                )
-        """,
-            (current_month,),
-        )
-
-        total_form = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the most printed form from the daily sales totals
+        total_form = sales_rollup.top_form("monthly")
 
         self.monthly_selected.emit(total_form)
 
     def sort_yearly(self):
         self.setText("Yearly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        current_year = datetime.datetime.now().strftime("%Y")
-
-        cursor.execute(
-            """
-            SELECT COALESCE(
-                    (SELECT form_name
-                        FROM kiosk_print_results
-                        WHERE strftime('%Y', date_printed) = ? 
-                            AND result = 'Success'
-                        GROUP BY form_name
-                        ORDER BY SUM(number_of_copies) DESC
-                        LIMIT 1
-                    ), 'None'
-                )
-        """,
-            (current_year,),
-        )
-
-        total_form = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the most printed form from the daily sales totals
+        total_form = sales_rollup.top_form("yearly")
 
         self.yearly_selected.emit(total_form)
 
+    def refresh(self):
+        # Reads the selected period again
+        {
+            "Daily": self.sort_daily,
+            "Weekly": self.sort_weekly,
+            "Monthly": self.sort_monthly,
+            "Yearly": self.sort_yearly,
+        }[self.text()]()
+
 
 class TotalFailedDropButton(QPushButton):
     daily_selected = pyqtSignal(int)
@@ -2103,27 +1751,8 @@ class TotalFailedDropButton(QPushButton):
     def sort_daily(self):
         self.setText("Daily")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        # Get the start and end dates for the current day
-        current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS total_failed_count
-            FROM kiosk_print_results
-            WHERE result = 'Failed'
-            AND date(date_printed) = ?
-        """,
-            (current_date,),
-        )
-
-        self.total_error = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the count from the daily sales totals
+        self.total_error = sales_rollup.result_count("Failed", "daily")
 
         self.daily_selected.emit(self.total_error)
 
@@ -2133,84 +1762,36 @@ class TotalFailedDropButton(QPushButton):
     def sort_weekly(self):
         self.setText("Weekly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        # Get the start and end dates for the current week
-        today = datetime.datetime.now()
-        start_of_week = today - datetime.timedelta(days=today.weekday())
-        end_of_week = start_of_week + datetime.timedelta(days=6)
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS total_failed_count
-            FROM kiosk_print_results
-            WHERE result = 'Failed'
-            AND date(date_printed) BETWEEN ? AND ?
-        """,
-            (start_of_week.strftime("%Y-%m-%d"), end_of_week.strftime("%Y-%m-%d")),
-        )
-
-        self.total_error = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the count from the daily sales totals
+        self.total_error = sales_rollup.result_count("Failed", "weekly")
 
         self.weekly_selected.emit(self.total_error)
 
     def sort_monthly(self):
         self.setText("Monthly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        current_month = datetime.datetime.now().strftime("%Y-%m")
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS total_failed_count
-            FROM kiosk_print_results
-            WHERE result = 'Failed'
-            AND strftime('%Y-%m', date_printed) = ?
-        """,
-            (current_month,),
-        )
-
-        total_error = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the count from the daily sales totals
+        total_error = sales_rollup.result_count("Failed", "monthly")
 
         self.monthly_selected.emit(total_error)
 
     def sort_yearly(self):
         self.setText("Yearly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        current_year = datetime.datetime.now().strftime("%Y")
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS total_failed_count
-            FROM kiosk_print_results
-            WHERE result = 'Failed'
-            AND strftime('%Y', date_printed) = ?
-        """,
-            (current_year,),
-        )
-
-        total_error = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the count from the daily sales totals
+        total_error = sales_rollup.result_count("Failed", "yearly")
 
         self.yearly_selected.emit(total_error)
 
+    def refresh(self):
+        # Reads the selected period again
+        {
+            "Daily": self.sort_daily,
+            "Weekly": self.sort_weekly,
+            "Monthly": self.sort_monthly,
+            "Yearly": self.sort_yearly,
+        }[self.text()]()
+
 
 class TotalSuccessDropButton(QPushButton):
     daily_selected = pyqtSignal(int)
@@ -2255,27 +1836,8 @@ class TotalSuccessDropButton(QPushButton):
     def sort_daily(self):
         self.setText("Daily")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        # Get the start and end dates for the current day
-        current_date = datetime.datetime.now().strftime("%Y-%m-%d")
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS total_success_count
-            FROM kiosk_print_results
-            WHERE result = 'Success'
-            AND date(date_printed) = ?
-        """,
-            (current_date,),
-        )
-
-        self.total_success = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the count from the daily sales totals
+        self.total_success = sales_rollup.result_count("Success", "daily")
 
         self.daily_selected.emit(self.total_success)
 
@@ -2285,84 +1847,36 @@ class TotalSuccessDropButton(QPushButton):
     def sort_weekly(self):
         self.setText("Weekly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        # Get the start and end dates for the current week
-        today = datetime.datetime.now()
-        start_of_week = today - datetime.timedelta(days=today.weekday())
-        end_of_week = start_of_week + datetime.timedelta(days=6)
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS total_failed_count
-            FROM kiosk_print_results
-            WHERE result = 'Success'
-            AND date(date_printed) BETWEEN ? AND ?
-        """,
-            (start_of_week.strftime("%Y-%m-%d"), end_of_week.strftime("%Y-%m-%d")),
-        )
-
-        self.total_success = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the count from the daily sales totals
+        self.total_success = sales_rollup.result_count("Success", "weekly")
 
         self.weekly_selected.emit(self.total_success)
 
     def sort_monthly(self):
         self.setText("Monthly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        current_month = datetime.datetime.now().strftime("%Y-%m")
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS total_failed_count
-            FROM kiosk_print_results
-            WHERE result = 'Success'
-            AND strftime('%Y-%m', date_printed) = ?
-        """,
-            (current_month,),
-        )
-
-        total_success = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the count from the daily sales totals
+        total_success = sales_rollup.result_count("Success", "monthly")
 
         self.monthly_selected.emit(total_success)
 
     def sort_yearly(self):
         self.setText("Yearly")
 
-        # Connect to the database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        current_year = datetime.datetime.now().strftime("%Y")
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) AS total_failed_count
-            FROM kiosk_print_results
-            WHERE result = 'Success'
-            AND strftime('%Y', date_printed) = ?
-        """,
-            (current_year,),
-        )
-
-        total_success = cursor.fetchone()[0]
-
-        cursor.close()
-        conn.close()
+        # Read the count from the daily sales totals
+        total_success = sales_rollup.result_count("Success", "yearly")
 
         self.yearly_selected.emit(total_success)
 
+    def refresh(self):
+        # Reads the selected period again
+        {
+            "Daily": self.sort_daily,
+            "Weekly": self.sort_weekly,
+            "Monthly": self.sort_monthly,
+            "Yearly": self.sort_yearly,
+        }[self.text()]()
+
 
 class TotalAmountWidget(QWidget):
     def __init__(self):
@@ -2384,7 +1898,7 @@ class TotalAmountWidget(QWidget):
         top_layout = QHBoxLayout()
         image_label = QLabel()
 
-        button = TotalAmountDropButton()
+        self.button = button = TotalAmountDropButton()
         button.setFixedSize(120, 40)
 
         button.daily_selected.connect(self.change_total_label)
@@ -2434,6 +1948,9 @@ class TotalAmountWidget(QWidget):
     def change_total_label(self, total_amount):
         self.total_label.setText(f"₱ {total_amount}")
 
+    def refresh(self):
+        self.button.refresh()
+
 
 class TotalFormWidget(QWidget):
     def __init__(self):
@@ -2456,7 +1973,7 @@ class TotalFormWidget(QWidget):
         image_label = QLabel()
         image_label.setStyleSheet("border: none;")
 
-        button = TotalFormDropButton()
+        self.button = button = TotalFormDropButton()
         button.setFixedSize(120, 40)
 
         button.daily_selected.connect(self.change_total_label)
@@ -2507,6 +2024,9 @@ class TotalFormWidget(QWidget):
     def change_total_label(self, total_amount):
         self.total_label.setText(f"{total_amount}")
 
+    def refresh(self):
+        self.button.refresh()
+
 
 class TotalSuccessWidget(QWidget):
     def __init__(self):
@@ -2525,7 +2045,7 @@ class TotalSuccessWidget(QWidget):
         top_layout = QHBoxLayout()
         image_label = QLabel()
 
-        button = TotalSuccessDropButton()
+        self.button = button = TotalSuccessDropButton()
         button.setFixedSize(120, 40)
 
         button.daily_selected.connect(self.change_total_label)
@@ -2575,6 +2095,9 @@ class TotalSuccessWidget(QWidget):
     def change_total_label(self, total_amount):
         self.total_label.setText(f"{total_amount}")
 
+    def refresh(self):
+        self.button.refresh()
+
 
 class TotalFailedWidget(QWidget):
     def __init__(self):
@@ -2593,7 +2116,7 @@ class TotalFailedWidget(QWidget):
         top_layout = QHBoxLayout()
         image_label = QLabel()
 
-        button = TotalFailedDropButton()
+        self.button = button = TotalFailedDropButton()
         button.setFixedSize(120, 40)
 
         button.daily_selected.connect(self.change_total_label)
@@ -2643,6 +2166,9 @@ class TotalFailedWidget(QWidget):
     def change_total_label(self, total_amount):
         self.total_label.setText(f"{total_amount}")
 
+    def refresh(self):
+        self.button.refresh()
+
 
 class HelpMessageButton(QPushButton):
     def __init__(self, title, parent=None):
@@ -2664,10 +2190,7 @@ class HelpMessageButton(QPushButton):
             """
         )
 
-        pixmap = QPixmap("./img/static/next_arrow_img.png")
-        scaled_pixmap = pixmap.scaled(
-            15, 35, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        scaled_pixmap = get_assets().static_pixmap("next_arrow_img.png", 15, 35)
 
         self.image_label = QLabel()
         self.image_label.setPixmap(scaled_pixmap)
@@ -2714,8 +2237,10 @@ class HelpMessageBox(QDialog):
 
         self.close_button = QPushButton()
         self.close_button.setStyleSheet(
-            "QPushButton {background-color: transparent; border: none; image: url('img/static/close_img.png');}"
-            "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/close_img_pressed.png');}"
+            "QPushButton {background-color: transparent; border: none;}"
+        )
+        set_button_images(
+            self.close_button, "close_img.png", "close_img_pressed.png", QSize(45, 45)
         )
         self.close_button.setFixedSize(45, 45)
         self.close_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -2739,8 +2264,10 @@ class HelpMessageBox(QDialog):
         self.back_button = QPushButton()
         self.back_button.setFixedSize(30, 30)
         self.back_button.setStyleSheet(
-            "QPushButton {background-color: transparent; border: none; image: url('img/static/back_img.png');}"
-            "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/back_img_pressed.png');}"
+            "QPushButton {background-color: transparent; border: none;}"
+        )
+        set_button_images(
+            self.back_button, "back_img.png", "back_img_pressed.png", QSize(30, 30)
         )
         self.back_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.back_button.clicked.connect(self.go_back)
@@ -2873,7 +2400,7 @@ class HelpMessageBox(QDialog):
             <li style="font-size: 16px; margin-left: 8px;"><strong>Click the "Add Forms" Button</strong><br>
             To add form(s), click the "Add Forms" button.</li><br>
             <li style="font-size: 16px; margin-left: 8px;"><strong>Fill Out the Form Information</strong><br>
-            Fill out the form information text boxes: [Form Title, Form Category, Number of Pages, Form Description]</li><br>
+            Fill out the form information text boxes: [Form Title, Form Category, Form Description]</li><br>
             <li style="font-size: 16px; margin-left: 8px;"><strong>Upload Form File</strong><br>
             To upload form file(s) should be in PDF format. Click the "Browse" button to upload the form. Select the form file from your plugged-in USB flash drive.</li><br>
             <li style="font-size: 16px; margin-left: 8px;"><strong>Upload Process File</strong><br>
@@ -2904,7 +2431,7 @@ class HelpMessageBox(QDialog):
             <li style="font-size: 16px; margin-left: 8px;"><strong>Proceed to the Editing Interface</strong><br>
             After clicking the "Continue" button, you will be taken to the same interface as when adding forms.</li><br>
             <li style="font-size: 16px; margin-left: 8px;"><strong>Fill Out the Form Information</strong><br>
-            Fill out the form information text boxes: [Form Title, Form Category, Number of Pages, Form Description]</li><br>
+            Fill out the form information text boxes: [Form Title, Form Category, Form Description]</li><br>
             <li style="font-size: 16px; margin-left: 8px;"><strong>Upload Form File</strong><br>
             To upload the form file(s) it should be in PDF format. Click the "Browse" button to upload the form. Select the form file from your plugged-in USB flash drive.</li><br>
             <li style="font-size: 16px; margin-left: 8px;"><strong>Upload Process File</strong><br>
@@ -3176,46 +2703,6 @@ class HelpMessageBox(QDialog):
         self.reject()
 
 
-class PrinterStatus(QThread):
-    status_updated = pyqtSignal(bool)
-
-    def __init__(self):
-        super().__init__()
-        self.printer_state = None
-        self.running = True
-
-    def run(self):
-        while self.running:
-            self.is_printer_available()
-            time.sleep(3)
-
-    def is_printer_available(self):
-        try:
-            conn = cups.Connection()
-            printers = conn.getPrinters()
-
-            if not printers:
-                self.printer_state = False
-            else:
-                idle_printer_found = False
-                for printer_name, printer_attributes in printers.items():
-                    if (
-                        "printer-state" in printer_attributes
-                        and printer_attributes["printer-state"] == 3
-                    ):
-                        idle_printer_found = True
-                        break
-                self.printer_state = idle_printer_found
-
-            self.status_updated.emit(self.printer_state)
-        except Exception as e:
-            print(e)
-            self.status_updated.emit(False)
-
-    def stop(self):
-        self.running = False
-
-
 class CheckPrinterStatusWindow(QDialog):
     printer_status_updated = pyqtSignal(bool)
 
@@ -3228,9 +2715,11 @@ class CheckPrinterStatusWindow(QDialog):
         self.setWindowModality(Qt.ApplicationModal)
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
 
-        self.printer_status_thread = PrinterStatus()
-        self.printer_status_thread.status_updated.connect(self.update_status)
-        self.printer_status_thread.start()
+        # Show the last known status and ask the printer monitor for a new one
+        self.printer_monitor = get_printer_monitor()
+        self.update_status(self.printer_monitor.is_available)
+        self.printer_monitor.availability_changed.connect(self.update_status)
+        self.printer_monitor.refresh()
 
     def setup_ui(self):
         self.layout = QVBoxLayout(self)
@@ -3242,8 +2731,10 @@ class CheckPrinterStatusWindow(QDialog):
         self.close_button = QPushButton()
         self.close_button.setFocusPolicy(Qt.NoFocus)
         self.close_button.setStyleSheet(
-            "QPushButton {background-color: transparent; border: none; image: url('img/static/close_img.png');}"
-            "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/close_img_pressed.png');}"
+            "QPushButton {background-color: transparent; border: none;}"
+        )
+        set_button_images(
+            self.close_button, "close_img.png", "close_img_pressed.png", QSize(45, 45)
         )
         self.close_button.setFixedSize(45, 45)
         self.close_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -3319,8 +2810,7 @@ class CheckPrinterStatusWindow(QDialog):
 
     def close_window(self):
         self.close()
-        self.printer_status_thread.stop()
-        self.printer_status_thread.wait()
+        self.printer_monitor.availability_changed.disconnect(self.update_status)
         self.printer_status_updated.emit(self.is_available)
 
 
@@ -3330,10 +2820,7 @@ class RefillButton(QPushButton):
 
         layout = QVBoxLayout()
 
-        pixmap = QPixmap("./img/static/ink_level_img.png")
-        scaled_pixmap = pixmap.scaled(
-            65, 65, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        scaled_pixmap = get_assets().static_pixmap("ink_level_img.png", 65, 65)
 
         self.image_label = QLabel()
         self.image_label.setPixmap(scaled_pixmap)
@@ -3362,10 +2849,7 @@ class ChangePasswordButton(QPushButton):
 
         layout = QVBoxLayout()
 
-        pixmap = QPixmap("./img/static/password_img.png")
-        scaled_pixmap = pixmap.scaled(
-            65, 65, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        scaled_pixmap = get_assets().static_pixmap("password_img.png", 65, 65)
 
         self.image_label = QLabel()
         self.image_label.setPixmap(scaled_pixmap)
@@ -3398,15 +2882,6 @@ class ChangePasswordWindow(QDialog):
         self.setStyleSheet("background-color: #EBEBEB;")
         self.setup_ui()
 
-        # Connect database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT admin_password FROM kiosk_settings LIMIT 1")
-        self.admin_password = cursor.fetchone()[0]
-
-        conn.close()
-
         self.setWindowModality(Qt.ApplicationModal)
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
 
@@ -3420,8 +2895,10 @@ class ChangePasswordWindow(QDialog):
         self.close_button = QPushButton()
         self.close_button.setFocusPolicy(Qt.NoFocus)
         self.close_button.setStyleSheet(
-            "QPushButton {background-color: transparent; border: none; image: url('img/static/close_img.png');}"
-            "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/close_img_pressed.png');}"
+            "QPushButton {background-color: transparent; border: none;}"
+        )
+        set_button_images(
+            self.close_button, "close_img.png", "close_img_pressed.png", QSize(45, 45)
         )
         self.close_button.setFixedSize(45, 45)
         self.close_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -3536,26 +3013,7 @@ class ChangePasswordWindow(QDialog):
         input_password = self.input_edit.text()
 
         try:
-            conn = sqlite3.connect("./database/kiosk.db")
-            cursor = conn.cursor()
-
-            cursor.execute("BEGIN TRANSACTION")
-
-            cursor.execute(
-                """
-                UPDATE kiosk_settings
-                SET admin_password = ?
-                WHERE ROWID = (
-                    SELECT ROWID
-                    FROM kiosk_settings
-                    ORDER BY ROWID
-                    LIMIT 1
-                )
-            """,
-                (input_password,),
-            )
-
-            cursor.execute("COMMIT")
+            get_settings().update(admin_password=input_password)
 
             # Display dialog box indicating success
             message_box = CustomMessageBox(
@@ -3565,20 +3023,82 @@ class ChangePasswordWindow(QDialog):
             message_box.exec_()
 
         except sqlite3.Error as error:
-            conn.rollback()
-            print("Error changing price:", error)
-
-        finally:
-            if conn:
-                conn.close()
+            print("Error changing password:", error)
 
     def close_message(self):
         self.input_edit.clear()
 
 
+class LazyTabWidget(QTabWidget):
+    """
+    Tab widget whose pages are built the first time they are shown.
+
+    Each page is added with the function that builds it, an optional
+    function that refreshes it in place and the data sources it shows (see
+    data_changes.py). invalidate(source) marks the built pages showing that
+    data as stale: the current page is refreshed at once if visible, the
+    others when they are next shown. Pages without a refresh function are
+    built again.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.builders = []
+        self.refreshers = []
+        self.sources = []
+        self.built = []
+        self.stale = set()
+        self.currentChanged.connect(self.ensure_page)
+
+    def add_lazy_tab(self, build, refresh=None, sources=()):
+        self.builders.append(build)
+        self.refreshers.append(refresh)
+        self.sources.append(set(sources))
+        self.built.append(False)
+
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        return self.addTab(page, "")
+
+    def ensure_page(self, index):
+        if index < 0:
+            return
+
+        if not self.built[index]:
+            self.widget(index).layout().addWidget(self.builders[index]())
+            self.built[index] = True
+            self.stale.discard(index)
+        elif index in self.stale:
+            self.stale.discard(index)
+            if self.refreshers[index] is not None:
+                self.refreshers[index]()
+            else:
+                layout = self.widget(index).layout()
+                old_page = layout.takeAt(0).widget()
+                old_page.hide()
+                old_page.deleteLater()
+                layout.addWidget(self.builders[index]())
+
+    def invalidate_page(self, index):
+        if self.built[index]:
+            self.stale.add(index)
+
+    def invalidate(self, source):
+        for index, sources in enumerate(self.sources):
+            if source in sources:
+                self.invalidate_page(index)
+
+        if self.isVisible():
+            self.ensure_page(self.currentIndex())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.ensure_page(self.currentIndex())
+
+
 class AdminWindowWidget(QWidget):
     home_screen_backbt_clicked = pyqtSignal()
-    bondpaper_quantity_updated = pyqtSignal(int)
     printer_updated = pyqtSignal(bool)
 
     def __init__(self, parent, is_printer_available):
@@ -3588,23 +3108,12 @@ class AdminWindowWidget(QWidget):
         self.id_num = 0
         self.form_name = " "
 
-        # connect database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT coins_left FROM kiosk_settings LIMIT 1")
-        self.coins_left = cursor.fetchone()[0]
-
-        cursor.execute("SELECT bondpaper_quantity FROM kiosk_settings LIMIT 1")
-        self.bondpaper_quantity = cursor.fetchone()[0]
-
-        cursor.execute("SELECT ink_level FROM kiosk_settings LIMIT 1")
-        self.ink_level = cursor.fetchone()[0]
-
-        cursor.execute("SELECT base_price FROM kiosk_settings LIMIT 1")
-        self.base_price = cursor.fetchone()[0]
-
-        conn.close()
+        # Read the cached kiosk settings
+        settings = get_settings()
+        self.coins_left = settings.coins_left
+        self.bondpaper_quantity = settings.bondpaper_quantity
+        self.ink_level = settings.ink_level
+        self.base_price = settings.base_price
 
         # Create and position the virtual keyboard
         self.virtual_keyboard = AlphaNeumericVirtualKeyboard("", parent=self)
@@ -3613,14 +3122,13 @@ class AdminWindowWidget(QWidget):
         self.virtual_keyboard.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
         self.virtual_keyboard.hide()
 
-        # add tabs
-        self.tab1 = self.ui1()
-        self.tab2 = self.ui2()
-        self.tab3 = self.ui3()
-        self.tab4 = self.ui4()
-        self.tab5 = self.ui5()
-
         self.setup_ui(is_printer_available)
+        get_data_changes().changed.connect(self.right_widget.invalidate)
+        settings.settings_changed.connect(self.update_settings_slot)
+        get_printer_monitor().availability_changed.connect(self.update_printer_status)
+        ingest_queue = get_ingest_queue()
+        ingest_queue.job_progress.connect(self.update_ingest_progress)
+        ingest_queue.job_finished.connect(self.ingest_finished)
 
         self.btn_1.clicked.connect(self.button1)
         self.btn_2.clicked.connect(self.button2)
@@ -3631,6 +3139,10 @@ class AdminWindowWidget(QWidget):
         self.active_button = self.btn_1
         self.update_button_styles()
 
+    def reset(self, is_printer_available):
+        self.update_printer_status(is_printer_available)
+        self.button1()
+
     def setup_ui(self, is_printer_available):
         layout = QVBoxLayout(self)
 
@@ -3639,8 +3151,10 @@ class AdminWindowWidget(QWidget):
 
         help_button = QPushButton()
         help_button.setStyleSheet(
-            "QPushButton {background-color: transparent; border: none; image: url('img/static/help_img.png');}"
-            "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/help_img_pressed.png');}"
+            "QPushButton {background-color: transparent; border: none;}"
+        )
+        set_button_images(
+            help_button, "help_img.png", "help_img_pressed.png", QSize(65, 65)
         )
         help_button.setFixedSize(65, 65)
         help_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -3656,15 +3170,20 @@ class AdminWindowWidget(QWidget):
             "QFrame { background-color: #FDFDFD; border-radius: 20px; }"
         )
 
-        # Create a QGraphicsDropShadowEffect
-        shadow_effect = QGraphicsDropShadowEffect()
+        # Create a ShadowEffect
+        shadow_effect = ShadowEffect()
         shadow_effect.setBlurRadius(50)
         shadow_effect.setColor(Qt.gray)
         shadow_effect.setOffset(0, 0)  # Adjust the shadow's offset as needed
+        shadow_effect.setRadius(20)
 
         # Apply the effect to the rectangle
         rectangle.setGraphicsEffect(shadow_effect)
 
+        # Tapping the status bar a few times opens the Performance page
+        self.status_taps = []
+        rectangle.mousePressEvent = self.status_tapped
+
         rectangle_layout.addWidget(rectangle, alignment=Qt.AlignTop | Qt.AlignRight)
         rectangle_layout.setContentsMargins(475, 25, 60, 0)
 
@@ -3702,21 +3221,20 @@ class AdminWindowWidget(QWidget):
         self.bondpaper_warning.clicked.connect(self.low_bondpaper)
         self.bondpaper_warning.hide()
         bondpaper_img = QLabel()
-        pixmap = QPixmap("./img/static/bondpaper_quantity.png")
+        pixmap = get_assets().static_pixmap("bondpaper_quantity.png")
         bondpaper_img.setPixmap(pixmap)
         self.bondpaper_label = QLabel(str(self.bondpaper_quantity))
-        self.bondpaper_quantity_updated.connect(self.update_label_slot)
         bondpaper_layout.addWidget(self.bondpaper_warning)
         bondpaper_layout.addWidget(bondpaper_img)
         bondpaper_layout.addWidget(self.bondpaper_label, alignment=Qt.AlignLeft)
 
         # Coins widgets
         coins_img = QLabel()
-        pixmap = QPixmap("./img/static/coins_img.png")
+        pixmap = get_assets().static_pixmap("coins_img.png")
         coins_img.setPixmap(pixmap)
-        coins_label = QLabel(f"{self.coins_left:0.2f}")
+        self.coins_label = QLabel(f"{self.coins_left:0.2f}")
         coins_layout.addWidget(coins_img)
-        coins_layout.addWidget(coins_label, alignment=Qt.AlignLeft)
+        coins_layout.addWidget(self.coins_label, alignment=Qt.AlignLeft)
 
         # Printer widgets
         self.printer_warning = QPushButton("!")
@@ -3740,7 +3258,7 @@ class AdminWindowWidget(QWidget):
         self.printer_warning.clicked.connect(self.printer_not_connected)
         self.printer_warning.hide()
         printer_img = QLabel()
-        pixmap = QPixmap("./img/static/printer_img.png")
+        pixmap = get_assets().static_pixmap("printer_img.png")
         printer_img.setPixmap(pixmap)
         self.printer_status_symbol = QLabel("✓")
         self.printer_updated.connect(self.update_printer_status)
@@ -3770,7 +3288,7 @@ class AdminWindowWidget(QWidget):
         self.ink_warning.clicked.connect(self.low_ink)
         self.ink_warning.hide()
         ink_img = QLabel()
-        pixmap = QPixmap("./img/static/ink_img.png")
+        pixmap = get_assets().static_pixmap("ink_img.png")
         ink_img.setPixmap(pixmap)
         self.ink_status_symbol = QLabel("✓")
         ink_layout.addWidget(self.ink_warning)
@@ -3855,15 +3373,29 @@ class AdminWindowWidget(QWidget):
         self.left_layout.addStretch(5)
         self.left_layout.setSpacing(20)
 
+        # Progress of form PDFs being converted in the background
+        self.ingest_label = QLabel()
+        self.ingest_label.setWordWrap(True)
+        self.ingest_label.setAlignment(Qt.AlignCenter)
+        self.ingest_label.setStyleSheet(
+            """
+            font-family: Roboto;
+            font-size: 14px;
+            color: #19323C;
+            """
+        )
+        self.ingest_label.hide()
+        self.left_layout.addWidget(self.ingest_label)
+
         system_layout = QVBoxLayout()
 
         system_bt = QPushButton()
         system_bt.setFocusPolicy(Qt.NoFocus)
         system_bt.setFixedSize(50, 50)
         system_bt.setStyleSheet(
-            "QPushButton {background-color: transparent; border: none; image: url('img/static/system.png');}"
-            "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/system_pressed.png');}"
+            "QPushButton {background-color: transparent; border: none;}"
         )
+        set_button_images(system_bt, "system.png", "system_pressed.png", QSize(50, 50))
         system_bt.clicked.connect(self.show_system_button)
 
         frame = QFrame()
@@ -3961,14 +3493,20 @@ class AdminWindowWidget(QWidget):
         left_widget.setLayout(self.left_layout)
         left_widget.setFixedWidth(250)
 
-        self.right_widget = QTabWidget()
+        self.right_widget = LazyTabWidget()
         self.right_widget.tabBar().setObjectName("mainTab")
 
-        self.right_widget.addTab(self.tab1, "")
-        self.right_widget.addTab(self.tab2, "")
-        self.right_widget.addTab(self.tab3, "")
-        self.right_widget.addTab(self.tab4, "")
-        self.right_widget.addTab(self.tab5, "")
+        # Tabs are built when first shown and refreshed in place when the
+        # data they show changes
+        self.right_widget.add_lazy_tab(
+            self.ui1, self.refresh_dashboard, (PRINT_RESULTS,)
+        )
+        self.right_widget.add_lazy_tab(self.ui2)
+        self.right_widget.add_lazy_tab(self.ui3, self.refresh_edit_list, (FORMS,))
+        self.right_widget.add_lazy_tab(self.ui4, self.refresh_delete_list, (FORMS,))
+        self.right_widget.add_lazy_tab(self.ui5)
+        self.right_widget.add_lazy_tab(self.ui6)
+        self.right_widget.add_lazy_tab(self.ui7)
 
         self.right_widget.setCurrentIndex(0)
         self.right_widget.setStyleSheet(
@@ -4055,26 +3593,26 @@ class AdminWindowWidget(QWidget):
 
         dashboard_layout = QHBoxLayout()
 
-        # Create a QGraphicsDropShadowEffect
-        shadow_effect1 = QGraphicsDropShadowEffect()
+        # Create a ShadowEffect
+        shadow_effect1 = ShadowEffect()
         shadow_effect1.setBlurRadius(50)
         shadow_effect1.setColor(Qt.gray)
         shadow_effect1.setOffset(0, 0)  # Adjust the shadow's offset as needed
 
-        # Create a QGraphicsDropShadowEffect
-        shadow_effect2 = QGraphicsDropShadowEffect()
+        # Create a ShadowEffect
+        shadow_effect2 = ShadowEffect()
         shadow_effect2.setBlurRadius(50)
         shadow_effect2.setColor(Qt.gray)
         shadow_effect2.setOffset(0, 0)  # Adjust the shadow's offset as needed
 
-        # Create a QGraphicsDropShadowEffect
-        shadow_effect3 = QGraphicsDropShadowEffect()
+        # Create a ShadowEffect
+        shadow_effect3 = ShadowEffect()
         shadow_effect3.setBlurRadius(50)
         shadow_effect3.setColor(Qt.gray)
         shadow_effect3.setOffset(0, 0)  # Adjust the shadow's offset as needed
 
-        # Create a QGraphicsDropShadowEffect
-        shadow_effect4 = QGraphicsDropShadowEffect()
+        # Create a ShadowEffect
+        shadow_effect4 = ShadowEffect()
         shadow_effect4.setBlurRadius(50)
         shadow_effect4.setColor(Qt.gray)
         shadow_effect4.setOffset(0, 0)  # Adjust the shadow's offset as needed
@@ -4083,6 +3621,8 @@ class AdminWindowWidget(QWidget):
 
         # Apply the effect to the rectangle
         total_form_widget.setGraphicsEffect(shadow_effect1)
+        # Its white frame sits inside its layout's margins
+        shadow_effect1.setMargins(total_form_widget.layout().contentsMargins())
         total_form_widget.setFixedSize(400, 140)
         dashboard_layout.addWidget(total_form_widget)
 
@@ -4090,6 +3630,7 @@ class AdminWindowWidget(QWidget):
 
         # Apply the effect to the rectangle
         total_amount_widget.setGraphicsEffect(shadow_effect2)
+        shadow_effect2.setMargins(total_amount_widget.layout().contentsMargins())
         total_amount_widget.setFixedSize(400, 140)
         dashboard_layout.addWidget(total_amount_widget)
 
@@ -4097,6 +3638,7 @@ class AdminWindowWidget(QWidget):
 
         # Apply the effect to the rectangle
         total_success_widget.setGraphicsEffect(shadow_effect3)
+        shadow_effect3.setMargins(total_success_widget.layout().contentsMargins())
         total_success_widget.setFixedSize(240, 140)
         dashboard_layout.addWidget(total_success_widget)
 
@@ -4104,9 +3646,17 @@ class AdminWindowWidget(QWidget):
 
         # Apply the effect to the rectangle
         total_failed_widget.setGraphicsEffect(shadow_effect4)
+        shadow_effect4.setMargins(total_failed_widget.layout().contentsMargins())
         total_failed_widget.setFixedSize(240, 140)
         dashboard_layout.addWidget(total_failed_widget)
 
+        self.dashboard_widgets = [
+            total_form_widget,
+            total_amount_widget,
+            total_success_widget,
+            total_failed_widget,
+        ]
+
         dashboard_layout.setAlignment(Qt.AlignLeft)
         main_layout.addLayout(dashboard_layout)
 
@@ -4114,30 +3664,98 @@ class AdminWindowWidget(QWidget):
             QSpacerItem(20, 15, QSizePolicy.Minimum, QSizePolicy.Fixed)
         )
 
-        # Create a table
-        self.tableWidget = QTableWidget()
-        self.tableWidget.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+        history_layout = QHBoxLayout()
+        history_label = QLabel("Print History")
+        history_label.setStyleSheet(
+            """
+            font-family: Montserrat;
+            font-size: 20px;
+            font-weight: bold;
+            color: #19323C;
+            margin-left: 8px;
+            """
+        )
+        history_layout.addWidget(history_label)
+        history_layout.addStretch()
+
+        # Date filter of the print history, applied in the query
+        self.history_filter = QComboBox()
+        self.history_filter.addItem("All", None)
+        self.history_filter.addItem("Today", "daily")
+        self.history_filter.addItem("This Week", "weekly")
+        self.history_filter.addItem("This Month", "monthly")
+        self.history_filter.addItem("This Year", "yearly")
+        self.history_filter.setFixedSize(180, 40)
+        self.history_filter.setStyleSheet(
+            """
+            QComboBox {
+                font-family: Montserrat;
+                font-size: 14px;
+                color: #19323C;
+                background-color: #f0f0f0;
+                border: 1px solid #7C2F3E;
+                border-radius: 6px;
+                padding-left: 10px;
+            }
+            """
+        )
+        self.history_filter.currentIndexChanged.connect(self.filter_history)
+        history_layout.addWidget(self.history_filter)
+
+        self.export_button = QPushButton("Export")
+        self.export_button.setFocusPolicy(Qt.NoFocus)
+        self.export_button.setFixedSize(120, 40)
+        self.export_button.clicked.connect(self.export_history)
+        self.export_button.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #7C2F3E;
+                border-radius: 10px;
+                color: #FAEBD7;
+                padding: 8px 16px;
+                font-size: 14px;
+                font-weight: bold;
+                font-family: Montserrat;
+            }
+            QPushButton:pressed {
+                background-color: #B3B3B3;
+                color: #19323C;
+            }
+            QPushButton:disabled {
+                background-color: #B3B3B3;
+            }
+            """
+        )
+        history_layout.addWidget(self.export_button)
+        main_layout.addLayout(history_layout)
+
+        # Create a table. The model reads the print history a page at a
+        # time as the table is scrolled, newest first.
+        self.history_model = PrintHistoryModel(parent=self)
+        self.tableWidget = QTableView()
+        self.tableWidget.setModel(self.history_model)
         self.tableWidget.verticalHeader().setDefaultSectionSize(80)
         self.tableWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tableWidget.horizontalHeader().setSortIndicator(0, Qt.DescendingOrder)
+        self.tableWidget.setSortingEnabled(True)
+        self.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         table_layout = QVBoxLayout()
         table_layout.addWidget(self.tableWidget)
-        main_layout.addLayout(table_layout)
-
-        self.populate_table()
+        main_layout.addLayout(table_layout, 1)
 
         self.tableWidget.setStyleSheet(
             """
-            QTableWidget {
+            QTableView {
                 background-color: #f0f0f0;
                 alternate-background-color: #e0e0e0; /* Alternating row color */
                 color: #000000;
                 border: none;
                 font-size: 14px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px; /* Adjust cell padding */
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #e0e0e0; /* Selected item color */
                 color: #000000;
             }
@@ -4158,7 +3776,6 @@ class AdminWindowWidget(QWidget):
         self.selection_enabled = True
         self.tableWidget.clicked.connect(self.clear_selection)
 
-        main_layout.addStretch(5)
         main = QWidget()
         main.setLayout(main_layout)
         return main
@@ -4191,7 +3808,6 @@ class AdminWindowWidget(QWidget):
         self.form_widget.description_input_clicked.connect(
             lambda: self.show_virtual_keyboard(self.form_widget.description_input)
         )
-        self.form_widget.add_button_clicked.connect(self.re_init)
 
         main_layout.addWidget(self.form_widget)
 
@@ -4219,38 +3835,8 @@ class AdminWindowWidget(QWidget):
             QSpacerItem(20, 25, QSizePolicy.Minimum, QSizePolicy.Fixed)
         )
 
-        button_labels = self.fetch_button_labels()
-
-        self.vbox_layout = QVBoxLayout()
-
-        for (
-            id_num,
-            form_name,
-            number_of_pages,
-            form_description,
-            form_category,
-        ) in zip(
-            button_labels["id_num"],
-            button_labels["form_names"],
-            button_labels["num_of_pages"],
-            button_labels["form_description"],
-            button_labels["form_category"],
-        ):
-            self.button_widget = EditButtonWidget(
-                id_num, form_name, str(number_of_pages), form_description, form_category
-            )
-            self.button_widget.setFixedHeight(220)
-            self.button_widget.setFixedWidth(750)
-            self.button_widget.setStyleSheet(
-                """
-                    background-color: #FFFFFF;
-                    border-radius: 15px
-                """
-            )
-            self.vbox_layout.addWidget(self.button_widget)
-
-            # Connect the buttonClicked signal to the handleButtonClicked slot
-            self.button_widget.buttonClicked.connect(self.edit_form)
+        self.edit_list_layout = QVBoxLayout()
+        self.fill_edit_list()
 
         scroll_area = SmoothScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -4259,7 +3845,7 @@ class AdminWindowWidget(QWidget):
         scroll_widget.setStyleSheet("background-color: transparent;")
 
         scroll_area_layout = QVBoxLayout(scroll_widget)
-        scroll_area_layout.addLayout(self.vbox_layout)
+        scroll_area_layout.addLayout(self.edit_list_layout)
         scroll_area_layout.setContentsMargins(0, 0, 0, 0)
 
         scroll_area.setWidget(
@@ -4301,38 +3887,8 @@ class AdminWindowWidget(QWidget):
             QSpacerItem(20, 25, QSizePolicy.Minimum, QSizePolicy.Fixed)
         )
 
-        button_labels = self.fetch_button_labels()
-
-        self.vbox_layout = QVBoxLayout()
-
-        for (
-            id_num,
-            form_name,
-            number_of_pages,
-            form_description,
-            form_category,
-        ) in zip(
-            button_labels["id_num"],
-            button_labels["form_names"],
-            button_labels["num_of_pages"],
-            button_labels["form_description"],
-            button_labels["form_category"],
-        ):
-            self.button_widget = DeleteButtonWidget(
-                id_num, form_name, str(number_of_pages), form_description, form_category
-            )
-            self.button_widget.setFixedHeight(220)
-            self.button_widget.setFixedWidth(750)
-            self.button_widget.setStyleSheet(
-                """
-                    background-color: #FFFFFF;
-                    border-radius: 15px
-                """
-            )
-            self.vbox_layout.addWidget(self.button_widget)
-
-            # Connect the buttonClicked signal to the handleButtonClicked slot
-            self.button_widget.delete_button_clicked.connect(self.handleButtonClicked)
+        self.delete_list_layout = QVBoxLayout()
+        self.fill_delete_list()
 
         scroll_area = SmoothScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -4341,7 +3897,7 @@ class AdminWindowWidget(QWidget):
         scroll_widget.setStyleSheet("background-color: transparent;")
 
         scroll_area_layout = QVBoxLayout(scroll_widget)
-        scroll_area_layout.addLayout(self.vbox_layout)
+        scroll_area_layout.addLayout(self.delete_list_layout)
         scroll_area_layout.setContentsMargins(0, 0, 0, 0)
 
         scroll_area.setWidget(
@@ -4380,16 +3936,18 @@ class AdminWindowWidget(QWidget):
 
         main_layout.addWidget(settings_label)
 
-        # Create a QGraphicsDropShadowEffect
-        shadow_effect1 = QGraphicsDropShadowEffect()
+        # Create a ShadowEffect
+        shadow_effect1 = ShadowEffect()
         shadow_effect1.setBlurRadius(50)
         shadow_effect1.setColor(Qt.gray)
         shadow_effect1.setOffset(0, 0)  # Adjust the shadow's offset as needed
+        shadow_effect1.setRadius(25)
 
-        shadow_effect2 = QGraphicsDropShadowEffect()
+        shadow_effect2 = ShadowEffect()
         shadow_effect2.setBlurRadius(50)
         shadow_effect2.setColor(Qt.gray)
         shadow_effect2.setOffset(0, 0)  # Adjust the shadow's offset as needed
+        shadow_effect2.setRadius(25)
 
         # Create a vertical layout to center the frames vertically
         center_layout = QVBoxLayout()
@@ -4693,9 +4251,94 @@ class AdminWindowWidget(QWidget):
         main.setLayout(main_layout)
         return main
 
+    def fill_edit_list(self):
+        button_labels = self.fetch_button_labels()
+
+        for (
+            id_num,
+            form_name,
+            number_of_pages,
+            form_description,
+            form_category,
+        ) in zip(
+            button_labels["id_num"],
+            button_labels["form_names"],
+            button_labels["num_of_pages"],
+            button_labels["form_description"],
+            button_labels["form_category"],
+        ):
+            self.button_widget = EditButtonWidget(
+                id_num, form_name, str(number_of_pages), form_description, form_category
+            )
+            self.button_widget.setFixedHeight(220)
+            self.button_widget.setFixedWidth(750)
+            self.button_widget.setStyleSheet(
+                """
+                    background-color: #FFFFFF;
+                    border-radius: 15px
+                """
+            )
+            self.edit_list_layout.addWidget(self.button_widget)
+
+            # Connect the buttonClicked signal to the handleButtonClicked slot
+            self.button_widget.buttonClicked.connect(self.edit_form)
+
+    def fill_delete_list(self):
+        button_labels = self.fetch_button_labels()
+
+        for (
+            id_num,
+            form_name,
+            number_of_pages,
+            form_description,
+            form_category,
+        ) in zip(
+            button_labels["id_num"],
+            button_labels["form_names"],
+            button_labels["num_of_pages"],
+            button_labels["form_description"],
+            button_labels["form_category"],
+        ):
+            self.button_widget = DeleteButtonWidget(
+                id_num, form_name, str(number_of_pages), form_description, form_category
+            )
+            self.button_widget.setFixedHeight(220)
+            self.button_widget.setFixedWidth(750)
+            self.button_widget.setStyleSheet(
+                """
+                    background-color: #FFFFFF;
+                    border-radius: 15px
+                """
+            )
+            self.delete_list_layout.addWidget(self.button_widget)
+
+            # Connect the buttonClicked signal to the handleButtonClicked slot
+            self.button_widget.delete_button_clicked.connect(self.handleButtonClicked)
+
+    def clear_list(self, layout):
+        while layout.count():
+            widget = layout.takeAt(0).widget()
+            if widget is not None:
+                widget.hide()
+                widget.deleteLater()
+
+    def refresh_edit_list(self):
+        self.clear_list(self.edit_list_layout)
+        self.fill_edit_list()
+
+    def refresh_delete_list(self):
+        self.clear_list(self.delete_list_layout)
+        self.fill_delete_list()
+
+    def refresh_dashboard(self):
+        for widget in self.dashboard_widgets:
+            widget.refresh()
+        self.history_model.refresh()
+
     def switch_ui(self, index, id_num, form_name):
         self.update_temp_values(id_num, form_name)
         self.right_widget.setCurrentIndex(index)
+        self.right_widget.ensure_page(index)
 
     def ui6(self):
         main_layout = QVBoxLayout()
@@ -4723,7 +4366,7 @@ class AdminWindowWidget(QWidget):
         self.edit_form_widget.description_input_clicked.connect(
             lambda: self.show_virtual_keyboard(self.edit_form_widget.description_input)
         )
-        self.edit_form_widget.edit_form_success.connect(self.re_init)
+        self.edit_form_widget.edit_form_success.connect(self.button3)
         main_layout.addWidget(self.edit_form_widget)
 
         main_layout.addStretch(5)
@@ -4731,6 +4374,175 @@ class AdminWindowWidget(QWidget):
         main.setLayout(main_layout)
         return main
 
+    def ui7(self):
+        main_layout = QVBoxLayout()
+
+        performance_label = QLabel("Performance")
+        performance_label.setStyleSheet(
+            """
+            font-family: Montserrat;
+            font-size: 28px;
+            font-weight: bold;
+            color: #19323C;
+            margin-top: 10px;
+            margin-left: 8px;
+            """
+        )
+        main_layout.addWidget(performance_label)
+
+        performance_layout = QHBoxLayout()
+
+        self.performance_info = QLabel()
+        self.performance_info.setStyleSheet(
+            """
+            font-family: Roboto;
+            font-size: 16px;
+            color: #19323C;
+            margin-left: 8px;
+            """
+        )
+        performance_layout.addWidget(self.performance_info, 1)
+
+        button_css = """
+            QPushButton {
+                background-color: #7C2F3E;
+                border-radius: 10px;
+                color: #FAEBD7;
+                padding: 8px 16px;
+                font-size: 14px;
+                font-weight: bold;
+                font-family: Montserrat;
+            }
+            QPushButton:pressed {
+                background-color: #B3B3B3;
+                color: #19323C;
+            }
+            """
+
+        self.tracing_button = QPushButton()
+        self.tracing_button.setFocusPolicy(Qt.NoFocus)
+        self.tracing_button.setFixedSize(160, 40)
+        self.tracing_button.setStyleSheet(button_css)
+        self.tracing_button.clicked.connect(self.toggle_tracing)
+        performance_layout.addWidget(self.tracing_button)
+
+        clear_button = QPushButton("Clear")
+        clear_button.setFocusPolicy(Qt.NoFocus)
+        clear_button.setFixedSize(120, 40)
+        clear_button.setStyleSheet(button_css)
+        clear_button.clicked.connect(self.clear_trace)
+        performance_layout.addWidget(clear_button)
+
+        save_button = QPushButton("Save Trace")
+        save_button.setFocusPolicy(Qt.NoFocus)
+        save_button.setFixedSize(140, 40)
+        save_button.setStyleSheet(button_css)
+        save_button.clicked.connect(self.save_trace)
+        performance_layout.addWidget(save_button)
+
+        main_layout.addLayout(performance_layout)
+
+        # One row per span name, with the most time spent first
+        self.span_table = QTableWidget(0, 6)
+        self.span_table.setHorizontalHeaderLabels(
+            ["Span", "Count", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Max (ms)"]
+        )
+        self.span_table.verticalHeader().hide()
+        self.span_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.span_table.setSelectionMode(QAbstractItemView.NoSelection)
+        self.span_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.span_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.span_table.setStyleSheet(
+            """
+            QTableView {
+                background-color: #f0f0f0;
+                color: #000000;
+                border: none;
+                font-size: 14px;
+            }
+            QHeaderView::section {
+                background-color: #7C2F3E;
+                color: #FAEBD7;
+                padding: 8px;
+                border: none;
+                font-weight: bold;
+                font-size: 16px;
+            }
+            """
+        )
+        main_layout.addWidget(self.span_table, 1)
+
+        # Updated every second while the page is shown
+        self.performance_timer = QTimer(self)
+        self.performance_timer.timeout.connect(self.refresh_performance)
+        self.performance_timer.start(1000)
+
+        main = QWidget()
+        main.setLayout(main_layout)
+        self.refresh_performance()
+        return main
+
+    def refresh_performance(self):
+        if not self.isVisible() or self.right_widget.currentIndex() != PERFORMANCE_TAB:
+            return
+
+        self.tracing_button.setText("Stop Tracing" if tracing.enabled else "Start Tracing")
+        rss = tracing.rss_mb()
+        rss_text = "unknown" if rss is None else f"{rss:.1f} MB"
+        assets = get_assets().stats()
+        self.performance_info.setText(
+            f"Memory (RSS): {rss_text}    Spans: {len(tracing.spans())} of "
+            f"{tracing.BUFFER_SIZE}    Tracing: {'on' if tracing.enabled else 'off'}\n"
+            f"Images: {assets['images']} cached, {assets['memory_mb']:.1f} MB, "
+            f"{assets['hit_rate']:.0%} hit rate ({assets['hits']} hits, "
+            f"{assets['misses']} misses)"
+        )
+
+        stats = tracing.span_stats()
+        self.span_table.setRowCount(len(stats))
+        for row, (name, count, p50, p95, p99, longest) in enumerate(stats):
+            values = [name, str(count)] + [f"{ms:.2f}" for ms in (p50, p95, p99, longest)]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.span_table.setItem(row, column, item)
+
+    def toggle_tracing(self):
+        if tracing.enabled:
+            tracing.disable()
+        else:
+            tracing.enable()
+        self.refresh_performance()
+
+    def clear_trace(self):
+        tracing.clear()
+        self.refresh_performance()
+
+    def save_trace(self):
+        # Chrome trace-event JSON, for chrome://tracing or Perfetto
+        path = tracing.dump_chrome_trace(
+            f"./traces/trace-{datetime.now():%Y%m%d-%H%M%S}.json"
+        )
+        self.refresh_performance()
+        self.performance_info.setText(f"{self.performance_info.text()}    Saved {path}")
+
+    def status_tapped(self, event):
+        now = time.monotonic()
+        self.status_taps = [
+            tap for tap in self.status_taps if now - tap < PERFORMANCE_TAP_WINDOW
+        ]
+        self.status_taps.append(now)
+        if len(self.status_taps) >= PERFORMANCE_TAPS:
+            self.status_taps = []
+            self.show_performance()
+
+    def show_performance(self):
+        self.active_button = None
+        self.right_widget.setCurrentIndex(PERFORMANCE_TAB)
+        self.update_button_styles()
+        self.refresh_performance()
+
     def update_button_styles(self):
         # Reset style for all buttons
         for button in self.sidebar_buttons:
@@ -4744,7 +4556,9 @@ class AdminWindowWidget(QWidget):
                 """
             )
 
-        # Set active button style
+        # Set active button style; no button is active on hidden pages
+        if self.active_button is None:
+            return
         self.active_button.setStyleSheet(
             """
             QPushButton {
@@ -4782,29 +4596,9 @@ class AdminWindowWidget(QWidget):
         new_price = self.price_value
 
         try:
-            connection = sqlite3.connect("./database/kiosk.db")
-            cursor = connection.cursor()
-
-            cursor.execute("BEGIN TRANSACTION")
-
-            cursor.execute(
-                """
-                UPDATE kiosk_settings
-                SET base_price = ?
-                WHERE ROWID = (
-                    SELECT ROWID
-                    FROM kiosk_settings
-                    ORDER BY ROWID
-                    LIMIT 1
-                )
-            """,
-                (new_price,),
-            )
-
-            cursor.execute("COMMIT")
-
-            cursor.execute("SELECT base_price FROM kiosk_settings LIMIT 1")
-            self.base_price = cursor.fetchone()[0]
+            settings = get_settings()
+            settings.update(base_price=new_price)
+            self.base_price = settings.base_price
 
             print(self.base_price)
             print("Price changed successfully.")
@@ -4813,17 +4607,11 @@ class AdminWindowWidget(QWidget):
             message_box = CustomMessageBox(
                 "Success", "Price changed successfully.", parent=self
             )
-            message_box.ok_button_clicked.connect(self.re_init)
             message_box.exec_()
 
         except sqlite3.Error as error:
-            connection.rollback()
             print("Error changing price:", error)
 
-        finally:
-            if connection:
-                connection.close()
-
     def refill_bondpaper(self):
         bondpaper_quantity = self.number_value
 
@@ -4837,75 +4625,42 @@ class AdminWindowWidget(QWidget):
             message_box.exec_()
         else:
             try:
-                with sqlite3.connect("./database/kiosk.db") as connection:
-                    connection.execute("BEGIN TRANSACTION")
-
-                    connection.execute(
-                        """
-                        UPDATE kiosk_settings
-                        SET bondpaper_quantity = bondpaper_quantity + ?
-                        WHERE ROWID = (
-                            SELECT ROWID
-                            FROM kiosk_settings
-                            ORDER BY ROWID
-                            LIMIT 1
-                        )
-                        """,
-                        (bondpaper_quantity,),
-                    )
-
-                    connection.execute("COMMIT")
-
-                    cursor = connection.execute(
-                        "SELECT bondpaper_quantity FROM kiosk_settings LIMIT 1"
-                    )
-                    self.bondpaper_quantity = cursor.fetchone()[0]
-
-                    print(self.bondpaper_quantity)
-                    print("Bondpaper refilled successfully.")
-
-                    # Emit signal to update label
-                    self.bondpaper_quantity_updated.emit(self.bondpaper_quantity)
-
-                    # Display dialog box indicating success
-                    message_box = CustomMessageBox(
-                        "Success", "Bondpaper refilled successfully.", parent=self
-                    )
-                    message_box.ok_button_clicked.connect(self.re_init)
-                    message_box.exec_()
-
-            except sqlite3.Error as error:
-                print("Error changing price:", error)
-
-    def refill_ink(self):
-        try:
-            with sqlite3.connect("./database/kiosk.db") as connection:
-                connection.execute("BEGIN TRANSACTION")
-
-                connection.execute(
-                    """
-                    UPDATE kiosk_settings
-                    SET ink_level = 1500
-                    WHERE ROWID = (
-                        SELECT ROWID
-                        FROM kiosk_settings
-                        ORDER BY ROWID
-                        LIMIT 1
-                    )
-                    """
+                settings = get_settings()
+                settings.update(
+                    bondpaper_quantity=settings.bondpaper_quantity + bondpaper_quantity
                 )
+                self.bondpaper_quantity = settings.bondpaper_quantity
 
-                connection.execute("COMMIT")
+                print(self.bondpaper_quantity)
+                print("Bondpaper refilled successfully.")
 
                 # Display dialog box indicating success
                 message_box = CustomMessageBox(
-                    "Success", "Ink refilled successfully.", parent=self
+                    "Success", "Bondpaper refilled successfully.", parent=self
                 )
-                message_box.ok_button_clicked.connect(self.re_init)
+                message_box.ok_button_clicked.connect(self.reset_bondpaper_value)
                 message_box.exec_()
 
+            except sqlite3.Error as error:
+                print("Error refilling bondpaper:", error)
+
+    def reset_bondpaper_value(self):
+        self.number_value = 10
+        self.number_label.setText(str(self.number_value))
+
+    def refill_ink(self):
+        try:
+            get_settings().update(ink_level=1500)
+            self.ink_level = get_settings().ink_level
+
+            # Display dialog box indicating success
+            message_box = CustomMessageBox(
+                "Success", "Ink refilled successfully.", parent=self
+            )
+            message_box.exec_()
+
         except sqlite3.Error as error:
-            print("Error changing price:", error)
+            print("Error refilling ink:", error)
 
     def change_password(self):
         password_message_box = ChangePasswordWindow(self)
@@ -4913,53 +4668,86 @@ class AdminWindowWidget(QWidget):
         password_message_box.move(parent_pos - password_message_box.rect().center())
         password_message_box.exec_()
 
-    # Slot to update the bondpaper label
-    def update_label_slot(self, new_quantity):
-        self.bondpaper_label.setText(str(new_quantity))
-
-    def populate_table(self):
-        try:
-            connection = sqlite3.connect("./database/kiosk.db")
-            cursor = connection.cursor()
-
-            cursor.execute("SELECT * FROM kiosk_print_results")
-            data = cursor.fetchall()
-
-            data.sort(reverse=True)
-
-            column_names = [
-                self.format_column_name(description[0])
-                for description in cursor.description
-            ]
-
-            self.tableWidget.setColumnCount(len(column_names))
-            self.tableWidget.setHorizontalHeaderLabels(column_names)
-
-            self.tableWidget.setRowCount(len(data))
-            for row_num, row_data in enumerate(data):
-                for row_num, row_data in enumerate(data):
-                    for col_num, col_data in enumerate(row_data):
-                        item = QTableWidgetItem(str(col_data))
-                        item.setTextAlignment(Qt.AlignCenter)
-                        self.tableWidget.setItem(row_num, col_num, item)
-
-            header = self.tableWidget.horizontalHeader()
-            header.setSectionResizeMode(QHeaderView.Stretch)
+    # Slot to keep the labels in step with the cached kiosk settings
+    def update_settings_slot(self, field, value):
+        if field == "bondpaper_quantity":
+            self.bondpaper_quantity = value
+            self.bondpaper_label.setText(str(value))
+        elif field == "coins_left":
+            self.coins_left = value
+            self.coins_label.setText(f"{value:0.2f}")
+        elif field == "ink_level":
+            self.ink_level = value
+        elif field == "base_price":
+            self.base_price = value
+
+    @pyqtSlot(str, int, int)
+    def update_ingest_progress(self, form_title, page, pages):
+        self.ingest_label.setText(f"Generating previews for {form_title}: page {page} of {pages}")
+        self.ingest_label.show()
+
+    @pyqtSlot(str, bool)
+    def ingest_finished(self, form_title, ok):
+        if not ok:
+            self.ingest_label.setText(f"Could not save {form_title}: its file could not be converted")
+            self.ingest_label.show()
+        elif get_ingest_queue().pending == 0:
+            self.ingest_label.hide()
+
+    def filter_history(self):
+        period = self.history_filter.currentData()
+        if period is None:
+            self.history_model.set_date_range(None, None)
+        else:
+            self.history_model.set_date_range(*period_bounds(period))
+        self.tableWidget.scrollToTop()
 
-        except sqlite3.Error as error:
-            print("Error populating table:", error)
+    def export_history(self):
+        dialog = QFileDialog(self, "Export Print History", "/media/amarjeet/")
+        dialog.setOptions(QFileDialog.DontUseNativeDialog)
+        dialog.setAcceptMode(QFileDialog.AcceptSave)
+        dialog.setNameFilters(["CSV (*.csv)", "Parquet (*.parquet)"])
+        dialog.selectFile("print-history.csv")
+        dialog.resize(800, 600)
+
+        if dialog.exec_() != QFileDialog.Accepted:
+            return
+
+        file_path = dialog.selectedFiles()[0]
+        extension = ".parquet" if "parquet" in dialog.selectedNameFilter() else ".csv"
+        if not file_path.lower().endswith(extension):
+            file_path = os.path.splitext(file_path)[0] + extension
+
+        # Export the days shown by the history filter
+        since = until = None
+        period = self.history_filter.currentData()
+        if period is not None:
+            since, until = (
+                datetime.fromtimestamp(bound).strftime("%Y-%m-%d")
+                for bound in period_bounds(period)
+            )
 
-        finally:
-            if connection:
-                connection.close()
+        self.export_button.setEnabled(False)
+        self.export_thread = ExportThread("print_history", file_path, since, until, self)
+        self.export_thread.export_finished.connect(self.export_finished)
+        self.export_thread.export_failed.connect(self.export_failed)
+        self.export_thread.start()
+
+    def export_finished(self, file_path, rows):
+        self.export_button.setEnabled(True)
+        message_box = CustomMessageBox(
+            "Success",
+            f"Exported {rows} print jobs to {os.path.basename(file_path)}.",
+            parent=self,
+        )
+        message_box.exec_()
 
-    def format_column_name(self, column_name):
-        # Split the column name by underscores
-        words = column_name.split("_")
-        # Capitalize the first letter of each word
-        words = [word.capitalize() for word in words]
-        # Join the words with spaces
-        return " ".join(words)
+    def export_failed(self, message):
+        self.export_button.setEnabled(True)
+        message_box = CustomMessageBox(
+            "Error", f"Could not export the print history. {message}", parent=self
+        )
+        message_box.exec_()
 
     def clear_selection(self):
         # Toggle the selection state
@@ -4970,16 +4758,13 @@ class AdminWindowWidget(QWidget):
             self.tableWidget.clearSelection()
 
     def fetch_button_labels(self):
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
+        cursor = database.cursor()
 
         cursor.execute(
             "SELECT id, form_name, number_of_pages, form_description, form_category FROM kiosk_forms"
         )
         rows = cursor.fetchall()
 
-        conn.close()
-
         id_num = []
         form_names = []
         num_of_pages = []
@@ -5013,25 +4798,18 @@ class AdminWindowWidget(QWidget):
         self.delete_message_box.exec_()
 
     def delete_form(self, index, form_name):
-        button_widget = self.sender()
-        # Remove the button widget from the layout
-        self.vbox_layout.removeWidget(button_widget)
-        button_widget.deleteLater()
-
         try:
-            conn = sqlite3.connect("./database/kiosk.db")
-            cursor = conn.cursor()
-
-            cursor.execute("DELETE FROM kiosk_forms WHERE id = ?", (index,))
-
-            conn.commit()  # Commit changes to the database
-            conn.close()
+            # Commit changes to the database
+            with database.connect() as conn:
+                conn.execute("DELETE FROM kiosk_forms WHERE id = ?", (index,))
+                form_search.remove_form(conn, index)
 
             delete_form_file(form_name)
             delete_process_file(form_name)
+            process_images.discard_process(form_name)
             delete_form_preview(form_name)
 
-            self.re_init()
+            get_data_changes().notify(FORMS)
 
             message_box = CustomMessageBox(
                 "Success",
@@ -5094,65 +4872,8 @@ class AdminWindowWidget(QWidget):
         self.id_num = index
         self.form_name = form_name
         print(self.form_name)
-        # Update UI to reflect new values
-        self.tab1 = self.ui1()
-        self.tab2 = self.ui2()
-        self.tab3 = self.ui3()
-        self.tab4 = self.ui4()
-        self.tab5 = self.ui5()
-        self.tab6 = self.ui6()
-        self.right_widget.clear()
-        self.right_widget.addTab(self.tab1, "")
-        self.right_widget.addTab(self.tab2, "")
-        self.right_widget.addTab(self.tab3, "")
-        self.right_widget.addTab(self.tab4, "")
-        self.right_widget.addTab(self.tab5, "")
-        self.right_widget.addTab(self.tab6, "")
-
-    def re_init(self):
-        # Update UI to reflect new values
-        self.tab1 = self.ui1()
-        self.tab2 = self.ui2()
-        self.tab3 = self.ui3()
-        self.tab4 = self.ui4()
-        self.tab5 = self.ui5()
-        self.tab6 = self.ui6()
-        self.right_widget.clear()
-        self.right_widget.addTab(self.tab1, "")
-        self.right_widget.addTab(self.tab2, "")
-        self.right_widget.addTab(self.tab3, "")
-        self.right_widget.addTab(self.tab4, "")
-        self.right_widget.addTab(self.tab5, "")
-        self.right_widget.addTab(self.tab6, "")
-
-        self.active_button = self.btn_1
-        self.update_button_styles()
-
-    def is_printer_available(self):
-        try:
-            conn = cups.Connection()
-            printers = conn.getPrinters()
-
-            if not printers:
-                self.printer_state = False
-                raise Exception("No printers available.")
-
-            idle_printer_found = False
-            for printer_name, printer_attributes in printers.items():
-                if (
-                    "printer-state" in printer_attributes
-                    and printer_attributes["printer-state"] == 3
-                ):
-                    idle_printer_found = True
-                    self.printer_state = True
-                    break
-
-            if not idle_printer_found:
-                self.printer_state = False
-                raise Exception("No idle printer available")
-
-        except Exception as e:
-            print("Error during printing:", e)
+        # The edit form tab is built again for the selected form
+        self.right_widget.invalidate_page(5)
 
     def update_print_status(self, status):
         if status:
@@ -0,0 +1,237 @@
+"""Static images shared across screens, decoded and scaled once per size."""
+
+import os
+from PyQt5.QtCore import QCoreApplication, QObject, QSize, Qt, QThread, pyqtSignal
+from PyQt5.QtGui import QIcon, QImage, QImageReader, QPixmap
+import tracing
+
+
+BACKGROUND_PATH = "./img/background.jpg"
+STATIC_DIR = "./img/static"
+
+# Size the SVG icons of the print preview buttons are shown at
+BUTTON_ICON_SIZE = QSize(50, 50)
+
+
+def asset_key(path, size=None, mode=Qt.KeepAspectRatio):
+    """
+    Returns the cache key of path scaled to fit size, or at its own size if
+    size is None.
+    """
+    if size is None:
+        return (os.path.normpath(path), -1, -1, Qt.KeepAspectRatio)
+    return (os.path.normpath(path), size.width(), size.height(), mode)
+
+
+def static_key(name, width=None, height=None, mode=Qt.KeepAspectRatio):
+    size = None if width is None else QSize(width, height)
+    return asset_key(os.path.join(STATIC_DIR, name), size, mode)
+
+
+# Images decoded in the background after the first frame, at the sizes the
+# screens show them; one that is out of step with its screen is decoded on
+# first use instead. MainWindow adds the background at the screen's size.
+PRELOAD = (
+    # Home screen
+    static_key("start_img.png", 45, 45),
+    static_key("about_img.png", 35, 35),
+    static_key("admin_img.png", 35, 35),
+    # Form list and print preview
+    static_key("next_arrow_img.png", 15, 35),
+    static_key("paper_img.png"),
+    static_key("close_img.png", 45, 45),
+    static_key("close_img_pressed.png", 45, 45),
+    static_key("back_img.png", 30, 30),
+    static_key("back_img_pressed.png", 30, 30),
+    static_key("help_img.png", 65, 65),
+    static_key("help_img_pressed.png", 65, 65),
+    static_key("bondpaper_quantity.png"),
+    static_key("coins_img.png"),
+    static_key("printer_img.png"),
+    static_key("ink_img.png"),
+    asset_key("./img/view_process_icon.svg", BUTTON_ICON_SIZE),
+    asset_key("./img/print_forms_icon.svg", BUTTON_ICON_SIZE),
+    asset_key("./img/print_forms_icon_disabled.svg", BUTTON_ICON_SIZE),
+    # View Process
+    static_key("error.png", 45, 45),
+    static_key("error_pressed.png", 45, 45),
+    static_key("error.png", 35, 35),
+    static_key("error_pressed.png", 35, 35),
+    static_key("zoom_in.png"),
+    static_key("zoom_out.png"),
+    # Printing
+    static_key("print_success.png", 256, 256),
+    static_key("print_failed.png", 256, 256),
+    static_key("warning.png", 256, 256),
+    # Admin window
+    static_key("dashboard.png", 35, 35),
+    static_key("add_form.png", 35, 35),
+    static_key("edit_form.png", 35, 35),
+    static_key("delete_form.png", 35, 35),
+    static_key("settings.png", 35, 35),
+    static_key("system.png", 50, 50),
+    static_key("system_pressed.png", 50, 50),
+)
+
+
+def decode(key):
+    """
+    Reads and scales the image of key. Safe to call from any thread.
+    """
+    path, width, height, mode = key
+    reader = QImageReader(path)
+    if width >= 0 and path.endswith(".svg"):
+        # Rendered straight at the target size
+        reader.setScaledSize(reader.size().scaled(QSize(width, height), mode))
+        image = reader.read()
+    else:
+        image = reader.read()
+        if width >= 0 and not image.isNull():
+            size = image.size().scaled(QSize(width, height), mode)
+            image = image.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+    if image.isNull():
+        return image
+    # The format QPixmap.fromImage() converts to, so that it only copies
+    if image.hasAlphaChannel():
+        return image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    return image.convertToFormat(QImage.Format_RGB32)
+
+
+class AssetLoader(QThread):
+    """
+    Decodes images in the background and hands them to the GUI thread.
+    """
+
+    decoded = pyqtSignal(object, QImage)
+
+    def __init__(self, keys, parent=None):
+        super().__init__(parent)
+        self.keys = keys
+
+    def run(self):
+        for key in self.keys:
+            with tracing.span("image.asset_preload"):
+                image = decode(key)
+            if image.isNull():
+                print(f"Asset not found: {key[0]}")
+                continue
+            self.decoded.emit(key, image)
+
+
+class AssetManager(QObject):
+    """
+    Cache of decoded, scaled static images shared by every screen.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pixmaps = {}
+        self.loader = None
+        self.hits = 0
+        self.misses = 0
+        self.preloaded = 0
+
+    def pixmap(self, path, size=None, mode=Qt.KeepAspectRatio):
+        """
+        Returns path scaled to fit size (or at its own size) as a shared
+        QPixmap, which callers must not paint on. Returns a null pixmap if
+        the file cannot be read. Must only be called on the GUI thread.
+        """
+        key = asset_key(path, size, mode)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            return pixmap
+
+        self.misses += 1
+        with tracing.span("image.asset"):
+            image = decode(key)
+        pixmap = QPixmap.fromImage(image)
+        if not pixmap.isNull():
+            self.pixmaps[key] = pixmap
+        return pixmap
+
+    def static_pixmap(self, name, width=None, height=None, mode=Qt.KeepAspectRatio):
+        """
+        Returns the icon name of ./img/static scaled to fit width x height.
+        """
+        size = None if width is None else QSize(width, height)
+        return self.pixmap(os.path.join(STATIC_DIR, name), size, mode)
+
+    def preload(self, keys=PRELOAD):
+        """
+        Decodes the images of keys in the background, skipping those
+        already cached. Returns the loader thread.
+        """
+        keys = [key for key in dict.fromkeys(keys) if key not in self.pixmaps]
+        self.loader = AssetLoader(keys, self)
+        self.loader.decoded.connect(self.add_decoded)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.loader.wait)
+        self.loader.start()
+        return self.loader
+
+    def add_decoded(self, key, image):
+        if key not in self.pixmaps:
+            self.pixmaps[key] = QPixmap.fromImage(image)
+            self.preloaded += 1
+
+    def hit_rate(self):
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def memory_bytes(self):
+        """
+        Returns the bytes held by the cached pixmaps.
+        """
+        return sum(
+            pixmap.width() * pixmap.height() * pixmap.depth() // 8
+            for pixmap in self.pixmaps.values()
+        )
+
+    def stats(self):
+        return {
+            "images": len(self.pixmaps),
+            "preloaded": self.preloaded,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+            "memory_mb": self.memory_bytes() / (1024 * 1024),
+        }
+
+    def clear(self):
+        self.pixmaps.clear()
+        self.hits = 0
+        self.misses = 0
+        self.preloaded = 0
+
+
+_assets = None
+
+
+def get_assets():
+    """
+    Returns the shared AssetManager.
+    """
+    global _assets
+    if _assets is None:
+        _assets = AssetManager()
+    return _assets
+
+
+def set_button_images(button, name, pressed_name, size):
+    """
+    Shows the icon name of ./img/static on the button, scaled to size, and
+    pressed_name while the button is held down, in place of a stylesheet
+    image: url().
+    """
+    assets = get_assets()
+    width, height = size.width(), size.height()
+    icon = QIcon(assets.static_pixmap(name, width, height))
+    pressed_icon = QIcon(assets.static_pixmap(pressed_name, width, height))
+    button.setIcon(icon)
+    button.setIconSize(size)
+    button.pressed.connect(lambda: button.setIcon(pressed_icon))
+    button.released.connect(lambda: button.setIcon(icon))
@@ -0,0 +1,10 @@
+"""
+Benchmarks for the kiosk. Run them from the repository root, e.g.
+
+    python -m benchmarks.bench_coin_acceptor
+
+benchmarks.suite times the paths students hit in one run and writes the
+results as JSON, to compare between commits:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.suite --compare before.json
+"""
@@ -0,0 +1,113 @@
+"""
+Times the static images a screen loads as it is built: the background
+scaled to the screen, a print preview button's SVG icon rendered at 200 px
+and scaled down to 50 px, and an icon button styled with image: url(), each
+done as the screens used to against the shared asset cache. Then preloads
+PRELOAD in the background and reports the cache's size and hit rate:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_assets
+"""
+
+import time
+import argparse
+import statistics
+from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache
+from PyQt5.QtWidgets import QApplication, QPushButton
+from assets import BACKGROUND_PATH, BUTTON_ICON_SIZE, PRELOAD
+import assets
+
+
+SCREEN_SIZE = QSize(1920, 1080)
+
+
+def old_background():
+    pixmap = QPixmap(BACKGROUND_PATH)
+    return pixmap.scaled(SCREEN_SIZE, Qt.IgnoreAspectRatio)
+
+
+def old_svg_icon():
+    pixmap = QIcon("./img/print_forms_icon.svg").pixmap(QSize(200, 200))
+    return pixmap.scaled(BUTTON_ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def old_icon_button():
+    button = QPushButton()
+    button.setFixedSize(50, 50)
+    button.setStyleSheet(
+        "QPushButton {background-color: transparent; border: none; image: url('img/static/error.png'); margin-right: 5px;}"
+        "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/error_pressed.png');}"
+    )
+    return button.grab()
+
+
+def new_background(manager):
+    return manager.pixmap(BACKGROUND_PATH, SCREEN_SIZE, Qt.IgnoreAspectRatio)
+
+
+def new_svg_icon(manager):
+    return manager.pixmap("./img/print_forms_icon.svg", BUTTON_ICON_SIZE)
+
+
+def new_icon_button(manager):
+    button = QPushButton()
+    button.setFixedSize(50, 50)
+    button.setStyleSheet(
+        "QPushButton {background-color: transparent; border: none; margin-right: 5px;}"
+    )
+    assets.set_button_images(button, "error.png", "error_pressed.png", QSize(45, 45))
+    return button.grab()
+
+
+def median_ms(function, runs, *args):
+    times = []
+    for _ in range(runs):
+        # QPixmap(path) is also cached by Qt, which a kiosk that has been up
+        # a while has long evicted
+        QPixmapCache.clear()
+        start = time.perf_counter()
+        function(*args)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication([])
+    # set_button_images() uses the shared manager
+    manager = assets.get_assets()
+
+    cases = (
+        ("background", old_background, new_background),
+        ("svg icon", old_svg_icon, new_svg_icon),
+        ("icon button", old_icon_button, new_icon_button),
+    )
+    print(f"{'':>12} {'before':>9} {'first':>9} {'cached':>9}")
+    for name, old, new in cases:
+        before = median_ms(old, args.runs)
+        first = median_ms(new, 1, manager)
+        cached = median_ms(new, args.runs, manager)
+        print(f"{name:>12} {before:>7.2f}ms {first:>7.2f}ms {cached:>7.2f}ms")
+
+    manager.clear()
+    start = time.perf_counter()
+    manager.preload(PRELOAD).wait()
+    app.processEvents()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\npreloaded {len(PRELOAD)} images in {elapsed:.1f} ms")
+
+    for key in PRELOAD:
+        path, width, height, mode = key
+        manager.pixmap(path, None if width < 0 else QSize(width, height), mode)
+    stats = manager.stats()
+    print(
+        f"{stats['images']} images, {stats['memory_mb']:.2f} MB, "
+        f"{stats['hit_rate']:.0%} hit rate after preloading"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measures the CPU used by the coin acceptor while idle and the latency from the
+last pulse of a coin to the counter update reaching the UI thread.
+
+Runs on any Linux box through the simulated pin backend:
+
+    python -m benchmarks.bench_coin_acceptor --coins 20
+"""
+
+import sys
+import time
+import argparse
+import threading
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+from coin_acceptor import CoinAcceptor, SimulatedPulseBackend, TRAIN_GAP
+
+
+def cpu_percent(seconds, start_fn=None, stop_fn=None):
+    """
+    Returns the process CPU usage (in percent of one core) over a time window.
+    """
+    if start_fn:
+        start_fn()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    if stop_fn:
+        stop_fn()
+    return 100.0 * cpu / wall
+
+
+def busy_wait_baseline(seconds):
+    """
+    CPU usage of the old polling loop, for comparison.
+    """
+    stop_event = threading.Event()
+    pin = {"pressed": False}
+
+    def poll():
+        while not stop_event.is_set():
+            if pin["pressed"]:
+                pass
+
+    thread = threading.Thread(target=poll, daemon=True)
+    return cpu_percent(seconds, thread.start, stop_event.set)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--idle", type=float, default=2.0, help="idle window (s)")
+    parser.add_argument("--coins", type=int, default=10, help="coins to insert")
+    parser.add_argument("--pulses", type=int, default=5, help="pulses per coin")
+    parser.add_argument(
+        "--baseline", action="store_true", help="also measure the old busy-wait"
+    )
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+
+    backend = SimulatedPulseBackend()
+    acceptor = CoinAcceptor(0, backend=backend)
+    latencies = []
+    counters = []
+    acceptor.coin_accepted.connect(
+        lambda value, timestamp: latencies.append(time.perf_counter() - timestamp)
+    )
+    acceptor.counter_changed.connect(counters.append)
+    acceptor.start()
+
+    idle_cpu = cpu_percent(args.idle)
+    print(f"idle CPU:          {idle_cpu:6.2f}% of one core")
+
+    if args.baseline:
+        print(f"busy-wait CPU:     {busy_wait_baseline(args.idle):6.2f}% of one core")
+
+    for _ in range(args.coins):
+        backend.insert_coin(args.pulses, wait=True)
+        loop = QEventLoop()
+        QTimer.singleShot(int(TRAIN_GAP * 1000) + 50, loop.quit)
+        loop.exec_()
+
+    acceptor.stop()
+    acceptor.wait()
+    app.processEvents()
+
+    expected = args.coins * args.pulses
+    print(f"coins accepted:    {len(counters)} / {args.coins}")
+    print(f"final counter:     {counters[-1] if counters else 0} (expected {expected})")
+    if latencies:
+        latencies.sort()
+        mean = sum(latencies) / len(latencies)
+        print(f"pulse-to-UI mean:  {mean * 1000:6.2f} ms")
+        print(f"pulse-to-UI max:   {latencies[-1] * 1000:6.2f} ms")
+        print(f"  (includes the {TRAIN_GAP * 1000:.0f} ms end-of-train gap)")
+
+
+if __name__ == "__main__":
+    main()
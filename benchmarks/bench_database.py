@@ -0,0 +1,62 @@
+"""
+Compares opening a connection per query, as the screens used to, with the
+long-lived per-thread connection from the database module, then prints the
+per-call-site query stats. Runs against a temporary copy of
+./database/kiosk.db:
+
+    python -m benchmarks.bench_database --queries 1000
+"""
+
+import os
+import time
+import shutil
+import sqlite3
+import argparse
+import tempfile
+import database
+
+QUERY = "SELECT bondpaper_quantity FROM kiosk_settings LIMIT 1"
+
+
+def connect_per_query(db_path, queries):
+    for _ in range(queries):
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        cursor.execute(QUERY)
+        cursor.fetchone()
+        conn.close()
+
+
+def long_lived_connection(db_path, queries):
+    for _ in range(queries):
+        cursor = database.cursor(db_path)
+        cursor.execute(QUERY)
+        cursor.fetchone()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "kiosk.db")
+        shutil.copy("./database/kiosk.db", db_path)
+
+        for name, run in (
+            ("connect per query", connect_per_query),
+            ("long-lived", long_lived_connection),
+        ):
+            start = time.perf_counter()
+            run(db_path, args.queries)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>18}: {elapsed / args.queries * 1e6:8.1f} us/query")
+
+        database.close(db_path)
+
+    print("\nper call site:")
+    database.print_query_stats()
+
+
+if __name__ == "__main__":
+    main()
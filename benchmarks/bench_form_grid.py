@@ -0,0 +1,194 @@
+"""
+Times the form list for growing numbers of forms: a widget per form with its
+own stylesheet and QGraphicsDropShadowEffect in a scrolled grid layout, as
+ViewFormWidget used to build it, against FormGridView painting the cards
+through FormCardDelegate, with and without its card cache. Reports the time
+to open the list and per frame of a drag scroll. Runs on a temporary copy of
+./database/kiosk.db:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_form_grid
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import database
+import migrations
+from PyQt5.QtGui import QColor, QPixmap
+from PyQt5.QtWidgets import (
+    QApplication,
+    QFrame,
+    QGraphicsDropShadowEffect,
+    QGridLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QScrollArea,
+    QVBoxLayout,
+    QWidget,
+)
+from form_catalog import FormCatalog, FormListModel, CategoryFilterProxy
+from view_form import FormCardDelegate, FormGridView
+from benchmarks.bench_form_search import fill_forms
+
+
+VIEW_SIZE = (1800, 900)
+
+
+def old_card(form):
+    """
+    A form card as ButtonWidget built it.
+    """
+    widget = QWidget()
+    frame = QFrame(widget)
+    shadow = QGraphicsDropShadowEffect()
+    shadow.setBlurRadius(30)
+    shadow.setColor(QColor(0, 0, 0, 150))
+    shadow.setOffset(0, 0)
+    frame.setGraphicsEffect(shadow)
+
+    layout = QVBoxLayout(frame)
+    title = QLabel(form.name)
+    title.setWordWrap(True)
+    title.setStyleSheet(
+        "font-family: Montserrat; font-size: 19px; font-weight: bold; "
+        "padding-top: 15px; padding-left: 15px; padding-right: 15px; color: #7C2F3E;"
+    )
+    pages = QHBoxLayout()
+    paper = QLabel()
+    paper.setPixmap(QPixmap("./img/static/paper_img.png"))
+    pages.addWidget(paper)
+    pages.addWidget(QLabel(str(form.pages)))
+    description = QLabel(form.description)
+    description.setWordWrap(True)
+    description.setStyleSheet("font-family: Open Sans; font-size: 13px;")
+    button = QPushButton("View")
+    button.setStyleSheet(
+        "QPushButton { background-color: #7C2F3E; color: #FAEBD7; font-family: Montserrat; "
+        "font-size: 16px; font-weight: bold; border-radius: 10px; min-height: 70px; }"
+    )
+    layout.addWidget(title)
+    layout.addLayout(pages)
+    layout.addWidget(description)
+    layout.addStretch()
+    layout.addWidget(button)
+
+    QVBoxLayout(widget).addWidget(frame)
+    widget.setFixedSize(330, 450)
+    widget.setStyleSheet("background-color: #FFFFFF; border-radius: 15px")
+    return widget
+
+
+def old_list(catalog):
+    grid = QGridLayout()
+    grid.setSpacing(20)
+    for number, form in enumerate(catalog.forms):
+        grid.addWidget(old_card(form), number // 4, number % 4)
+    content = QWidget()
+    QVBoxLayout(content).addLayout(grid)
+    area = QScrollArea()
+    area.setWidgetResizable(True)
+    area.setWidget(content)
+    area.resize(*VIEW_SIZE)
+    area.show()
+    QApplication.processEvents()
+    return area
+
+
+def new_list(catalog, cache_size=None):
+    model = FormListModel(catalog)
+    proxy = CategoryFilterProxy(catalog)
+    proxy.setSourceModel(model)
+    grid = FormGridView()
+    model.setParent(grid)
+    proxy.setParent(grid)
+    if cache_size is not None:
+        grid.delegate = FormCardDelegate(grid, cache_size)
+        grid.setItemDelegate(grid.delegate)
+    grid.setModel(proxy)
+    grid.resize(*VIEW_SIZE)
+    grid.show()
+    QApplication.processEvents()
+    return grid
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def scroll_frames(view, frames, step=15):
+    """
+    Scrolls down by `step` pixels a frame, as a slow drag does, then back
+    up, and returns the milliseconds of each frame.
+    """
+    scrollbar = view.verticalScrollBar()
+    times = []
+    for direction in (1, -1):
+        for _ in range(frames):
+            start = time.perf_counter()
+            scrollbar.setValue(scrollbar.value() + direction * step)
+            view.viewport().repaint()
+            times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def percentiles(times):
+    times = sorted(times)
+    return statistics.median(times), times[int(len(times) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--forms", type=int, nargs="+", default=[16, 100, 500, 2_000])
+    parser.add_argument(
+        "--old-limit", type=int, default=500, help="most forms opened the old way"
+    )
+    parser.add_argument("--frames", type=int, default=120, help="frames scrolled each way")
+    args = parser.parse_args()
+
+    app = QApplication([])
+
+    print(
+        f"{'forms':>6} | {'widgets open':>12} {'p50':>6} {'p95':>6} "
+        f"| {'grid open':>9} {'uncached p50':>12} {'p95':>6} {'cached p50':>10} {'p95':>6}   (ms)"
+    )
+    for count in args.forms:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "kiosk.db")
+            shutil.copy(database.DB_PATH, db_path)
+            fill_forms(db_path, count)
+            migrations.migrate(db_path)
+            catalog = FormCatalog(db_path)
+
+            old = "-".rjust(12) + " " + "-".rjust(6) + " " + "-".rjust(6)
+            if count <= args.old_limit:
+                area, open_ms = timed(old_list, catalog)
+                p50, p95 = percentiles(scroll_frames(area, args.frames))
+                old = f"{open_ms:>12.1f} {p50:>6.2f} {p95:>6.2f}"
+                area.deleteLater()
+
+            grid, _ = timed(new_list, catalog, 0)
+            uncached = percentiles(scroll_frames(grid, args.frames))
+            grid.deleteLater()
+
+            grid, open_ms = timed(new_list, catalog)
+            cached = percentiles(scroll_frames(grid, args.frames))
+            grid.deleteLater()
+
+            print(
+                f"{count:>6} | {old} | {open_ms:>9.1f} {uncached[0]:>12.2f} "
+                f"{uncached[1]:>6.2f} {cached[0]:>10.2f} {cached[1]:>6.2f}"
+            )
+            QApplication.processEvents()
+            database.close(db_path)
+
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Times search-as-you-type over the form list for growing numbers of forms: a
+LIKE scan of kiosk_forms on every keystroke, against form_search's trigram
+index filtering the form grid through CategoryFilterProxy. Each keystroke is
+timed through to the grid being repainted, and compared with one 60 Hz frame.
+Runs on a temporary copy of ./database/kiosk.db:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_form_search
+"""
+
+import os
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import statistics
+import database
+import migrations
+import form_search
+from PyQt5.QtWidgets import QApplication
+from form_catalog import FormCatalog, FormListModel, CategoryFilterProxy
+from view_form import FormGridView
+
+
+FRAME_MS = 1000 / 60
+
+QUERIES = ("clearance", "petition subject", "grad form", "request for re")
+
+WORDS = (
+    "application request form student subject petition clearance graduation "
+    "research enrollment accreditation oral defense completion removal grade "
+    "certificate transcript records office registrar dean adviser thesis "
+    "library laboratory scholarship tuition refund leave absence shift course "
+    "program major minor load overload underload cross enrollment transfer "
+    "credentials honorable dismissal diploma authentication verification "
+    "internship practicum clinic deferment withdrawal readmission medical "
+    "certification evaluation equivalency validation exam schedule conflict "
+    "section change adding dropping incomplete faculty department college "
+    "campus identification card replacement locker uniform exemption permit"
+).split()
+
+
+def fill_forms(db_path, count):
+    """
+    Adds forms with random titles and descriptions until there are `count`.
+    """
+    random.seed(count)
+    conn = database.connect(db_path)
+    existing = conn.execute("SELECT COUNT(*) FROM kiosk_forms").fetchone()[0]
+    categories = [row[0] for row in conn.execute("SELECT DISTINCT form_category FROM kiosk_forms")]
+
+    def forms():
+        for number in range(count - existing):
+            yield (
+                " ".join(random.sample(WORDS, 4)).title() + f" {number}",
+                random.randint(1, 4),
+                " ".join(random.choices(WORDS, k=12)).capitalize() + ".",
+                random.choice(categories),
+            )
+
+    with conn:
+        conn.executemany(
+            "INSERT INTO kiosk_forms (form_name, number_of_pages, form_description, form_category) VALUES (?,?,?,?)",
+            forms(),
+        )
+
+
+def like_search(text, catalog, db_path):
+    # Every word as a LIKE pattern on both columns, as a plain query would
+    words = text.split()
+    if not words:
+        return None
+    condition = " AND ".join(["(form_name LIKE ? OR form_description LIKE ?)"] * len(words))
+    parameters = [f"%{word}%" for word in words for _ in range(2)]
+    cursor = database.cursor(db_path)
+    cursor.execute(f"SELECT id FROM kiosk_forms WHERE {condition}", parameters)
+    ids = {row[0] for row in cursor.fetchall()}
+    cursor.close()
+    return ids
+
+
+def type_queries(search, catalog, proxy, grid, db_path):
+    """
+    Types every query a character at a time and returns the milliseconds
+    of each keystroke, from searching to the grid being painted.
+    """
+    times = []
+    for query in QUERIES:
+        for length in range(1, len(query) + 1):
+            start = time.perf_counter()
+            proxy.set_search_ids(search(query[:length], catalog, db_path))
+            grid.viewport().repaint()
+            times.append((time.perf_counter() - start) * 1000)
+        proxy.set_search_ids(None)
+        QApplication.processEvents()
+    return times
+
+
+def summary(times):
+    times = sorted(times)
+    p95 = times[int(len(times) * 0.95) - 1]
+    over = sum(1 for ms in times if ms > FRAME_MS)
+    return f"{statistics.median(times):>7.2f} {p95:>7.2f} {times[-1]:>7.2f} {over:>5}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--forms", type=int, nargs="+", default=[100, 1_000, 5_000, 20_000])
+    args = parser.parse_args()
+
+    app = QApplication([])
+
+    keystrokes = sum(len(query) for query in QUERIES)
+    print(f"{keystrokes} keystrokes per run; over = keystrokes slower than a frame")
+    print(
+        f"{'forms':>7} | {'LIKE scan p50':>13} {'p95':>7} {'max':>7} {'over':>5} "
+        f"| {'trigram p50':>11} {'p95':>7} {'max':>7} {'over':>5}   (ms)"
+    )
+    for count in args.forms:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "kiosk.db")
+            shutil.copy(database.DB_PATH, db_path)
+            fill_forms(db_path, count)
+            migrations.migrate(db_path)
+
+            catalog = FormCatalog(db_path)
+            model = FormListModel(catalog)
+            proxy = CategoryFilterProxy(catalog)
+            proxy.setSourceModel(model)
+            grid = FormGridView()
+            grid.setModel(proxy)
+            grid.resize(1920, 800)
+            grid.show()
+            QApplication.processEvents()
+
+            like_times = type_queries(like_search, catalog, proxy, grid, db_path)
+            index_times = type_queries(form_search.search, catalog, proxy, grid, db_path)
+
+            print(f"{count:>7} | {summary(like_times):>35} | {summary(index_times):>33}")
+            grid.deleteLater()
+            QApplication.processEvents()
+            database.close(db_path)
+
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Import-time profile of the kiosk's startup: imports main in fresh
+interpreters with -X importtime, as the kiosk does before the slideshow
+plays, and reports the median cumulative time and the slowest modules.
+
+The exit status is 1 if the median is over the budget, or if main imports
+one of the screen modules (or what they pull in, e.g. pdf2image) before the
+first frame instead of leaving them to the background warm-up:
+
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --budget 150
+"""
+
+import sys
+import argparse
+import statistics
+import subprocess
+from main import SCREEN_MODULES
+
+
+# Milliseconds that importing main may take, measured on a desktop; set
+# with room for noise, well under the 190 ms main took with every screen
+# imported up front
+IMPORT_BUDGET = 100
+
+# Modules that must not be imported before the first frame
+DEFERRED_MODULES = SCREEN_MODULES + (
+    "helpers",
+    "print_window",
+    "pdf2image",
+    "PIL",
+)
+
+# Run in the child: cups comes from the fake server so that the profile does
+# not depend on pycups being installed
+IMPORT_MAIN = "import fake_cups; fake_cups.install_module(); import main"
+
+
+def profile():
+    """
+    Imports main in a new interpreter and returns its cumulative import time
+    in milliseconds and (self ms, module) for every module it imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_MAIN],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = []
+    in_main = False
+    total = None
+    # Lines are "import time: self [us] | cumulative | name", with children
+    # listed before their parent and indented one more level
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        top_level = not name.startswith("  ")
+        name = name.strip()
+        if top_level and name == "fake_cups":
+            in_main = True
+            continue
+        if not in_main:
+            continue
+        modules.append((int(self_us) / 1000, name))
+        if top_level and name == "main":
+            total = int(cumulative_us) / 1000
+    return total, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget", type=float, default=IMPORT_BUDGET, help="ms")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    totals = []
+    for _ in range(args.runs):
+        total, modules = profile()
+        totals.append(total)
+    median = statistics.median(totals)
+
+    print(
+        f"import main: {median:.1f} ms median, "
+        f"{min(totals):.1f}-{max(totals):.1f} ms over {args.runs} runs "
+        f"(budget {args.budget:.0f} ms)"
+    )
+    print("\nslowest modules of the last run (self time):")
+    for self_ms, name in sorted(modules, reverse=True)[: args.top]:
+        print(f"{self_ms:8.1f} ms  {name}")
+
+    failures = []
+    if median > args.budget:
+        failures.append(
+            f"import main takes {median:.1f} ms, over the {args.budget:.0f} ms budget"
+        )
+    imported = {name for _, name in modules}
+    for module in DEFERRED_MODULES:
+        if module in imported:
+            failures.append(f"{module} is imported before the first frame")
+
+    for failure in failures:
+        print(f"\nFAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
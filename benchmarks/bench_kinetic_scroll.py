@@ -0,0 +1,183 @@
+"""
+Replays a drag and release on the form grid, as a finger does on the touch
+screen, with touch events every 8 ms. Compares the old drag scrolling, which
+moved the scroll bar on every touch event and eased to where the finger
+lifted, against KineticScroller, which moves it once per frame and flings.
+Reports how often the scroll bar moved, the frame times from the frame
+histogram, and how far the gesture scrolled. Runs on a temporary copy of
+./database/kiosk.db:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_kinetic_scroll
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import database
+import migrations
+import kinetic_scroll
+from PyQt5.QtCore import (
+    QEasingCurve,
+    QEvent,
+    QObject,
+    QPoint,
+    QPropertyAnimation,
+    Qt,
+)
+from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+from form_catalog import FormCatalog, FormListModel, CategoryFilterProxy
+from view_form import FormGridView
+from benchmarks.bench_form_search import fill_forms
+
+
+class OldDragScrolling(QObject):
+    """
+    Drag scrolling as SmoothScrollArea did it, timed with a FrameClock.
+    """
+
+    def __init__(self, view, histogram):
+        super().__init__(view)
+        self.scrollbar = view.verticalScrollBar()
+        self.press_y = None
+        self.press_value = None
+        self.animation = QPropertyAnimation(self.scrollbar, b"value", self)
+        self.animation.setEasingCurve(QEasingCurve.OutQuad)
+        self.animation.setDuration(500)
+        self.histogram = histogram
+        self.clock = kinetic_scroll.FrameClock(self.on_frame, self)
+        self.animation.finished.connect(self.clock.stop)
+        self.last_frame = None
+        view.viewport().installEventFilter(self)
+
+    def on_frame(self):
+        now = time.monotonic()
+        if self.last_frame is not None:
+            self.histogram.record((now - self.last_frame) * 1000)
+        self.last_frame = now
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.MouseButtonPress:
+            self.press_y = event.globalPos().y()
+            self.press_value = self.scrollbar.value()
+            self.animation.stop()
+            self.last_frame = None
+            self.clock.start()
+        elif event.type() == QEvent.MouseMove and self.press_y is not None:
+            self.scrollbar.setValue(self.press_value - (event.globalPos().y() - self.press_y))
+        elif event.type() == QEvent.MouseButtonRelease and self.press_y is not None:
+            self.animation.setStartValue(self.scrollbar.value())
+            self.animation.setEndValue(
+                self.press_value - (event.globalPos().y() - self.press_y)
+            )
+            self.animation.start()
+            self.press_y = None
+        return False
+
+
+def send_mouse(widget, event_type, y, buttons):
+    pos = QPoint(widget.width() // 2, y)
+    event = QMouseEvent(
+        event_type,
+        pos,
+        widget.mapToGlobal(pos),
+        Qt.LeftButton,
+        buttons,
+        Qt.NoModifier,
+    )
+    QApplication.sendEvent(widget, event)
+
+
+def gesture(view, distance, steps, settle_ms):
+    """
+    Drags up by `distance` pixels over `steps` touch events 8 ms apart,
+    lifts the finger and waits for the scrolling to settle. Returns how
+    many times the scroll bar moved and how far it went.
+    """
+    scrollbar = view.verticalScrollBar()
+    moves = []
+    scrollbar.valueChanged.connect(moves.append)
+    start_value = scrollbar.value()
+
+    viewport = view.viewport()
+    y = viewport.height() - 50
+    send_mouse(viewport, QEvent.MouseButtonPress, y, Qt.LeftButton)
+    for step in range(1, steps + 1):
+        QTest.qWait(8)
+        send_mouse(viewport, QEvent.MouseMove, y - distance * step // steps, Qt.LeftButton)
+    send_mouse(viewport, QEvent.MouseButtonRelease, y - distance, Qt.NoButton)
+    QTest.qWait(settle_ms)
+
+    scrollbar.valueChanged.disconnect(moves.append)
+    return len(moves), scrollbar.value() - start_value
+
+
+def make_grid(catalog):
+    model = FormListModel(catalog)
+    proxy = CategoryFilterProxy(catalog)
+    proxy.setSourceModel(model)
+    grid = FormGridView()
+    model.setParent(grid)
+    proxy.setParent(grid)
+    grid.setModel(proxy)
+    grid.resize(1800, 900)
+    grid.show()
+    QApplication.processEvents()
+    return grid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--forms", type=int, default=500)
+    parser.add_argument("--gestures", type=int, default=5)
+    parser.add_argument("--distance", type=int, default=400, help="pixels dragged")
+    parser.add_argument("--steps", type=int, default=20, help="touch events per drag")
+    args = parser.parse_args()
+
+    app = QApplication([])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "kiosk.db")
+        shutil.copy(database.DB_PATH, db_path)
+        fill_forms(db_path, args.forms)
+        migrations.migrate(db_path)
+        catalog = FormCatalog(db_path)
+
+        results = []
+        for name in ("old drag", "kinetic"):
+            grid = make_grid(catalog)
+            histogram = kinetic_scroll.FrameHistogram()
+            if name == "old drag":
+                grid.viewport().removeEventFilter(grid.scroller)
+                OldDragScrolling(grid, histogram)
+            else:
+                grid.scroller.histogram = histogram
+
+            updates = scrolled = 0
+            for _ in range(args.gestures):
+                moved, distance = gesture(grid, args.distance, args.steps, 1500)
+                updates += moved
+                scrolled += distance
+            results.append((name, updates, scrolled, histogram))
+            grid.deleteLater()
+            QApplication.processEvents()
+
+        print(
+            f"{args.gestures} drags of {args.distance} px in {args.steps} touch events, "
+            f"{args.forms} forms"
+        )
+        print(f"{'':>9} {'scroll moves':>12} {'scrolled px':>12}")
+        for name, updates, scrolled, _ in results:
+            print(f"{name:>9} {updates:>12} {scrolled:>12}")
+        for name, _, _, histogram in results:
+            print(f"\n{name} frame times\n{histogram.summary()}")
+        database.close(db_path)
+
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Times the admin report queries on a synthetic print history before and after
+the schema migrations: the old date()-per-row queries on the untyped
+kiosk_print_results, then the same reports on the typed, indexed table and
+from the daily sales totals. Runs on a temporary copy of ./database/kiosk.db:
+
+    python -m benchmarks.bench_migrations --rows 1000000
+"""
+
+import os
+import time
+import random
+import shutil
+import argparse
+import datetime
+import tempfile
+import database
+import migrations
+import sales_rollup
+
+FORMS = [f"Form {number}" for number in range(1, 21)]
+
+# Report queries as the dashboard ran them before the migrations
+OLD_REPORTS = {
+    "amount": """
+        SELECT COALESCE(SUM(total_amount), 0) FROM kiosk_print_results
+        WHERE date(date_printed) BETWEEN ? AND ? AND result = 'Success'
+    """,
+    "successful": """
+        SELECT COUNT(*) FROM kiosk_print_results
+        WHERE result = 'Success' AND date(date_printed) BETWEEN ? AND ?
+    """,
+    "failed": """
+        SELECT COUNT(*) FROM kiosk_print_results
+        WHERE result = 'Failed' AND date(date_printed) BETWEEN ? AND ?
+    """,
+    "top form": """
+        SELECT form_name FROM kiosk_print_results
+        WHERE strftime('%Y-%m-%d', date_printed) BETWEEN ? AND ? AND result = 'Success'
+        GROUP BY form_name ORDER BY SUM(number_of_copies) DESC LIMIT 1
+    """,
+}
+
+# The same reports on the typed table, by Unix time range
+NEW_REPORTS = {
+    "amount": """
+        SELECT COALESCE(SUM(total_amount), 0) FROM kiosk_print_results
+        WHERE printed_at BETWEEN ? AND ? AND result = 'Success'
+    """,
+    "successful": """
+        SELECT COUNT(*) FROM kiosk_print_results
+        WHERE printed_at BETWEEN ? AND ? AND result = 'Success'
+    """,
+    "failed": """
+        SELECT COUNT(*) FROM kiosk_print_results
+        WHERE printed_at BETWEEN ? AND ? AND result = 'Failed'
+    """,
+    "top form": """
+        SELECT form_name FROM kiosk_print_results
+        WHERE printed_at BETWEEN ? AND ? AND result = 'Success'
+        GROUP BY form_name ORDER BY SUM(number_of_copies) DESC LIMIT 1
+    """,
+}
+
+ROLLUP_REPORTS = {
+    "amount": lambda period, db_path: sales_rollup.total_amount(period, db_path),
+    "successful": lambda period, db_path: sales_rollup.result_count(
+        "Success", period, db_path
+    ),
+    "failed": lambda period, db_path: sales_rollup.result_count(
+        "Failed", period, db_path
+    ),
+    "top form": lambda period, db_path: sales_rollup.top_form(period, db_path),
+}
+
+OLD_LISTING = "SELECT * FROM kiosk_print_results"
+NEW_LISTING = """
+    SELECT printed_at, form_name, number_of_copies, total_amount, result
+    FROM kiosk_print_results ORDER BY printed_at DESC, id DESC LIMIT 100
+"""
+
+
+def fill_history(db_path, rows, days):
+    """
+    Replaces the print log with `rows` random jobs spread over the last
+    `days` days, in the old text-timestamp schema.
+    """
+    random.seed(rows)
+    now = datetime.datetime.now()
+    conn = database.connect(db_path)
+
+    def jobs():
+        for _ in range(rows):
+            printed = now - datetime.timedelta(minutes=random.randrange(days * 24 * 60))
+            copies = random.randint(1, 5)
+            yield (
+                printed.strftime("%Y-%m-%d %H:%M"),
+                random.choice(FORMS),
+                copies,
+                copies * 2.0,
+                "Success" if random.random() < 0.9 else "Failed",
+            )
+
+    with conn:
+        conn.execute("DELETE FROM kiosk_print_results")
+        conn.executemany("INSERT INTO kiosk_print_results VALUES (?, ?, ?, ?, ?)", jobs())
+
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run_query(db_path, sql, parameters=()):
+    cursor = database.cursor(db_path)
+    cursor.execute(sql, parameters)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def day_range(period):
+    return sales_rollup.period_range(period)
+
+
+def epoch_range(period):
+    first, last = sales_rollup.period_range(period)
+    start = datetime.datetime.strptime(first, "%Y-%m-%d")
+    # Month ranges end on the 31st, which may not exist, so count days from
+    # the first of the month
+    year, month, day = (int(part) for part in last.split("-"))
+    end = datetime.datetime(year, month, 1) + datetime.timedelta(days=day)
+    return int(start.timestamp()), int(end.timestamp()) - 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=730)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "kiosk.db")
+        shutil.copy(database.DB_PATH, db_path)
+
+        start = time.perf_counter()
+        fill_history(db_path, args.rows, args.days)
+        print(f"generated {args.rows} print jobs in {time.perf_counter() - start:.1f} s")
+
+        before = {}
+        for period in sales_rollup.PERIODS:
+            for report, sql in OLD_REPORTS.items():
+                before[period, report] = best_time(
+                    lambda: run_query(db_path, sql, day_range(period)), args.repeat
+                )
+        before["listing"] = best_time(
+            lambda: sorted(run_query(db_path, OLD_LISTING), reverse=True)[:100], 1
+        )
+
+        start = time.perf_counter()
+        migrations.migrate(db_path)
+        print(f"migrated in {time.perf_counter() - start:.1f} s")
+
+        start = time.perf_counter()
+        migrations.migrate(db_path)
+        print(f"second run (nothing to do) in {(time.perf_counter() - start) * 1000:.2f} ms\n")
+
+        indexed = {}
+        rollup = {}
+        for period in sales_rollup.PERIODS:
+            for report, sql in NEW_REPORTS.items():
+                indexed[period, report] = best_time(
+                    lambda: run_query(db_path, sql, epoch_range(period)), args.repeat
+                )
+                rollup[period, report] = best_time(
+                    lambda: ROLLUP_REPORTS[report](period, db_path), args.repeat
+                )
+        indexed["listing"] = best_time(lambda: run_query(db_path, NEW_LISTING), args.repeat)
+
+        print(f"{'query':<22} {'before':>10} {'indexed':>10} {'rollup':>10}   (ms)")
+        for period in sales_rollup.PERIODS:
+            for report in OLD_REPORTS:
+                key = (period, report)
+                print(
+                    f"{period + ' ' + report:<22} {before[key] * 1000:>10.2f} "
+                    f"{indexed[key] * 1000:>10.2f} {rollup[key] * 1000:>10.2f}"
+                )
+        print(
+            f"{'newest 100 jobs':<22} {before['listing'] * 1000:>10.2f} "
+            f"{indexed['listing'] * 1000:>10.2f}"
+        )
+
+        database.close(db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Counts fsyncs and commits for a payment session, comparing the old per-pulse
+UPDATE of coins_left with the payment journal.
+
+fsyncs are counted with strace when it is installed; otherwise only commits
+are reported. Runs against a temporary copy of ./database/kiosk.db:
+
+    python -m benchmarks.bench_payment_journal --coins 10 --pulses 5
+"""
+
+import os
+import sys
+import shutil
+import sqlite3
+import argparse
+import tempfile
+import subprocess
+import migrations
+from payment_journal import PaymentJournal
+
+
+def per_pulse_session(db_path, coins, pulses):
+    """
+    The old behaviour: one connection, UPDATE, commit and SELECT per pulse.
+    """
+    commits = 0
+    counter = 0
+    for _ in range(coins * pulses):
+        counter += 1
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        cursor.execute("UPDATE kiosk_settings SET coins_left = ?", (counter,))
+        conn.commit()
+        commits += 1
+        cursor.execute("SELECT coins_left FROM kiosk_settings LIMIT 1")
+        cursor.fetchone()
+        conn.close()
+    return commits
+
+
+def journal_session(db_path, coins, pulses):
+    """
+    The journal: one record per decoded coin, flushed once per coin (the worst
+    case for the flush timer) and settled at the end of the session.
+    """
+    journal = PaymentJournal(db_path, flush_interval=3600)
+    journal.replay()
+    commits_before = journal.commits
+    for _ in range(coins):
+        journal.record(pulses)
+        journal.flush()
+    journal.close()
+    return journal.commits - commits_before
+
+
+SCENARIOS = {
+    "per-pulse": per_pulse_session,
+    "journal": journal_session,
+}
+
+
+def count_fsyncs(strace_output):
+    calls = 0
+    with open(strace_output) as f:
+        for line in f:
+            fields = line.split()
+            if fields and fields[-1] in ("fsync", "fdatasync"):
+                calls += int(fields[3])
+    return calls
+
+
+def run_child(scenario, coins, pulses):
+    """
+    Runs a scenario in a fresh process (under strace if available) against a
+    fresh copy of the database. Returns (commits, fsyncs or None).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "kiosk.db")
+        shutil.copy("./database/kiosk.db", db_path)
+        migrations.migrate(db_path)
+
+        command = [
+            sys.executable,
+            "-m",
+            "benchmarks.bench_payment_journal",
+            "--child",
+            scenario,
+            "--db",
+            db_path,
+            "--coins",
+            str(coins),
+            "--pulses",
+            str(pulses),
+        ]
+        strace_output = os.path.join(tmp, "strace.txt")
+        strace = shutil.which("strace")
+        if strace:
+            command = [
+                strace,
+                "-f",
+                "-c",
+                "-e",
+                "trace=fsync,fdatasync",
+                "-o",
+                strace_output,
+            ] + command
+
+        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        commits = int(result.stdout.strip().splitlines()[-1])
+        fsyncs = count_fsyncs(strace_output) if strace else None
+        return commits, fsyncs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--coins", type=int, default=10)
+    parser.add_argument("--pulses", type=int, default=5, help="pulses per coin")
+    parser.add_argument("--child", choices=SCENARIOS, help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(SCENARIOS[args.child](args.db, args.coins, args.pulses))
+        return
+
+    if not shutil.which("strace"):
+        print("strace not found, reporting commits only\n")
+
+    print(f"{args.coins} coins x {args.pulses} pulses")
+    for scenario in SCENARIOS:
+        commits, fsyncs = run_child(scenario, args.coins, args.pulses)
+        line = f"{scenario:>10}: {commits:5d} commits"
+        if fsyncs is not None:
+            line += f", {fsyncs:5d} fsyncs ({fsyncs / max(commits, 1):.2f} per commit)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
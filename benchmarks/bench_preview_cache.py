@@ -0,0 +1,116 @@
+"""
+Measures the GUI-thread time of a swipe in the print preview: decoding,
+scaling and masking the page on every swipe, as the preview used to, against
+the preview cache with background prefetch of neighbouring pages. Uses a
+synthetic multi-page form made from one of the form previews:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_preview_cache --pages 10
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import preview_cache
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QApplication
+from preview_cache import PreviewCache, render_preview
+
+SOURCE_PAGE = "./img/form-preview/Student Clearance-1.jpg"
+TITLE = "Benchmark Form"
+
+
+def wait(seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+
+
+def swipe_order(pages, swipes):
+    """
+    Page indexes visited by swiping forward to the end and back, repeatedly.
+    """
+    order = []
+    index, step = 1, 1
+    while len(order) < swipes:
+        if not 1 <= index + step <= pages:
+            step = -step
+        index += step
+        order.append(index)
+    return order
+
+
+def uncached_swipes(order, interval):
+    times = []
+    for index in order:
+        start = time.perf_counter()
+        path = preview_cache.PREVIEW_PATH.format(title=TITLE, index=index)
+        QPixmap.fromImage(render_preview(path))
+        times.append(time.perf_counter() - start)
+        wait(interval)
+    return times
+
+
+def cached_swipes(order, pages, interval, budget):
+    cache = PreviewCache(memory_budget=budget)
+    # The synthetic form has no row in kiosk_forms
+    cache.metadata[TITLE] = None
+    times = []
+    for index in order:
+        start = time.perf_counter()
+        cache.get(TITLE, index)
+        cache.prefetch(
+            TITLE, [i for i in (index + 1, index - 1) if 1 <= i <= pages]
+        )
+        times.append(time.perf_counter() - start)
+        wait(interval)
+    cache.wait()
+    return times, cache
+
+
+def report(name, times):
+    times = sorted(times)
+    mean = sum(times) / len(times)
+    p95 = times[int(len(times) * 0.95) - 1]
+    print(f"{name:>10}: mean {mean * 1000:7.2f} ms, p95 {p95 * 1000:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--swipes", type=int, default=60)
+    parser.add_argument(
+        "--interval", type=float, default=0.3, help="time between swipes (s)"
+    )
+    parser.add_argument(
+        "--budget", type=float, default=16, help="cache memory budget (MB)"
+    )
+    args = parser.parse_args()
+
+    _app = QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.abspath(SOURCE_PAGE)
+        for index in range(1, args.pages + 1):
+            os.symlink(source, os.path.join(tmp, f"{TITLE}-{index}.jpg"))
+        preview_cache.PREVIEW_PATH = os.path.join(tmp, "{title}-{index}.jpg")
+
+        order = swipe_order(args.pages, args.swipes)
+        report("uncached", uncached_swipes(order, args.interval))
+        times, cache = cached_swipes(
+            order, args.pages, args.interval, int(args.budget * 1024 * 1024)
+        )
+        report("cached", times)
+
+    print(
+        f"\ncache hits {cache.hits}, misses {cache.misses}, "
+        f"{len(cache.pixmaps)} pages in {cache.size / (1024 * 1024):.1f} MB "
+        f"(budget {args.budget} MB)"
+    )
+    assert cache.size <= args.budget * 1024 * 1024
+
+
+if __name__ == "__main__":
+    main()
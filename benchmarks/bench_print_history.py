@@ -0,0 +1,139 @@
+"""
+Times opening the admin print history table for growing histories: filling a
+QTableWidget with every row, as the dashboard used to, against the paged
+PrintHistoryModel behind a QTableView. Also times scrolling, sorting and the
+date filter of the model. Runs on a temporary copy of ./database/kiosk.db:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_print_history
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import database
+import migrations
+import print_history
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+    QApplication,
+    QTableView,
+    QTableWidget,
+    QTableWidgetItem,
+)
+from benchmarks.bench_migrations import fill_history
+
+
+def old_table(db_path):
+    """
+    The table as populate_table built it: every row read, and the item loop
+    run once per row.
+    """
+    cursor = database.cursor(db_path)
+    cursor.execute(
+        """
+        SELECT strftime('%Y-%m-%d %H:%M', printed_at, 'unixepoch', 'localtime'),
+               form_name, number_of_copies, total_amount, result
+        FROM kiosk_print_results
+        ORDER BY printed_at DESC, id DESC
+        """
+    )
+    data = cursor.fetchall()
+    cursor.close()
+
+    table = QTableWidget()
+    table.setColumnCount(5)
+    table.setRowCount(len(data))
+    for row_num, row_data in enumerate(data):
+        for row_num, row_data in enumerate(data):
+            for col_num, col_data in enumerate(row_data):
+                table.setItem(row_num, col_num, QTableWidgetItem(str(col_data)))
+    table.show()
+    QApplication.processEvents()
+    return table
+
+
+def new_table(db_path):
+    table = QTableView()
+    model = print_history.PrintHistoryModel(db_path, parent=table)
+    table.resize(1400, 800)
+    table.verticalHeader().setDefaultSectionSize(80)
+    table.setModel(model)
+    table.horizontalHeader().setSortIndicator(0, Qt.DescendingOrder)
+    table.setSortingEnabled(True)
+    table.show()
+    QApplication.processEvents()
+    return table
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument(
+        "--old-limit",
+        type=int,
+        default=1_000,
+        help="largest history filled the old way (it is quadratic)",
+    )
+    parser.add_argument("--pages", type=int, default=50, help="pages scrolled")
+    args = parser.parse_args()
+
+    app = QApplication([])
+
+    print(
+        f"{'rows':>9} {'old open':>10} {'new open':>10} {'scroll/page':>12} "
+        f"{'sort':>9} {'filter':>9} {'cached pages':>13}   (ms)"
+    )
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "kiosk.db")
+            shutil.copy(database.DB_PATH, db_path)
+            fill_history(db_path, rows, 730)
+            migrations.migrate(db_path)
+
+            old_ms = "-"
+            if rows <= args.old_limit:
+                table, ms = timed(old_table, db_path)
+                old_ms = f"{ms:.1f}"
+                table.deleteLater()
+
+            table, open_ms = timed(new_table, db_path)
+            model = table.model()
+            scrollbar = table.verticalScrollBar()
+
+            start = time.perf_counter()
+            for _ in range(args.pages):
+                if not model.canFetchMore():
+                    break
+                scrollbar.setValue(scrollbar.maximum())
+                QApplication.processEvents()
+            scroll_ms = (time.perf_counter() - start) * 1000 / args.pages
+            cached_pages = len(model.pages)
+
+            _, sort_ms = timed(table.sortByColumn, 3, Qt.DescendingOrder)
+            _, filter_ms = timed(
+                model.set_date_range, *print_history.period_bounds("monthly")
+            )
+
+            print(
+                f"{rows:>9} {old_ms:>10} {open_ms:>10.1f} {scroll_ms:>12.2f} "
+                f"{sort_ms:>9.1f} {filter_ms:>9.1f} {cached_pages:>13}"
+            )
+            table.deleteLater()
+            QApplication.processEvents()
+            database.close(db_path)
+
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
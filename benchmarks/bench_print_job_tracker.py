@@ -0,0 +1,98 @@
+"""
+Measures how long after a job finishes the print job tracker reports it, and
+checks that job ids which are substrings of each other (12 and 123) are not
+confused. Runs offline against the fake CUPS backend:
+
+    python -m benchmarks.bench_print_job_tracker --jobs 10
+"""
+
+import sys
+import time
+import argparse
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+from fake_cups import FakeCupsServer
+from print_job_tracker import PrintJobTracker
+
+
+def track(server, job_id, timeout=30):
+    """
+    Tracks a job to completion. Returns (result, seconds after the job's
+    final state that the result arrived, states seen).
+    """
+    tracker = PrintJobTracker(job_id, connection_factory=server.connection)
+    loop = QEventLoop()
+    outcome = {}
+    states = []
+
+    def on_result(result):
+        outcome["result"] = result
+        outcome["at"] = time.perf_counter()
+        loop.quit()
+
+    tracker.state_changed.connect(lambda job, state: states.append(state))
+    tracker.status_result.connect(on_result)
+    tracker.start()
+    QTimer.singleShot(int(timeout * 1000), loop.quit)
+    loop.exec_()
+    tracker.stop()
+    tracker.wait()
+
+    latency = outcome["at"] - server.finish_time(job_id)
+    return outcome["result"], latency, states
+
+
+def lpstat_substring_match(job_id, active_job_ids):
+    """
+    The old PrinterStatusThread check against `lpstat -o` output.
+    """
+    output = "\n".join(
+        f"Fake_Printer-{active} root 1024 Mon 01 Jan 2024 10:00:00 AM"
+        for active in active_job_ids
+    )
+    return str(job_id) in output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=0.5, help="job time (s)")
+    args = parser.parse_args()
+
+    _app = QCoreApplication(sys.argv)
+
+    server = FakeCupsServer(job_duration=args.duration)
+    conn = server.connection()
+    latencies = []
+    for _ in range(args.jobs):
+        job_id = conn.printFile("Fake_Printer", "form.pdf", "Print Job", {})
+        result, latency, _ = track(server, job_id)
+        assert result, f"job {job_id} was not reported as completed"
+        latencies.append(latency)
+
+    latencies.sort()
+    print(f"completion latency over {args.jobs} jobs")
+    print(f"  mean: {sum(latencies) / len(latencies) * 1000:7.1f} ms")
+    print(f"  max:  {latencies[-1] * 1000:7.1f} ms")
+    print("  (the old tracker polled lpstat every 3000 ms)")
+    print(f"  CUPS requests: {server.calls}, processes spawned: 0")
+
+    # Job 12 has finished while job 123 is still printing
+    server = FakeCupsServer(first_job_id=12)
+    server.add_job(12, duration=0.1)
+    server.add_job(123, duration=60)
+    result, latency, states = track(server, 12)
+    print("\njob 12 finished while job 123 is printing")
+    print(f"  old lpstat check says job 12 active: {lpstat_substring_match(12, [123])}")
+    print(f"  tracker result: {'completed' if result else 'failed'}, states {states}")
+    print(f"  reported {latency * 1000:.1f} ms after completion")
+    assert result and latency < 2.0, "job 12 was confused with job 123"
+
+    failing = FakeCupsServer(fail_jobs=True, job_duration=0.1)
+    job_id = failing.connection().printFile("Fake_Printer", "form.pdf", "Print Job", {})
+    result, _, states = track(failing, job_id)
+    print(f"\naborted job reported as {'completed' if result else 'failed'}: {states}")
+    assert not result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Times opening the View Process screens' images: decoding the full process
+image and scaling and masking it as ProcessWidget used to, against the
+pre-scaled copy from process_images; and scaling the whole campus map as
+ImageViewer used to, against MapViewer's tile pyramid. Then zooms the map
+in and pans it, and reports the decoded map pixels held at each step. Tiles
+are cut into a temporary directory:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_process_images
+"""
+
+import os
+import glob
+import time
+import argparse
+import tempfile
+import statistics
+import process_images
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPixmap, QPixmapCache
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+
+
+def old_process_image(path):
+    image = QImage(path)
+    image = image.scaledToWidth(1280, Qt.SmoothTransformation)
+    image = image.scaledToHeight(int(1280 * (2 / 3)), Qt.SmoothTransformation)
+    return QPixmap.fromImage(process_images.round_corners(image, 25))
+
+
+def old_map(path):
+    pixmap = QPixmap(path)
+    return pixmap.scaled(2560, 1440, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def median_ms(function, *args, runs=5):
+    return statistics.median(timed(function, *args)[1] for _ in range(runs))
+
+
+def tile_megabytes(viewer):
+    pixmaps = [item.pixmap() for item in viewer.tile_items.values()]
+    pixmaps.append(viewer.base_item.pixmap())
+    return sum(pixmap.width() * pixmap.height() * 4 for pixmap in pixmaps) / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--zooms", type=int, default=10, help="zoom in steps of 1.2")
+    args = parser.parse_args()
+
+    app = QApplication([])
+
+    source = next(
+        path
+        for path in sorted(glob.glob(f"{process_images.PROCESS_DIR}/*.[pj][np]g"))
+        if os.path.abspath(path) != os.path.abspath(process_images.MAP_PATH)
+    )
+    title = process_images.image_name(source)
+    process_images.prepare_process(title)
+
+    def new_process_image():
+        # Read back from the disk cache, as on the first open after a restart
+        process_images._pixmaps.clear()
+        QPixmapCache.clear()
+        return process_images.process_pixmap(title)
+
+    print(f"process image ({os.path.basename(source)}), median of {args.runs} opens")
+    print(f"  full decode, scale and mask {median_ms(old_process_image, source, runs=args.runs):>8.1f} ms")
+    print(f"  pre-scaled copy from disk   {median_ms(new_process_image, runs=args.runs):>8.1f} ms")
+    print(f"  pre-scaled copy from memory {median_ms(process_images.process_pixmap, title, runs=args.runs):>8.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tile_dir = os.path.join(tmp, "map-tiles")
+        _, build_ms = timed(process_images.build_map_tiles, process_images.MAP_PATH, tile_dir)
+
+        old, _ = timed(old_map, process_images.MAP_PATH)
+        full = QImage(process_images.MAP_PATH)
+        print(f"\ncampus map ({full.width()}x{full.height()}), tiles cut once in {build_ms:.0f} ms")
+        print(
+            f"  scale whole map  {median_ms(old_map, process_images.MAP_PATH, runs=args.runs):>8.1f} ms, "
+            f"holds {old.width() * old.height() * 4 / 2**20:.1f} MB after decoding "
+            f"{full.width() * full.height() * 4 / 2**20:.1f} MB"
+        )
+        del full
+
+        def open_viewer():
+            QPixmapCache.clear()
+            viewer = process_images.MapViewer(process_images.MAP_PATH, tile_dir)
+            viewer.resize(1600, 900)
+            viewer.show()
+            return viewer
+
+        print(f"  tiled map viewer {median_ms(open_viewer, runs=args.runs):>8.1f} ms")
+
+        viewer = open_viewer()
+        QTest.qWait(20)
+        print(f"\n{'zoom':>6} {'level':>5} {'tiles':>5} {'MB held':>8} {'pan ms':>7}")
+        for step in range(args.zooms + 1):
+            if step:
+                viewer.zoom_in()
+            scrollbar = viewer.horizontalScrollBar()
+            _, pan_ms = timed(scrollbar.setValue, scrollbar.maximum() * (step % 2))
+            print(
+                f"{viewer.transform().m11():>6.2f} {viewer.current_level:>5} "
+                f"{len(viewer.tile_items):>5} {tile_megabytes(viewer):>8.1f} {pan_ms:>7.1f}"
+            )
+        viewer.deleteLater()
+        QApplication.processEvents()
+
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Measures time and peak Python memory of exporting the print history to CSV
+for growing histories: reading every row with fetchall before writing,
+against report_export streaming chunks from the cursor. Runs on a temporary
+copy of ./database/kiosk.db:
+
+    python -m benchmarks.bench_report_export --rows 10000 100000 1000000
+"""
+
+import os
+import csv
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+import database
+import migrations
+import report_export
+from benchmarks.bench_migrations import fill_history
+
+
+def fetchall_export(db_path, path):
+    cursor = database.cursor(db_path)
+    cursor.execute(report_export.EXPORTS["print_history"]["query"].format(where=""))
+    rows = cursor.fetchall()
+    cursor.close()
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerows(rows)
+    return len(rows)
+
+
+def measure(function, *args):
+    # Timed without tracemalloc, which slows every allocation down
+    start = time.perf_counter()
+    count = function(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'rows':>9} {'fetchall s':>11} {'peak MB':>9} {'streamed s':>11} {'peak MB':>9}"
+    )
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "kiosk.db")
+            shutil.copy(database.DB_PATH, db_path)
+            fill_history(db_path, rows, 730)
+            migrations.migrate(db_path)
+
+            _, old_time, old_peak = measure(
+                fetchall_export, db_path, os.path.join(tmp, "old.csv")
+            )
+            count, new_time, new_peak = measure(
+                report_export.export,
+                "print_history",
+                os.path.join(tmp, "new.csv"),
+                None,
+                None,
+                None,
+                db_path,
+            )
+            assert count == rows
+
+            print(
+                f"{rows:>9} {old_time:>11.2f} {old_peak / 2**20:>9.1f} "
+                f"{new_time:>11.2f} {new_peak / 2**20:>9.1f}"
+            )
+            database.close(db_path)
+
+
+if __name__ == "__main__":
+    main()
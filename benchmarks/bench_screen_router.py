@@ -0,0 +1,161 @@
+"""
+Soak test for screen navigation: drives the main window through thousands of
+screen changes and checks that memory use stays flat, i.e. that screens which
+are replaced or evicted from the pool are really destroyed. Runs headless
+against a temporary copy of ./database/kiosk.db and the fake CUPS backend:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_screen_router --navigations 10000
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import database
+import migrations
+import printer_monitor
+from PyQt5.QtCore import QCoreApplication, QEvent
+from PyQt5.QtWidgets import QApplication
+from fake_cups import FakeCupsServer
+from main import MainWindow
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+ASSETS = ("img", "forms")
+
+
+def rss_mb():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * PAGE_SIZE / (1024 * 1024)
+
+
+def flush_events():
+    QApplication.processEvents()
+    # deleteLater() is only honoured once control returns to an event loop
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def navigation_cycle(window, title, pages):
+    """
+    One visit through the screens a customer and the admin use. Yields after
+    each screen change.
+    """
+    window.show_home_screen()
+    yield
+    window.show_form_list()
+    yield
+    window.show_print_preview(title, pages, True, True, True)
+    yield
+    window.show_view_process(title)
+    yield
+    window.go_back_print_preview()
+    yield
+    window.show_form_list()
+    yield
+    window.show_controlled_process("Removal Form")
+    yield
+    window.show_form_list()
+    yield
+    window.show_home_screen()
+    yield
+    window.show_about()
+    yield
+    window.show_home_screen()
+    yield
+    window.show_admin_login()
+    yield
+    window.show_home_screen()
+    yield
+
+
+def navigate(window, forms, count):
+    done = 0
+    while True:
+        for title, pages in forms:
+            for _ in navigation_cycle(window, title, pages):
+                flush_events()
+                done += 1
+                if done == count:
+                    return
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--navigations", type=int, default=10000)
+    parser.add_argument("--warmup", type=int, default=500)
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument(
+        "--budget", type=float, default=32.0, help="allowed RSS growth (MB)"
+    )
+    args = parser.parse_args()
+
+    repo = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        # The screens use paths relative to the working directory
+        for asset in ASSETS:
+            os.symlink(os.path.join(repo, asset), os.path.join(tmp, asset))
+        os.mkdir(os.path.join(tmp, "database"))
+        shutil.copy(os.path.join(repo, database.DB_PATH), os.path.join(tmp, database.DB_PATH))
+        os.chdir(tmp)
+        migrations.migrate()
+
+        _app = QApplication(sys.argv)
+        printer_monitor._monitor = printer_monitor.PrinterMonitor(
+            FakeCupsServer().connection
+        )
+        printer_monitor._monitor.start()
+
+        cursor = database.cursor()
+        cursor.execute("SELECT form_name, number_of_pages FROM kiosk_forms")
+        forms = cursor.fetchall()
+        cursor.close()
+
+        window = MainWindow()
+        window.show()
+        window.label.hide()
+        flush_events()
+        idle_widgets = len(QApplication.allWidgets())
+
+        navigate(window, forms, args.warmup)
+        baseline_rss = rss_mb()
+        baseline_widgets = len(QApplication.allWidgets())
+
+        step = args.navigations // args.samples
+        print(f"{'navigations':>12} {'RSS (MB)':>10} {'widgets':>8} {'ms/nav':>8}")
+        print(f"{0:>12} {baseline_rss:>10.1f} {baseline_widgets:>8}")
+        for sample in range(1, args.samples + 1):
+            start = time.perf_counter()
+            navigate(window, forms, step)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{sample * step:>12} {rss_mb():>10.1f} "
+                f"{len(QApplication.allWidgets()):>8} {elapsed / step * 1000:>8.2f}"
+            )
+
+        router = window.router
+        growth = rss_mb() - baseline_rss
+        pooled = router.count()
+        print(
+            f"\nscreens created {router.created}, reused {router.reused}, "
+            f"destroyed {router.destroyed}, pooled {pooled}"
+        )
+        print(f"RSS growth after warm-up: {growth:.1f} MB (budget {args.budget} MB)")
+
+        # With the pool emptied, every widget a screen created must be gone
+        window.router.clear()
+        flush_events()
+        leaked_widgets = len(QApplication.allWidgets()) - idle_widgets
+        print(f"widgets left after emptying the pool: {leaked_widgets}")
+        printer_monitor._monitor.stop()
+        database.close()
+        os.chdir(repo)
+
+    assert pooled <= router.max_screens, "screen pool is unbounded"
+    assert leaked_widgets <= 0, f"{leaked_widgets} widgets were never destroyed"
+    assert growth <= args.budget, f"RSS grew by {growth:.1f} MB"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Times repainting a white rounded card with its drop shadow, drawn by
+QGraphicsDropShadowEffect as the screens used to and by ShadowEffect from a
+cached nine-patch, at the sizes of the admin login pad, a form card and the
+print preview's total frame, and reports how far the two renderings differ:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_shadows
+"""
+
+import time
+import argparse
+import statistics
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QFrame, QGraphicsDropShadowEffect, QWidget
+from shadows import ShadowEffect
+
+
+# (name, width, height, blur radius, corner radius, vertical offset)
+CARDS = (
+    ("login pad", 800, 800, 50, 30, 12),
+    ("form card", 525, 65, 50, 20, 0),
+    ("total frame", 420, 360, 50, 45, 8),
+)
+
+
+def build(effect_class, width, height, blur, radius, offset):
+    root = QWidget()
+    root.setStyleSheet("background-color: #EBEBEB;")
+    root.resize(width + 200, height + 200)
+    card = QFrame(root)
+    card.setGeometry(100, 100, width, height)
+    card.setStyleSheet(
+        f"QFrame {{background-color: #FFFFFF; border-radius: {radius}px;}}"
+    )
+
+    effect = effect_class()
+    effect.setBlurRadius(blur)
+    effect.setColor(Qt.gray)
+    effect.setOffset(0, offset)
+    if effect_class is ShadowEffect:
+        effect.setRadius(radius)
+    card.setGraphicsEffect(effect)
+    root.show()
+    QApplication.processEvents()
+    return root, card
+
+
+def median_ms(card, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        card.repaint()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def max_difference(first, second):
+    first = first.grab().toImage()
+    second = second.grab().toImage()
+    difference = 0
+    for y in range(0, first.height(), 2):
+        for x in range(0, first.width(), 2):
+            a, b = first.pixelColor(x, y), second.pixelColor(x, y)
+            difference = max(
+                difference,
+                abs(a.red() - b.red()),
+                abs(a.green() - b.green()),
+                abs(a.blue() - b.blue()),
+            )
+    return difference
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    _app = QApplication([])
+
+    print(f"{'':>12} {'before':>9} {'after':>9} {'max diff':>9}")
+    for name, *card in CARDS:
+        old_root, old_card = build(QGraphicsDropShadowEffect, *card)
+        new_root, new_card = build(ShadowEffect, *card)
+        before = median_ms(old_card, args.runs)
+        after = median_ms(new_card, args.runs)
+        difference = max_difference(old_root, new_root)
+        print(f"{name:>12} {before:>7.2f}ms {after:>7.2f}ms {difference:>9}")
+
+
+if __name__ == "__main__":
+    main()
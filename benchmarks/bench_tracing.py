@@ -0,0 +1,66 @@
+"""
+Measures what tracing costs: an empty traced function and span, and a small
+SQLite query through the database module, with tracing off and on. Runs on a
+temporary copy of ./database/kiosk.db:
+
+    python -m benchmarks.bench_tracing
+"""
+
+import os
+import shutil
+import argparse
+import tempfile
+import timeit
+import database
+import tracing
+
+
+def empty():
+    pass
+
+
+@tracing.traced("bench.empty")
+def traced_empty():
+    pass
+
+
+def empty_span():
+    with tracing.span("bench.span"):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "kiosk.db")
+        shutil.copy(database.DB_PATH, db_path)
+        conn = database.connect(db_path)
+
+        def query():
+            conn.execute("SELECT base_price FROM kiosk_settings LIMIT 1").fetchone()
+
+        cases = (
+            ("plain function", empty, args.calls),
+            ("traced function", traced_empty, args.calls),
+            ("span block", empty_span, args.calls),
+            ("sqlite query", query, args.queries),
+        )
+
+        print(f"{'':>16} {'off (us)':>9} {'on (us)':>9}")
+        for name, function, number in cases:
+            times = []
+            for enabled in (False, True):
+                tracing.enable() if enabled else tracing.disable()
+                times.append(timeit.timeit(function, number=number) / number * 1e6)
+                tracing.clear()
+            print(f"{name:>16} {times[0]:>9.3f} {times[1]:>9.3f}")
+        tracing.disable()
+        database.close(db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Cold start of the kiosk, run in a fresh interpreter by benchmarks.suite:
+imports main, builds MainWindow and shows its first frame, then prints the
+milliseconds of each step as JSON. Nothing but the standard library and the
+fake CUPS module is imported before the clock starts.
+
+Run it from a directory laid out like the repository, e.g.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.cold_start
+"""
+
+import time
+
+START = time.perf_counter()
+
+import sys
+import json
+import fake_cups
+
+
+def elapsed_ms(since):
+    return (time.perf_counter() - since) * 1000
+
+
+def main():
+    fake_cups.install_module()
+
+    step = time.perf_counter()
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    timings = {"qapplication": elapsed_ms(step)}
+
+    step = time.perf_counter()
+    import main as kiosk
+
+    timings["import_main"] = elapsed_ms(step)
+
+    step = time.perf_counter()
+    window = kiosk.MainWindow()
+    timings["main_window"] = elapsed_ms(step)
+
+    step = time.perf_counter()
+    window.show()
+    app.processEvents()
+    timings["first_frame"] = elapsed_ms(step)
+    timings["total"] = elapsed_ms(START)
+
+    window.printer_monitor.stop()
+    print(json.dumps(timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+"""
+Benchmark suite of the paths students hit, run headless: MainWindow cold
+start, building the form list, filtering it by category, swiping through a
+print preview, a coin's pulses reaching the payment screen, recording a
+finished print job, and the admin dashboard's queries. Printing goes to the
+fake CUPS server and the coin slot to gpiozero's mock pins.
+
+Runs against a temporary copy of ./database/kiosk.db filled with forms and
+print history, and writes the timings as JSON. Pass the JSON of an earlier
+commit with --compare to list what got slower; the exit status is 1 if
+anything did:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.suite --output before.json
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.suite --compare before.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import threading
+import statistics
+import subprocess
+from datetime import datetime
+import database
+import fake_cups
+import migrations
+import sales_rollup
+import print_history
+import printer_monitor
+from PyQt5.QtCore import PYQT_VERSION_STR, QT_VERSION_STR, QCoreApplication, QEvent
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+from view_form import ViewFormWidget
+from print_preview import PrintPreviewWidget
+from print_form import PrintFormWidget
+from print_window import PrintInProgress
+from benchmarks.bench_form_search import fill_forms
+from benchmarks.bench_migrations import fill_history
+
+
+SCREEN_SIZE = (1920, 1080)
+
+# Multi-page form added for the print preview swipe; its pages are links to
+# an existing preview
+SWIPE_FORM = "Benchmark Swipe Form"
+
+# Time between swipes and between coins, in seconds, about as fast as a
+# student goes
+SWIPE_INTERVAL = 0.15
+COIN_INTERVAL = 0.2
+
+# Pulses of the coins inserted, and seconds between pulses of one coin
+COIN_PULSES = (1, 5)
+PULSE_INTERVAL = 0.03
+
+PERIODS = ("daily", "weekly", "monthly", "yearly")
+
+# A median this much slower than in the compared run is a regression, unless
+# it moved by less than the noise floor
+REGRESSION_RATIO = 1.2
+NOISE_FLOOR_MS = 0.5
+
+
+def flush_events():
+    QApplication.processEvents()
+    # deleteLater() is only honoured once control returns to an event loop
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def make_tree(repo, tmp, swipe_pages):
+    """
+    Lays out a working directory like the repository's: assets linked, the
+    database copied, and previews for SWIPE_FORM.
+    """
+    os.mkdir(os.path.join(tmp, "img"))
+    for name in os.listdir(os.path.join(repo, "img")):
+        if name != "form-preview":
+            os.symlink(os.path.join(repo, "img", name), os.path.join(tmp, "img", name))
+
+    previews = os.path.join(repo, "img", "form-preview")
+    os.mkdir(os.path.join(tmp, "img", "form-preview"))
+    names = sorted(os.listdir(previews))
+    for name in names:
+        os.symlink(os.path.join(previews, name), os.path.join(tmp, "img", "form-preview", name))
+    for page in range(1, swipe_pages + 1):
+        os.symlink(
+            os.path.join(previews, names[0]),
+            os.path.join(tmp, "img", "form-preview", f"{SWIPE_FORM}-{page}.jpg"),
+        )
+
+    os.symlink(os.path.join(repo, "forms"), os.path.join(tmp, "forms"))
+    os.mkdir(os.path.join(tmp, "database"))
+    shutil.copy(os.path.join(repo, database.DB_PATH), os.path.join(tmp, database.DB_PATH))
+
+
+def fill_database(forms, history, swipe_pages):
+    fill_forms(database.DB_PATH, forms)
+    with database.connect() as conn:
+        category = conn.execute("SELECT form_category FROM kiosk_forms LIMIT 1").fetchone()[0]
+        conn.execute(
+            "INSERT INTO kiosk_forms (form_name, number_of_pages, form_description, form_category) VALUES (?,?,?,?)",
+            (SWIPE_FORM, swipe_pages, "Form with several pages to swipe through.", category),
+        )
+    fill_history(database.DB_PATH, history, 365)
+    database.close()
+    migrations.migrate()
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def summarize(times):
+    ordered = sorted(times)
+    return {
+        "runs": len(times),
+        "first": times[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[math.ceil(len(ordered) * 0.95) - 1],
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def bench_cold_start(args, repo):
+    """
+    Starts the kiosk in a new interpreter each run; see cold_start.py.
+    """
+    env = dict(os.environ, PYTHONPATH=repo)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    results = {}
+    for _ in range(args.cold_runs):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.cold_start"],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        process_ms = (time.perf_counter() - start) * 1000
+        timings = json.loads(output.strip().splitlines()[-1])
+        timings["process"] = process_ms
+        for step, ms in timings.items():
+            results.setdefault(f"cold_start.{step}", []).append(ms)
+    return results
+
+
+def bench_view_form(args):
+    construct = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        widget = ViewFormWidget(None, True)
+        widget.resize(*SCREEN_SIZE)
+        widget.show()
+        QApplication.processEvents()
+        construct.append((time.perf_counter() - start) * 1000)
+        widget.deleteLater()
+        flush_events()
+
+    # Every category and back to all forms, each repainted
+    widget = ViewFormWidget(None, True)
+    widget.resize(*SCREEN_SIZE)
+    widget.show()
+    flush_events()
+    categories = [name for name, _ in widget.catalog.categories] + [None]
+    filtering = []
+    for _ in range(args.runs):
+        for category in categories:
+            start = time.perf_counter()
+            widget.filter_buttons(category)
+            widget.form_grid.viewport().repaint()
+            filtering.append((time.perf_counter() - start) * 1000)
+    widget.deleteLater()
+    flush_events()
+
+    return {"view_form.construct": construct, "view_form.filter_buttons": filtering}
+
+
+def bench_swipe(args):
+    widget = PrintPreviewWidget(None, SWIPE_FORM, args.swipe_pages, True, True, True)
+    widget.resize(*SCREEN_SIZE)
+    widget.show()
+    flush_events()
+
+    swipes = []
+    for _ in range(args.runs):
+        # To the last page and back, as a student leafing through the form
+        for slide in [widget.slide_right] * (args.swipe_pages - 1) + [widget.slide_left] * (
+            args.swipe_pages - 1
+        ):
+            start = time.perf_counter()
+            slide()
+            widget.center_image.repaint()
+            swipes.append((time.perf_counter() - start) * 1000)
+            QTest.qWait(int(SWIPE_INTERVAL * 1000))
+    widget.deleteLater()
+    flush_events()
+    return {"print_preview.swipe": swipes}
+
+
+def bench_payment(args):
+    """
+    Drives the coin slot's pin and times from the last pulse of each coin
+    to the payment screen showing it. This includes the coin acceptor's
+    TRAIN_GAP of silence that ends a coin.
+    """
+    from gpiozero import Device
+    from gpiozero.pins.mock import MockFactory
+
+    Device.pin_factory = MockFactory()
+    widget = PrintFormWidget(None, SWIPE_FORM, 1, 1, 10_000)
+    widget.show()
+    flush_events()
+    pin = Device.pin_factory.pin(widget.coin_acceptor.backend.pin)
+
+    shown = []
+    widget.coin_acceptor.counter_changed.connect(
+        lambda counter: shown.append(time.perf_counter())
+    )
+    # The acceptor opens the pin from its own thread
+    deadline = time.monotonic() + 5
+    while widget.coin_acceptor.backend.coinslot is None and time.monotonic() < deadline:
+        QTest.qWait(10)
+
+    latencies = []
+    for run in range(args.runs):
+        pulses = COIN_PULSES[run % len(COIN_PULSES)]
+        last_pulse = []
+
+        def insert_coin():
+            for number in range(pulses):
+                if number:
+                    time.sleep(PULSE_INTERVAL)
+                pin.drive_low()
+                last_pulse[:] = [time.perf_counter()]
+                pin.drive_high()
+
+        count = len(shown)
+        thread = threading.Thread(target=insert_coin, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 5
+        while len(shown) == count and time.monotonic() < deadline:
+            QTest.qWait(1)
+        thread.join()
+        if len(shown) > count:
+            latencies.append((shown[-1] - last_pulse[0]) * 1000)
+        QTest.qWait(int(COIN_INTERVAL * 1000))
+
+    widget.end_session()
+    widget.deleteLater()
+    flush_events()
+    Device.pin_factory.close()
+    return {"payment.pulse_to_screen": latencies}
+
+
+def bench_print_result(args):
+    widget = PrintInProgress(None, SWIPE_FORM, 1, 1, 10)
+    # Only the result is recorded here; no job is sent to the printer
+    widget.print_document = lambda *job: None
+    widget.bondpaper_left = widget.ink_left = 1
+    widget.title = SWIPE_FORM
+    widget.num_copy = 1
+    widget.total = 10
+
+    results = {"Success": [], "Failed": []}
+    for run in range(args.runs):
+        for result, times in results.items():
+            times.append(timed(widget.update_database_and_ui, result))
+        flush_events()
+    widget.deleteLater()
+    flush_events()
+    return {
+        "print_in_progress.update_success": results["Success"],
+        "print_in_progress.update_failed": results["Failed"],
+    }
+
+
+def bench_dashboard(args):
+    queries = {
+        "dashboard.total_amount": lambda period: sales_rollup.total_amount(period),
+        "dashboard.top_form": lambda period: sales_rollup.top_form(period),
+        "dashboard.result_count": lambda period: sales_rollup.result_count("Success", period),
+    }
+    results = {name: [] for name in queries}
+    results["dashboard.history_page"] = []
+
+    model = print_history.PrintHistoryModel()
+    for _ in range(args.runs):
+        for name, query in queries.items():
+            for period in PERIODS:
+                results[name].append(timed(query, period))
+
+        def history_page():
+            # The history table reading its first screen of rows again
+            model.refresh()
+            for row in range(min(model.rowCount(), 20)):
+                model.data(model.index(row, 0))
+
+        results["dashboard.history_page"].append(timed(history_page))
+    return results
+
+
+def compare(results, previous):
+    """
+    Prints the change of every median against an earlier run and returns
+    the names that regressed.
+    """
+    print(f"\ncompared with {previous.get('commit') or 'earlier run'}")
+    print(f"{'benchmark':<36} {'before':>9} {'after':>9} {'change':>8}")
+    regressions = []
+    for name, summary in results.items():
+        before = previous["results"].get(name)
+        if before is None:
+            continue
+        old, new = before["median"], summary["median"]
+        ratio = new / old if old else float("inf")
+        flag = ""
+        if ratio > REGRESSION_RATIO and new - old > NOISE_FLOOR_MS:
+            regressions.append(name)
+            flag = "  slower"
+        print(f"{name:<36} {old:>9.2f} {new:>9.2f} {(ratio - 1) * 100:>+7.0f}%{flag}")
+    return regressions
+
+
+def git_commit(repo):
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--cold-runs", type=int, default=5, help="cold starts")
+    parser.add_argument("--forms", type=int, default=200)
+    parser.add_argument("--history", type=int, default=20_000, help="print history rows")
+    parser.add_argument("--swipe-pages", type=int, default=5)
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", help="JSON written by an earlier run")
+    args = parser.parse_args()
+
+    repo = os.getcwd()
+    output = os.path.abspath(args.output)
+    previous = None
+    if args.compare:
+        with open(args.compare) as file:
+            previous = json.load(file)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The screens use paths relative to the working directory
+        make_tree(repo, tmp, args.swipe_pages)
+        os.chdir(tmp)
+        fill_database(args.forms, args.history, args.swipe_pages)
+        fake_cups.install_module()
+
+        samples = bench_cold_start(args, repo)
+
+        app = QApplication(sys.argv)
+        for bench in (bench_view_form, bench_swipe, bench_payment, bench_print_result, bench_dashboard):
+            samples.update(bench(args))
+
+        if printer_monitor._monitor is not None:
+            printer_monitor._monitor.stop()
+        database.close()
+        os.chdir(repo)
+        app.processEvents()
+
+    results = {name: summarize(times) for name, times in samples.items()}
+    print(f"{'benchmark':<36} {'first':>9} {'median':>9} {'p95':>9} {'runs':>5}   (ms)")
+    for name, summary in results.items():
+        print(
+            f"{name:<36} {summary['first']:>9.2f} {summary['median']:>9.2f} "
+            f"{summary['p95']:>9.2f} {summary['runs']:>5}"
+        )
+
+    report = {
+        "commit": git_commit(repo),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "pyqt": PYQT_VERSION_STR,
+        "platform": platform.platform(),
+        "settings": vars(args),
+        "results": results,
+    }
+    with open(output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"\nwrote {output}")
+
+    if previous is not None and compare(results, previous):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
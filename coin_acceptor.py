@@ -0,0 +1,173 @@
+import time
+import threading
+from PyQt5.QtCore import QThread, pyqtSignal
+
+
+# Silence (in seconds) after the last pulse that ends a pulse train
+TRAIN_GAP = 0.15
+
+# Pulses closer together than this (in seconds) are treated as contact bounce
+DEBOUNCE = 0.01
+
+
+class GpioPulseBackend:
+    """
+    Delivers coin slot pulses from the edge callback of a gpiozero Button.
+    """
+
+    def __init__(self, pin=16):
+        self.pin = pin
+        self.coinslot = None
+
+    def start(self, on_pulse):
+        from gpiozero import Button
+
+        self.coinslot = Button(self.pin)
+        self.coinslot.when_pressed = lambda: on_pulse(time.perf_counter())
+
+    def stop(self):
+        if self.coinslot is not None:
+            self.coinslot.when_pressed = None
+            self.coinslot.close()
+            self.coinslot = None
+
+
+class SimulatedPulseBackend:
+    """
+    Pin backend that generates coin slot pulses in software.
+
+    Pulses are delivered from a separate thread, the same way gpiozero calls
+    its edge callbacks, so the rest of the engine cannot tell the difference.
+    """
+
+    def __init__(self, pulse_interval=0.03):
+        self.pulse_interval = pulse_interval
+        self.on_pulse = None
+        self.lock = threading.Lock()
+
+    def start(self, on_pulse):
+        self.on_pulse = on_pulse
+
+    def stop(self):
+        with self.lock:
+            self.on_pulse = None
+
+    def pulse(self):
+        """
+        Sends a single pulse immediately and returns its timestamp.
+        """
+        timestamp = time.perf_counter()
+        with self.lock:
+            if self.on_pulse is not None:
+                self.on_pulse(timestamp)
+        return timestamp
+
+    def insert_coin(self, pulses, wait=False):
+        """
+        Sends a pulse train of the given length from a background thread.
+        """
+        thread = threading.Thread(
+            target=self._send_train, args=(pulses,), daemon=True
+        )
+        thread.start()
+        if wait:
+            thread.join()
+        return thread
+
+    def _send_train(self, pulses):
+        for i in range(pulses):
+            if i:
+                time.sleep(self.pulse_interval)
+            self.pulse()
+
+
+class CoinAcceptor(QThread):
+    """
+    Thread that turns coin slot pulses into coin values.
+
+    Pulses are pushed in by the backend's edge callback and timestamped there.
+    The thread sleeps until a pulse train has been quiet for TRAIN_GAP and
+    emits one counter_changed for the whole coin. The acceptor sends one pulse
+    per peso, so a coin is worth the length of its train.
+    """
+
+    counter_changed = pyqtSignal(int)
+    coin_accepted = pyqtSignal(int, float)
+
+    def __init__(self, initial_counter, backend=None):
+        super().__init__()
+        self.counter = initial_counter
+        self.backend = backend if backend is not None else GpioPulseBackend()
+
+        self.condition = threading.Condition()
+        self.pulses = []
+        self.stopping = False
+
+    def on_pulse(self, timestamp):
+        """
+        Records a pulse. Called from the backend's callback thread.
+        """
+        with self.condition:
+            if self.pulses and timestamp - self.pulses[-1] < DEBOUNCE:
+                return
+            self.pulses.append(timestamp)
+            self.condition.notify()
+
+    def run(self):
+        """
+        Waits for complete pulse trains and emits their coins.
+        """
+        try:
+            # The coin slot is only released here, so a stop() that comes
+            # before it is opened still closes it
+            try:
+                self.backend.start(self.on_pulse)
+            except Exception as e:
+                print(f"Error starting coin slot: {e}")
+                return
+
+            while True:
+                with self.condition:
+                    train = self.wait_for_train()
+                if train is None:
+                    break
+                self.accept_coin(train)
+        finally:
+            self.backend.stop()
+
+    def wait_for_train(self):
+        """
+        Blocks until a pulse train has ended. Returns None once stopped.
+        """
+        while True:
+            if self.stopping:
+                # Credit a train that was cut short rather than dropping it
+                train, self.pulses = self.pulses, []
+                return train or None
+
+            if not self.pulses:
+                self.condition.wait()
+                continue
+
+            remaining = self.pulses[-1] + TRAIN_GAP - time.perf_counter()
+            if remaining > 0:
+                self.condition.wait(remaining)
+                continue
+
+            train, self.pulses = self.pulses, []
+            return train
+
+    def accept_coin(self, train):
+        value = len(train)
+        self.counter += value
+        self.coin_accepted.emit(value, train[-1])
+        self.counter_changed.emit(self.counter)
+
+    def stop(self):
+        """
+        Stops the thread, which releases the coin slot as it ends; wait() for
+        it before opening the slot again.
+        """
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
@@ -0,0 +1,35 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+# Data sources that screens can follow
+FORMS = "forms"
+PRINT_RESULTS = "print_results"
+
+
+class DataChanges(QObject):
+    """
+    Notifications of changes to the kiosk's data.
+
+    Code that writes to a table calls notify() with its source once the
+    change is committed, and every screen showing that data receives
+    changed(source) and refreshes only what depends on it. Settings have
+    their own notifications (see kiosk_settings.py).
+    """
+
+    changed = pyqtSignal(str)
+
+    def notify(self, source):
+        self.changed.emit(source)
+
+
+_changes = None
+
+
+def get_data_changes():
+    """
+    Returns the shared DataChanges, creating it on first use.
+    """
+    global _changes
+    if _changes is None:
+        _changes = DataChanges()
+    return _changes
@@ -0,0 +1,154 @@
+import os
+import sys
+import time
+import sqlite3
+import threading
+import tracing
+
+
+DB_PATH = "./database/kiosk.db"
+
+# Applied once to every connection when it is opened
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -8000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 67108864",
+)
+
+# Size of each connection's prepared statement cache. sqlite3 keeps compiled
+# statements keyed by their SQL text for as long as the connection lives.
+CACHED_STATEMENTS = 256
+
+_local = threading.local()
+
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def _call_site(depth):
+    frame = sys._getframe(depth + 1)
+    filename = os.path.basename(frame.f_code.co_filename)
+    return f"{filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+def _record(call_site, start):
+    elapsed = time.perf_counter() - start
+    if tracing.enabled:
+        tracing.record(f"sqlite.{call_site}", start, elapsed)
+    with _stats_lock:
+        stats = _stats.get(call_site)
+        if stats is None:
+            _stats[call_site] = [1, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+
+
+class TimedCursor(sqlite3.Cursor):
+    """
+    Cursor that records the number of queries and the time spent in them
+    against the line of code that issued them.
+    """
+
+    def execute(self, sql, parameters=()):
+        call_site = _call_site(1)
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            _record(call_site, start)
+
+    def executemany(self, sql, seq_of_parameters):
+        call_site = _call_site(1)
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            _record(call_site, start)
+
+
+class KioskConnection(sqlite3.Connection):
+    """
+    Long-lived connection whose cursors are TimedCursors.
+    """
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    # Connection.execute() shortcuts are timed here rather than by the cursor
+    # so that the caller's line is recorded
+    def execute(self, sql, parameters=()):
+        call_site = _call_site(1)
+        start = time.perf_counter()
+        try:
+            return super().cursor().execute(sql, parameters)
+        finally:
+            _record(call_site, start)
+
+    def executemany(self, sql, seq_of_parameters):
+        call_site = _call_site(1)
+        start = time.perf_counter()
+        try:
+            return super().cursor().executemany(sql, seq_of_parameters)
+        finally:
+            _record(call_site, start)
+
+
+def connect(db_path=DB_PATH):
+    """
+    Returns the calling thread's connection to db_path, opening it and
+    applying PRAGMAS the first time. The connection stays open for the life
+    of the thread, so callers must not close it.
+    """
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(
+            db_path, factory=KioskConnection, cached_statements=CACHED_STATEMENTS
+        )
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        connections[db_path] = conn
+    return conn
+
+
+def cursor(db_path=DB_PATH):
+    """
+    Returns a new cursor on the calling thread's connection.
+    """
+    return connect(db_path).cursor()
+
+
+def close(db_path=DB_PATH):
+    """
+    Closes the calling thread's connection to db_path, if it has one.
+    """
+    connections = getattr(_local, "connections", {})
+    conn = connections.pop(db_path, None)
+    if conn is not None:
+        conn.close()
+
+
+def query_stats():
+    """
+    Returns (call site, queries, seconds) for every call site that ran a
+    query, slowest first.
+    """
+    with _stats_lock:
+        stats = [(site, count, seconds) for site, (count, seconds) in _stats.items()]
+    return sorted(stats, key=lambda stat: stat[2], reverse=True)
+
+
+def reset_query_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def print_query_stats():
+    for site, count, seconds in query_stats():
+        print(f"{seconds * 1000:10.2f} ms {count:8d} queries  {site}")
@@ -0,0 +1,127 @@
+import sys
+import time
+import types
+import threading
+
+
+# IPP printer-state values
+PRINTER_IDLE = 3
+PRINTER_PROCESSING = 4
+PRINTER_STOPPED = 5
+
+# IPP job-state values
+JOB_PENDING = 3
+JOB_PROCESSING = 5
+JOB_ABORTED = 8
+JOB_COMPLETED = 9
+
+
+class IPPError(Exception):
+    pass
+
+
+class FakeCupsServer:
+    """
+    In-memory stand-in for a CUPS daemon, used to exercise the printing code
+    without a printer. Jobs move from pending to processing to completed (or
+    aborted) on a timeline measured from when they were submitted.
+    """
+
+    def __init__(
+        self,
+        printers=None,
+        first_job_id=1,
+        pending_time=0.05,
+        job_duration=0.5,
+        fail_jobs=False,
+    ):
+        if printers is None:
+            printers = {"Fake_Printer": PRINTER_IDLE}
+        self.printer_states = dict(printers)
+        self.next_job_id = first_job_id
+        self.pending_time = pending_time
+        self.job_duration = job_duration
+        self.fail_jobs = fail_jobs
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.calls = 0
+
+    def connection(self):
+        return FakeCupsConnection(self)
+
+    def add_job(self, job_id, submitted_at=None, duration=None, fail=None):
+        """
+        Adds a job with a fixed id, e.g. to set up look-alike job ids.
+        """
+        with self.lock:
+            self.jobs[job_id] = {
+                "submitted_at": time.perf_counter() if submitted_at is None else submitted_at,
+                "duration": self.job_duration if duration is None else duration,
+                "fail": self.fail_jobs if fail is None else fail,
+            }
+            self.next_job_id = max(self.next_job_id, job_id + 1)
+
+    def finish_time(self, job_id):
+        """
+        Returns when the job reaches its final state.
+        """
+        job = self.jobs[job_id]
+        return job["submitted_at"] + self.pending_time + job["duration"]
+
+    def job_state(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise IPPError(f"client-error-not-found: job {job_id}")
+
+        elapsed = time.perf_counter() - job["submitted_at"]
+        if elapsed < self.pending_time:
+            return JOB_PENDING
+        if elapsed < self.pending_time + job["duration"]:
+            return JOB_PROCESSING
+        return JOB_ABORTED if job["fail"] else JOB_COMPLETED
+
+
+class FakeCupsConnection:
+    """
+    Implements the subset of cups.Connection used by the kiosk.
+    """
+
+    def __init__(self, server):
+        self.server = server
+
+    def getPrinters(self):
+        with self.server.lock:
+            self.server.calls += 1
+            return {
+                name: {"printer-state": state, "printer-info": name}
+                for name, state in self.server.printer_states.items()
+            }
+
+    def printFile(self, printer, filename, title, options):
+        with self.server.lock:
+            self.server.calls += 1
+            if printer not in self.server.printer_states:
+                raise IPPError(f"client-error-not-found: printer {printer}")
+            job_id = self.server.next_job_id
+        self.server.add_job(job_id)
+        return job_id
+
+    def getJobAttributes(self, job_id, requested_attributes=None):
+        with self.server.lock:
+            self.server.calls += 1
+            return {"job-id": job_id, "job-state": self.server.job_state(job_id)}
+
+
+def install_module(server=None):
+    """
+    Registers a `cups` module backed by a FakeCupsServer, so code that
+    imports cups (cups_connection) talks to the fake server. Returns the
+    server.
+    """
+    if server is None:
+        server = FakeCupsServer()
+    module = types.ModuleType("cups")
+    module.Connection = server.connection
+    module.IPPError = IPPError
+    sys.modules["cups"] = module
+    return server
@@ -0,0 +1,220 @@
+"""
+The kiosk's forms, read once and kept in memory for the form list.
+"""
+
+from collections import namedtuple
+from PyQt5.QtCore import (
+    QAbstractListModel,
+    QAbstractProxyModel,
+    QModelIndex,
+    QObject,
+    Qt,
+    pyqtSignal,
+)
+import database
+from data_changes import get_data_changes, FORMS
+
+
+Form = namedtuple("Form", "id name pages description category")
+
+# Item data role of the Form of a row in FormListModel
+FormRole = Qt.UserRole + 1
+
+
+class FormCatalog(QObject):
+    """
+    In-memory copy of kiosk_forms with an index of the forms by category.
+
+    The forms are read once and again only when the forms change (see
+    data_changes.py), after which catalog_changed is emitted. Categories
+    come from kiosk_form_categories in their navigation order, followed by
+    any category a form uses that is not listed there.
+    """
+
+    catalog_changed = pyqtSignal()
+
+    def __init__(self, db_path=database.DB_PATH):
+        super().__init__()
+        self.db_path = db_path
+        self.forms = []
+        self.rows_by_id = {}
+        self.search_texts = []
+        self.form_ids = []
+        self.by_category = {}
+        self.categories = []
+        self.reload()
+        get_data_changes().changed.connect(self.on_data_changed)
+
+    def reload(self):
+        cursor = database.cursor(self.db_path)
+        cursor.execute(
+            """
+            SELECT id, form_name, number_of_pages, form_description, form_category
+            FROM kiosk_forms
+            ORDER BY id
+            """
+        )
+        self.forms = [Form(*row) for row in cursor.fetchall()]
+
+        cursor.execute("SELECT name, label FROM kiosk_form_categories ORDER BY position")
+        categories = cursor.fetchall()
+        cursor.close()
+
+        # Form id -> row, and category -> rows of its forms in self.forms
+        self.rows_by_id = {form.id: row for row, form in enumerate(self.forms)}
+        # Lower-cased title and description of every form, and its id, for
+        # searching
+        self.search_texts = [
+            f"{form.name}\n{form.description or ''}".casefold() for form in self.forms
+        ]
+        self.form_ids = [form.id for form in self.forms]
+        self.by_category = {}
+        for row, form in enumerate(self.forms):
+            self.by_category.setdefault(form.category, []).append(row)
+
+        listed = {name for name, _ in categories}
+        self.categories = categories + [
+            (category, category)
+            for category in self.by_category
+            if category not in listed
+        ]
+
+        self.catalog_changed.emit()
+
+    def on_data_changed(self, source):
+        if source == FORMS:
+            self.reload()
+
+    def rows_in(self, category):
+        """
+        Returns the rows of the forms in a category.
+        """
+        return self.by_category.get(category, [])
+
+
+_catalog = None
+
+
+def get_form_catalog():
+    """
+    Returns the shared FormCatalog, loading it on first use.
+    """
+    global _catalog
+    if _catalog is None:
+        _catalog = FormCatalog()
+    return _catalog
+
+
+class FormListModel(QAbstractListModel):
+    """
+    List model of the forms in a FormCatalog, reset when it changes.
+    """
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        catalog.catalog_changed.connect(self.on_catalog_changed)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.catalog.forms)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        form = self.catalog.forms[index.row()]
+        if role == Qt.DisplayRole:
+            return form.name
+        if role == FormRole:
+            return form
+        return None
+
+    def on_catalog_changed(self):
+        self.beginResetModel()
+        self.endResetModel()
+
+
+class CategoryFilterProxy(QAbstractProxyModel):
+    """
+    Shows the forms of one category, or all of them, optionally narrowed to
+    the results of a search.
+
+    The rows to show are taken from the catalog's indexes and kept as a
+    sorted list, and every change of filter resets the model once. Unlike
+    QSortFilterProxyModel, no Python code runs for the rows that are
+    filtered out, so typing into the search box stays fast with thousands
+    of forms.
+    """
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.category = None
+        self.search_ids = None
+        self.rows = []
+        # Source row -> proxy row
+        self.positions = {}
+        catalog.catalog_changed.connect(self.on_catalog_changed)
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        self.update_rows()
+
+    def set_category(self, category):
+        """
+        Filters on a category; None shows every form.
+        """
+        self.category = category
+        self.update_rows()
+
+    def set_search_ids(self, ids):
+        """
+        Shows only the forms with these ids; None shows every form.
+        """
+        self.search_ids = ids
+        self.update_rows()
+
+    def update_rows(self):
+        if self.category is None:
+            accepted = None
+        else:
+            accepted = set(self.catalog.rows_in(self.category))
+        if self.search_ids is not None:
+            rows_by_id = self.catalog.rows_by_id
+            found = {rows_by_id[id] for id in self.search_ids if id in rows_by_id}
+            accepted = found if accepted is None else accepted & found
+
+        self.beginResetModel()
+        if accepted is None:
+            self.rows = list(range(len(self.catalog.forms)))
+        else:
+            self.rows = sorted(accepted)
+        self.positions = {row: position for position, row in enumerate(self.rows)}
+        self.endResetModel()
+
+    def on_catalog_changed(self):
+        # Rows moved, so the indexes are read again for the same filters
+        self.update_rows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self.rows)) or column != 0:
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        return self.sourceModel().index(self.rows[proxy_index.row()], 0)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid() or source_index.row() not in self.positions:
+            return QModelIndex()
+        return self.createIndex(self.positions[source_index.row()], 0)
@@ -0,0 +1,206 @@
+import queue
+import sqlite3
+from PyQt5.QtCore import QCoreApplication, QThread, pyqtSignal, pyqtSlot
+from helpers import (
+    upload_form_file,
+    edit_form_file,
+    upload_process_file,
+    edit_process_file,
+    delete_form_file,
+    delete_process_file,
+    delete_form_preview,
+)
+from preview_cache import get_preview_cache
+from data_changes import get_data_changes, FORMS
+import database
+import form_metadata
+import form_search
+import process_images
+
+
+class FormIngestQueue(QThread):
+    """
+    Background thread that uploads form files and renders their previews.
+
+    The admin screens queue a job and return at once; jobs run one at a time
+    in the order they were added. A form's row in kiosk_forms is only added
+    or updated once its job succeeded, so students never see a form whose
+    previews are not ready. job_progress(title, page, pages) is emitted after
+    every converted page and job_finished(title, ok) once a form is done.
+    """
+
+    job_progress = pyqtSignal(str, int, int)
+    job_finished = pyqtSignal(str, bool)
+    # Queued to the GUI thread with the form's row and its metadata
+    job_done = pyqtSignal(str, object, object)
+
+    def __init__(self):
+        super().__init__()
+        self.jobs = queue.Queue()
+        self.pending = 0
+        self.job_done.connect(self.on_job_finished)
+
+    def add_form(
+        self, file_path, process_path, form_title, form_description, form_category
+    ):
+        form = {
+            "id": None,
+            "form_name": form_title,
+            "form_description": form_description,
+            "form_category": form_category,
+        }
+        self.submit(
+            form_title, form, self.upload_form, (file_path, process_path, form_title)
+        )
+
+    def edit_form(
+        self,
+        file_path,
+        process_path,
+        form_id,
+        form_title,
+        form_name,
+        form_description,
+        form_category,
+    ):
+        form = {
+            "id": form_id,
+            "form_name": form_name,
+            "form_description": form_description,
+            "form_category": form_category,
+        }
+        self.submit(
+            form_title,
+            form,
+            self.replace_form,
+            (file_path, process_path, form_title, form_name),
+        )
+
+    def submit(self, form_title, form, function, args):
+        self.pending += 1
+        self.jobs.put((form_title, form, function, args))
+
+    def upload_form(self, file_path, process_path, form_title, progress):
+        metadata = upload_form_file(file_path, form_title, progress)
+        if metadata is None:
+            return None
+
+        upload_process_file(process_path, form_title)
+        # Scale the image for the View Process screen once, here
+        process_images.prepare_process(form_title)
+        return metadata
+
+    def replace_form(self, file_path, process_path, form_title, form_name, progress):
+        # The form's row keeps its old title until the job is done
+        known_hash = form_metadata.content_hash(form_name)
+        metadata = edit_form_file(
+            file_path, form_title, form_name, progress, known_hash
+        )
+        if metadata is None:
+            return None
+
+        edit_process_file(process_path, form_title, form_name)
+        process_images.prepare_process(form_title)
+        return metadata
+
+    def run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+
+            form_title, form, function, args = job
+            metadata = function(
+                *args,
+                progress=lambda page, pages: self.job_progress.emit(
+                    form_title, page, pages
+                ),
+            )
+            self.job_done.emit(form_title, form, metadata)
+
+    @pyqtSlot(str, object, object)
+    def on_job_finished(self, form_title, form, metadata):
+        self.pending -= 1
+        ok = metadata is not None
+        if ok:
+            try:
+                save_form(form_title, form, metadata)
+            except sqlite3.Error as e:
+                print("SQLite error:", e)
+                ok = False
+
+        if not ok and form["id"] is None:
+            discard_upload(form_title)
+
+        preview_cache = get_preview_cache()
+        preview_cache.invalidate(form_title)
+        process_images.forget_process(form_title)
+        if ok and form["form_name"] != form_title:
+            preview_cache.invalidate(form["form_name"])
+            process_images.discard_process(form["form_name"])
+
+        if ok:
+            get_data_changes().notify(FORMS)
+        self.job_finished.emit(form_title, ok)
+
+    def stop(self):
+        self.jobs.put(None)
+        self.wait()
+
+
+def save_form(form_title, form, metadata, db_path=database.DB_PATH):
+    """
+    Adds or updates a form's row, together with its metadata and search
+    index entry.
+    """
+    # Commits on success and rolls back on error
+    with database.connect(db_path) as conn:
+        if form["id"] is None:
+            cursor = conn.execute(
+                "INSERT INTO kiosk_forms (form_name, form_description, form_category) VALUES (?,?,?)",
+                (form_title, form["form_description"], form["form_category"]),
+            )
+            form_id = cursor.lastrowid
+        else:
+            form_id = form["id"]
+            conn.execute(
+                """
+                UPDATE kiosk_forms
+                SET form_name = ?, form_description = ?, form_category = ?
+                WHERE id = ?
+                """,
+                (form_title, form["form_description"], form["form_category"], form_id),
+            )
+        form_metadata.store(conn, form_title, metadata)
+        form_search.index_form(conn, form_id, form_title, form["form_description"])
+
+
+def discard_upload(form_title, db_path=database.DB_PATH):
+    # Files of a form that could not be added, unless a listed form owns them
+    cursor = database.cursor(db_path)
+    cursor.execute("SELECT 1 FROM kiosk_forms WHERE form_name = ?", (form_title,))
+    listed = cursor.fetchone() is not None
+    cursor.close()
+
+    if not listed:
+        delete_form_file(form_title)
+        delete_process_file(form_title)
+        process_images.discard_process(form_title)
+        delete_form_preview(form_title)
+
+
+_ingest_queue = None
+
+
+def get_ingest_queue():
+    """
+    Returns the shared FormIngestQueue, starting it on first use.
+    """
+    global _ingest_queue
+    if _ingest_queue is None:
+        _ingest_queue = FormIngestQueue()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(_ingest_queue.stop)
+        _ingest_queue.start()
+    return _ingest_queue
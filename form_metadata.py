@@ -0,0 +1,104 @@
+"""Form page counts, preview paths and content hashes kept in kiosk_forms."""
+
+import os
+import json
+import database
+import migrations
+from pdf2image import pdfinfo_from_path
+from helpers import form_metadata
+
+
+# Metadata columns, added by a migration (see migrations.py)
+COLUMNS = ("preview_paths", "content_hash")
+
+JSON_COLUMNS = ("preview_paths",)
+
+
+def store(conn, form_title, metadata):
+    """
+    Saves a form's metadata. number_of_pages is replaced by the real page
+    count of the PDF.
+    """
+    values = {
+        column: (
+            json.dumps(metadata[column]) if column in JSON_COLUMNS else metadata[column]
+        )
+        for column in COLUMNS
+    }
+
+    conn.execute(
+        f"""
+        UPDATE kiosk_forms
+        SET number_of_pages = ?, {", ".join(f"{column} = ?" for column in values)}
+        WHERE form_name = ?
+        """,
+        (metadata["number_of_pages"], *values.values(), form_title),
+    )
+
+
+def load(form_title, db_path=database.DB_PATH):
+    """
+    Returns a form's metadata, or None if none was stored.
+    """
+    cursor = database.cursor(db_path)
+    cursor.execute(
+        f"SELECT number_of_pages, {', '.join(COLUMNS)} FROM kiosk_forms "
+        "WHERE form_name = ?",
+        (form_title,),
+    )
+    row = cursor.fetchone()
+    cursor.close()
+
+    if row is None or row[-1] is None:
+        return None
+
+    metadata = {"number_of_pages": row[0]}
+    for column, value in zip(COLUMNS, row[1:]):
+        metadata[column] = json.loads(value) if column in JSON_COLUMNS else value
+    return metadata
+
+
+def content_hash(form_title, db_path=database.DB_PATH):
+    metadata = load(form_title, db_path)
+    return metadata["content_hash"] if metadata else None
+
+
+def backfill(db_path=database.DB_PATH):
+    """
+    Stores metadata for forms that have none, from their existing PDF and
+    previews. Nothing is converted.
+    """
+    migrations.migrate(db_path)
+    cursor = database.cursor(db_path)
+    cursor.execute("SELECT form_name FROM kiosk_forms WHERE content_hash IS NULL")
+    form_titles = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+
+    for form_title in form_titles:
+        pdf_path = f"./forms/{form_title}.pdf"
+        if not os.path.exists(pdf_path):
+            print(f"No file found for {form_title}.")
+            continue
+
+        try:
+            pages = pdfinfo_from_path(pdf_path)["Pages"]
+        except Exception as e:
+            print(f"Error reading {pdf_path}:", e)
+            continue
+
+        preview_paths = [
+            f"./img/form-preview/{form_title}-{page}.jpg"
+            for page in range(1, pages + 1)
+        ]
+        missing = [path for path in preview_paths if not os.path.exists(path)]
+        if missing:
+            print(f"{form_title} is missing {len(missing)} preview pages.")
+            continue
+
+        with database.connect(db_path) as conn:
+            store(conn, form_title, form_metadata(pdf_path, preview_paths))
+        print(f"{form_title}: {pages} pages")
+
+
+if __name__ == "__main__":
+    backfill()
@@ -0,0 +1,88 @@
+"""Full-text search over the titles and descriptions of the kiosk's forms."""
+
+import database
+
+
+# Trigram search needs at least three characters; shorter words are
+# matched against the texts the form catalog keeps in memory
+MIN_TERM_LENGTH = 3
+
+# Whether each database has the index; the migration skips it on SQLite
+# older than 3.34, which has no trigram tokenizer
+_has_index = {}
+
+
+def has_index(conn):
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'kiosk_forms_search'"
+    ).fetchone()
+    return row is not None
+
+
+def index_form(conn, form_id, form_name, form_description):
+    """
+    Adds a form to the index or replaces its entry. Call it on the
+    connection and inside the transaction that writes the form.
+    """
+    if not has_index(conn):
+        return
+    conn.execute("DELETE FROM kiosk_forms_search WHERE rowid = ?", (form_id,))
+    conn.execute(
+        "INSERT INTO kiosk_forms_search (rowid, form_name, form_description) VALUES (?, ?, ?)",
+        (form_id, form_name, form_description),
+    )
+
+
+def remove_form(conn, form_id):
+    if not has_index(conn):
+        return
+    conn.execute("DELETE FROM kiosk_forms_search WHERE rowid = ?", (form_id,))
+
+
+def match_expression(terms):
+    # Every term must appear, taken literally
+    return " AND ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def search(text, catalog, db_path=database.DB_PATH):
+    """
+    Returns the ids of the forms whose title or description contains every
+    word of text, ignoring case, or None if text has no words. Words too
+    short for the index, or every word if there is no index, are looked up
+    in the FormCatalog's search texts.
+    """
+    words = text.split()
+    if not words:
+        return None
+
+    if db_path not in _has_index:
+        _has_index[db_path] = has_index(database.connect(db_path))
+    if _has_index[db_path]:
+        long_terms = [word for word in words if len(word) >= MIN_TERM_LENGTH]
+    else:
+        long_terms = []
+    short_terms = [word.casefold() for word in words if word not in long_terms]
+
+    if long_terms:
+        cursor = database.cursor(db_path)
+        cursor.execute(
+            "SELECT rowid FROM kiosk_forms_search WHERE kiosk_forms_search MATCH ?",
+            (match_expression(long_terms),),
+        )
+        ids = {row[0] for row in cursor.fetchall()}
+        cursor.close()
+        if not short_terms:
+            return ids
+        candidates = [
+            (catalog.search_texts[row], catalog.forms[row].id)
+            for row in sorted(
+                catalog.rows_by_id[id] for id in ids if id in catalog.rows_by_id
+            )
+        ]
+    else:
+        candidates = zip(catalog.search_texts, catalog.form_ids)
+
+    # One pass per word over the forms still matching
+    for term in short_terms:
+        candidates = [(text, id) for text, id in candidates if term in text]
+    return {id for _, id in candidates}
@@ -1,7 +1,13 @@
 import os
 import glob
 import shutil
-from pdf2image import convert_from_path
+import hashlib
+import tempfile
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+
+# Resolution of the form previews (pdf2image's default)
+PREVIEW_DPI = 200
 
 
 def rename_file(destination_path, new_form_name):
@@ -20,7 +26,7 @@ def delete_form_file(form_name):
     if os.path.exists(destination_path):
         try:
             os.remove(destination_path)
-            print(f"File deleted successfully.")
+            print("File deleted successfully.")
         except OSError as e:
             print("Error deleting file:", e)
     else:
@@ -65,9 +71,11 @@ def delete_form_preview(form_name):
                 print(f"Error deleting file {file_path}: {e}")
 
 
-def upload_form_file(filepath, form_title):
+def upload_form_file(filepath, form_title, progress=None):
     """
     Uploads a form file to the 'forms' directory and converts it to JPEG.
+    progress(page, pages) is called after each converted page. Returns the
+    form's metadata, or None on failure.
     """
     destination_directory = "./forms"
     try:
@@ -91,15 +99,21 @@ def upload_form_file(filepath, form_title):
             destination_directory, f"{form_title}{file_extension}"
         )
         rename_file(destination_path, new_form_name)
-        convert_pdf_to_jpg(new_form_name, form_title)
+
+        preview_paths = convert_pdf_to_jpg(new_form_name, form_title, progress)
+        return form_metadata(new_form_name, preview_paths)
 
     except Exception as e:
         print("Error uploading file:", e)
+        return None
 
 
-def edit_form_file(filepath, form_title, form_name):
+def edit_form_file(filepath, form_title, form_name, progress=None, known_hash=None):
     """
-    Edits a form file by deleting old versions and uploading a new one.
+    Edits a form file by replacing the old version with a new one. When the
+    new file has the same content hash as the old one, the existing previews
+    are kept (and renamed along with the form) instead of being regenerated.
+    Returns the form's metadata, or None on failure.
     """
     destination_directory = "./forms"
     try:
@@ -113,8 +127,16 @@ def edit_form_file(filepath, form_title, form_name):
         file_extension = os.path.splitext(filename)[1]
         destination_path = os.path.join(destination_directory, filename)
 
+        old_form_path = os.path.join(
+            destination_directory, f"{form_name}{file_extension}"
+        )
+        if known_hash is not None and os.path.exists(old_form_path):
+            if file_hash(filepath) == known_hash:
+                metadata = rename_form(old_form_path, form_title, form_name)
+                if metadata is not None:
+                    return metadata
+
         delete_form_file(form_name)
-        delete_form_preview(form_name)
 
         shutil.copy(filepath, destination_path)
         print(f"File '{filename}' uploaded to '{destination_path}'")
@@ -123,10 +145,39 @@ def edit_form_file(filepath, form_title, form_name):
             destination_directory, f"{form_title}{file_extension}"
         )
         rename_file(destination_path, new_form_name)
-        convert_pdf_to_jpg(new_form_name, form_title)
+
+        # The old previews stay up until the new ones replace them
+        preview_paths = convert_pdf_to_jpg(new_form_name, form_title, progress)
+        if form_name != form_title:
+            delete_form_preview(form_name)
+        return form_metadata(new_form_name, preview_paths)
 
     except Exception as e:
         print("Error uploading file:", e)
+        return None
+
+
+def rename_form(form_path, form_title, form_name):
+    """
+    Renames an unchanged form file and its previews. Returns the form's
+    metadata, or None if some previews are missing.
+    """
+    pages = pdfinfo_from_path(form_path)["Pages"]
+    for page in range(1, pages + 1):
+        if not os.path.exists(f"./img/form-preview/{form_name}-{page}.jpg"):
+            return None
+
+    new_form_path = os.path.join(os.path.dirname(form_path), f"{form_title}.pdf")
+    os.replace(form_path, new_form_path)
+
+    preview_paths = []
+    for page in range(1, pages + 1):
+        preview_path = f"./img/form-preview/{form_title}-{page}.jpg"
+        os.replace(f"./img/form-preview/{form_name}-{page}.jpg", preview_path)
+        preview_paths.append(preview_path)
+
+    print(f"Form file unchanged, kept {pages} preview pages.")
+    return form_metadata(new_form_path, preview_paths)
 
 
 def upload_process_file(filepath, form_title):
@@ -190,13 +241,65 @@ def edit_process_file(filepath, form_title, form_name):
         print("Error uploading file:", e)
 
 
-def convert_pdf_to_jpg(pdf_path, form_title):
+def file_hash(path):
     """
-    Converts a PDF file to JPEG images.
+    Returns the SHA-256 hex digest of a file's content.
     """
-    destination_folder = "./img/form-preview"
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def form_metadata(pdf_path, preview_paths):
+    """
+    Collects what the kiosk stores about a form file in kiosk_forms.
+    """
+    return {
+        "number_of_pages": len(preview_paths),
+        "preview_paths": preview_paths,
+        "content_hash": file_hash(pdf_path),
+    }
 
-    pages = convert_from_path(pdf_path)
 
-    for i, page in enumerate(pages):
-        page.save(f"{destination_folder}/{form_title}-{i+1}.jpg", "JPEG")
+def convert_pdf_to_jpg(pdf_path, form_title, progress=None):
+    """
+    Converts a PDF file to JPEG images, one page at a time.
+
+    Each page is rendered by pdftoppm straight to a file in a scratch folder
+    inside the preview folder and then moved into place, so a preview is
+    never seen half written and no page is decoded in Python. Returns the
+    paths of the previews.
+    """
+    destination_folder = "./img/form-preview"
+
+    pages = pdfinfo_from_path(pdf_path)["Pages"]
+    preview_paths = []
+
+    with tempfile.TemporaryDirectory(dir=destination_folder) as scratch_folder:
+        for page in range(1, pages + 1):
+            (page_path,) = convert_from_path(
+                pdf_path,
+                dpi=PREVIEW_DPI,
+                first_page=page,
+                last_page=page,
+                fmt="jpeg",
+                output_folder=scratch_folder,
+                paths_only=True,
+                thread_count=1,
+            )
+            preview_path = f"{destination_folder}/{form_title}-{page}.jpg"
+            os.replace(page_path, preview_path)
+            preview_paths.append(preview_path)
+
+            if progress:
+                progress(page, pages)
+
+    # Drop pages left over from a longer previous version of the form
+    for file_path in glob.glob(f"{destination_folder}/{glob.escape(form_title)}-*.jpg"):
+        page_number = os.path.basename(file_path)[len(form_title) + 1 : -len(".jpg")]
+        if page_number.isdigit() and int(page_number) > pages:
+            os.remove(file_path)
+
+    return preview_paths
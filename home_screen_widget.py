@@ -6,8 +6,9 @@ from PyQt5.QtWidgets import (
     QLabel,
     QPushButton,
 )
-from PyQt5.QtCore import Qt, QTimer, QEvent, pyqtSignal
-from PyQt5.QtGui import QMovie, QPixmap
+from PyQt5.QtCore import Qt, QSize, QTimer, QEvent, pyqtSignal
+from PyQt5.QtGui import QMovie
+from assets import get_assets
 
 
 class UpperButton(QPushButton):
@@ -16,10 +17,7 @@ class UpperButton(QPushButton):
 
         layout = QHBoxLayout()
 
-        pixmap = QPixmap("./img/static/start_img.png")
-        scaled_pixmap = pixmap.scaled(
-            45, 45, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        scaled_pixmap = get_assets().static_pixmap("start_img.png", 45, 45)
 
         self.image_label = QLabel()
         self.image_label.setPixmap(scaled_pixmap)
@@ -49,10 +47,7 @@ class BottomButton(QPushButton):
 
         layout = QVBoxLayout()
 
-        pixmap = QPixmap(image_path)
-        scaled_pixmap = pixmap.scaled(
-            35, 35, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        scaled_pixmap = get_assets().pixmap(image_path, QSize(35, 35))
 
         self.image_label = QLabel()
         self.image_label.setPixmap(scaled_pixmap)
@@ -179,6 +174,10 @@ class HomeScreenWidget(QWidget):
             self.inactivity_timer.stop()
         self.inactivity_timer.start()
 
+    def reset(self):
+        # Called when the screen is shown again
+        self.reset_inactivity_timer()
+
     def go_back(self):
         self.inactivity_timer.stop()
         self.setVisible(False)
@@ -0,0 +1,318 @@
+"""Kinetic scrolling for the kiosk's touch screens."""
+
+import time
+from collections import deque
+from PyQt5.QtCore import (
+    QAbstractAnimation,
+    QEasingCurve,
+    QEvent,
+    QObject,
+    QPropertyAnimation,
+    Qt,
+    pyqtSignal,
+)
+from PyQt5.QtWidgets import QScrollArea, QScroller, QScrollerProperties
+
+
+# Pixels a press must move before it is a drag and not a tap
+DRAG_THRESHOLD = 10
+
+# Velocity is measured over the last part of a drag, in seconds
+VELOCITY_WINDOW = 0.1
+
+# Slowest release that starts a fling, and how fast a fling slows down,
+# in pixels per second and pixels per second squared
+MIN_FLING_VELOCITY = 150
+DECELERATION = 3000
+MAX_FLING_VELOCITY = 6000
+
+# Let QScroller drive gestures instead of KineticScroller's physics
+USE_QSCROLLER = False
+
+# Upper bounds of the frame histogram's buckets in milliseconds; 16.7 ms is a
+# frame at 60 Hz, and longer frames count as jank
+FRAME_BUCKETS_MS = (8, 17, 25, 33, 50, 100, float("inf"))
+JANK_MS = 25
+
+
+class FrameHistogram:
+    """
+    Histogram of frame times during scroll gestures, with the most recent
+    frames kept for percentiles.
+    """
+
+    def __init__(self, recent=2000):
+        self.counts = [0] * len(FRAME_BUCKETS_MS)
+        self.recent = deque(maxlen=recent)
+        self.jank = 0
+
+    def record(self, ms):
+        for bucket, bound in enumerate(FRAME_BUCKETS_MS):
+            if ms < bound:
+                self.counts[bucket] += 1
+                break
+        self.recent.append(ms)
+        if ms >= JANK_MS:
+            self.jank += 1
+
+    @property
+    def frames(self):
+        return sum(self.counts)
+
+    def percentile(self, percent):
+        if not self.recent:
+            return 0.0
+        times = sorted(self.recent)
+        return times[min(len(times) - 1, int(len(times) * percent / 100))]
+
+    def reset(self):
+        self.counts = [0] * len(FRAME_BUCKETS_MS)
+        self.recent.clear()
+        self.jank = 0
+
+    def summary(self):
+        """
+        Returns the histogram as lines of text.
+        """
+        lines = [
+            f"{self.frames} frames, {self.jank} over {JANK_MS} ms, "
+            f"p50 {self.percentile(50):.1f} ms, p95 {self.percentile(95):.1f} ms, "
+            f"p99 {self.percentile(99):.1f} ms"
+        ]
+        lower = 0
+        for bound, count in zip(FRAME_BUCKETS_MS, self.counts):
+            if bound == float("inf"):
+                label = f"{lower:>3}+     ms"
+            else:
+                label = f"{lower:>3}-{bound:<3} ms"
+            lines.append(f"{label} {count:>7}")
+            lower = bound
+        return "\n".join(lines)
+
+
+_histogram = None
+
+
+def get_frame_histogram():
+    """
+    Returns the FrameHistogram shared by every scroller.
+    """
+    global _histogram
+    if _histogram is None:
+        _histogram = FrameHistogram()
+    return _histogram
+
+
+class FrameClock(QAbstractAnimation):
+    """
+    Animation without an end that calls back on every animation frame.
+    """
+
+    def __init__(self, callback, parent=None):
+        super().__init__(parent)
+        self.callback = callback
+
+    def duration(self):
+        return -1
+
+    def updateCurrentTime(self, msecs):
+        self.callback()
+
+
+class KineticScroller(QObject):
+    """
+    Kinetic scrolling of a scroll area's vertical scroll bar.
+
+    Mouse events on the viewport are only watched, never consumed, so the
+    widgets in the scroll area still get their presses. drag_started is
+    emitted when a press turns into a drag, and `dragged` stays true until
+    the next press so a release can tell a tap from the end of a drag.
+    """
+
+    drag_started = pyqtSignal()
+
+    def __init__(self, scroll_area, use_qscroller=USE_QSCROLLER):
+        super().__init__(scroll_area)
+        self.scroll_area = scroll_area
+        self.scrollbar = scroll_area.verticalScrollBar()
+        self.histogram = get_frame_histogram()
+        self.clock = FrameClock(self.on_frame, self)
+        self.last_frame = None
+
+        self.press_y = None
+        self.press_value = None
+        self.dragged = False
+        self.target = None
+        self.samples = deque()
+
+        self.fling_start = None
+        self.fling_value = 0
+        self.fling_velocity = 0
+        self.fling_duration = 0
+
+        # Eased scroll to a position, as smoothScrollTo used to do
+        self.animation = QPropertyAnimation(self.scrollbar, b"value", self)
+        self.animation.setEasingCurve(QEasingCurve.OutQuad)
+        self.animation.setDuration(500)
+
+        viewport = scroll_area.viewport()
+        self.qscroller = None
+        if use_qscroller:
+            QScroller.grabGesture(viewport, QScroller.LeftMouseButtonGesture)
+            self.qscroller = QScroller.scroller(viewport)
+            properties = self.qscroller.scrollerProperties()
+            properties.setScrollMetric(
+                QScrollerProperties.HorizontalOvershootPolicy,
+                QScrollerProperties.OvershootAlwaysOff,
+            )
+            properties.setScrollMetric(
+                QScrollerProperties.VerticalOvershootPolicy,
+                QScrollerProperties.OvershootAlwaysOff,
+            )
+            self.qscroller.setScrollerProperties(properties)
+            self.qscroller.stateChanged.connect(self.on_qscroller_state)
+        else:
+            viewport.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
+            self.press(event.globalPos().y())
+        elif event.type() == QEvent.MouseMove and self.press_y is not None:
+            self.move(event.globalPos().y())
+        elif event.type() == QEvent.MouseButtonRelease and self.press_y is not None:
+            self.release(event.globalPos().y())
+        return False
+
+    def press(self, y):
+        self.stop()
+        self.press_y = y
+        self.press_value = self.scrollbar.value()
+        self.dragged = False
+        self.target = None
+        self.samples.clear()
+        self.samples.append((time.monotonic(), y))
+        self.start_clock()
+
+    def move(self, y):
+        now = time.monotonic()
+        self.samples.append((now, y))
+        while len(self.samples) > 2 and now - self.samples[0][0] > VELOCITY_WINDOW:
+            self.samples.popleft()
+
+        if not self.dragged and abs(y - self.press_y) > DRAG_THRESHOLD:
+            self.dragged = True
+            self.drag_started.emit()
+        if self.dragged:
+            # Applied on the next frame
+            self.target = self.press_value - (y - self.press_y)
+
+    def release(self, y):
+        self.move(y)
+        self.press_y = None
+        velocity = self.velocity() if self.dragged else 0
+        if abs(velocity) >= MIN_FLING_VELOCITY:
+            self.fling(velocity)
+        elif self.target is None:
+            self.stop_clock()
+
+    def velocity(self):
+        """
+        Scroll velocity at the end of the drag in pixels per second.
+        """
+        (first_time, first_y), (last_time, last_y) = self.samples[0], self.samples[-1]
+        if last_time - first_time <= 0:
+            return 0
+        velocity = -(last_y - first_y) / (last_time - first_time)
+        return max(-MAX_FLING_VELOCITY, min(MAX_FLING_VELOCITY, velocity))
+
+    def fling(self, velocity):
+        if self.target is not None:
+            self.scrollbar.setValue(self.target)
+            self.target = None
+        self.fling_start = time.monotonic()
+        self.fling_value = self.scrollbar.value()
+        self.fling_velocity = velocity
+        self.fling_duration = abs(velocity) / DECELERATION
+        self.start_clock()
+
+    def scroll_to(self, value):
+        """
+        Scrolls to value with an eased animation.
+        """
+        self.stop()
+        self.animation.setStartValue(self.scrollbar.value())
+        self.animation.setEndValue(value)
+        self.animation.start()
+
+    def stop(self):
+        self.animation.stop()
+        self.fling_start = None
+        self.target = None
+        self.stop_clock()
+
+    def start_clock(self):
+        if self.clock.state() != QAbstractAnimation.Running:
+            self.last_frame = None
+            self.clock.start()
+
+    def stop_clock(self):
+        self.clock.stop()
+        self.last_frame = None
+
+    def on_frame(self):
+        now = time.monotonic()
+        if self.last_frame is not None:
+            self.histogram.record((now - self.last_frame) * 1000)
+        self.last_frame = now
+
+        if self.qscroller is not None:
+            return
+
+        if self.target is not None:
+            self.scrollbar.setValue(self.target)
+            if self.press_y is None:
+                self.target = None
+                if self.fling_start is None:
+                    self.stop_clock()
+            return
+
+        if self.fling_start is not None:
+            elapsed = min(now - self.fling_start, self.fling_duration)
+            direction = 1 if self.fling_velocity > 0 else -1
+            distance = (
+                abs(self.fling_velocity) * elapsed - DECELERATION * elapsed**2 / 2
+            )
+            value = round(self.fling_value + direction * distance)
+            self.scrollbar.setValue(value)
+            at_end = value <= self.scrollbar.minimum() or value >= self.scrollbar.maximum()
+            if elapsed >= self.fling_duration or at_end:
+                self.fling_start = None
+                self.stop_clock()
+
+    def on_qscroller_state(self, state):
+        # Frames are only recorded; QScroller moves the scroll bar itself
+        if state == QScroller.Pressed:
+            self.dragged = False
+            self.start_clock()
+        elif state == QScroller.Dragging:
+            self.dragged = True
+            self.drag_started.emit()
+            self.start_clock()
+        elif state == QScroller.Inactive:
+            self.stop_clock()
+
+
+class SmoothScrollArea(QScrollArea):
+    """
+    Scroll area without scroll bars, scrolled by dragging its content.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(15)  # Set the scrolling step size
+        self.scroller = KineticScroller(self)
+
+    def smoothScrollTo(self, target_value):
+        self.scroller.scroll_to(target_value)
@@ -0,0 +1,110 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+import database
+
+
+# Column name -> type of every field kept from the kiosk_settings row
+FIELDS = {
+    "base_price": float,
+    "coins_left": int,
+    "bondpaper_quantity": int,
+    "ink_level": int,
+    "admin_password": str,
+}
+
+
+class KioskSettings(QObject):
+    """
+    In-memory copy of the single kiosk_settings row.
+
+    The row is read once and then served from memory. Changes made through
+    update() are written through to the database, and every change emits
+    settings_changed(field, value) so screens can refresh their labels
+    without querying again.
+    """
+
+    settings_changed = pyqtSignal(str, object)
+
+    def __init__(self, db_path=database.DB_PATH):
+        super().__init__()
+        self.db_path = db_path
+        self.values = {}
+        self.reload()
+
+    def reload(self):
+        """
+        Reads the settings row from the database.
+        """
+        cursor = database.cursor(self.db_path)
+        cursor.execute(f"SELECT {', '.join(FIELDS)} FROM kiosk_settings LIMIT 1")
+        row = cursor.fetchone()
+
+        self.refresh(**dict(zip(FIELDS, row)))
+
+    def update(self, **values):
+        """
+        Writes the given fields to the database and to the cached row.
+        """
+        assignments = ", ".join(f"{field} = ?" for field in values)
+        with database.connect(self.db_path) as conn:
+            conn.execute(
+                f"""
+                UPDATE kiosk_settings
+                SET {assignments}
+                WHERE ROWID = (
+                    SELECT ROWID
+                    FROM kiosk_settings
+                    ORDER BY ROWID
+                    LIMIT 1
+                )
+                """,
+                tuple(values.values()),
+            )
+
+        self.refresh(**values)
+
+    def refresh(self, **values):
+        """
+        Updates the cached row with values that are already in the database,
+        e.g. written by another transaction.
+        """
+        for field, value in values.items():
+            if field not in FIELDS:
+                raise KeyError(f"Unknown kiosk setting '{field}'")
+            if value is not None:
+                value = FIELDS[field](value)
+            if self.values.get(field) != value:
+                self.values[field] = value
+                self.settings_changed.emit(field, value)
+
+    @property
+    def base_price(self):
+        return self.values["base_price"]
+
+    @property
+    def coins_left(self):
+        return self.values["coins_left"]
+
+    @property
+    def bondpaper_quantity(self):
+        return self.values["bondpaper_quantity"]
+
+    @property
+    def ink_level(self):
+        return self.values["ink_level"]
+
+    @property
+    def admin_password(self):
+        return self.values["admin_password"]
+
+
+_settings = None
+
+
+def get_settings():
+    """
+    Returns the shared KioskSettings, loading it on first use.
+    """
+    global _settings
+    if _settings is None:
+        _settings = KioskSettings()
+    return _settings
@@ -1,5 +1,6 @@
 import sys
-import cups
+import importlib
+import threading
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -8,17 +9,40 @@ from PyQt5.QtWidgets import (
     QLabel,
     QDesktopWidget,
 )
-from PyQt5.QtCore import Qt, pyqtSlot
-from PyQt5.QtGui import QPixmap, QMovie
-from home_screen_widget import HomeScreenWidget
-from admin_login import AdminLoginWidget
-from admin_window import AdminWindowWidget
-from view_form import ViewFormWidget
-from print_preview import PrintPreviewWidget
-from view_process import ViewProcessWidget
-from view_controlled_process import ViewControlledProcessWidget
-from print_form import PrintFormWidget
-from about import AboutWidget
+from PyQt5.QtCore import Qt, QTimer, pyqtSlot
+from PyQt5.QtGui import QMovie
+from printer_monitor import get_printer_monitor
+from screen_router import ScreenRouter
+from assets import get_assets, asset_key, BACKGROUND_PATH, PRELOAD
+import migrations
+import tracing
+
+
+# Only MainWindow and the slideshow are loaded before the first frame. The
+# screen modules pull in pdf2image, PIL and the admin window, so each
+# factory imports its own module, and once the slideshow is up they are
+# imported in the background so that the first tap does not wait for them.
+SCREEN_MODULES = (
+    "home_screen_widget",
+    "view_form",
+    "print_preview",
+    "print_form",
+    "view_controlled_process",
+    "view_process",
+    "about",
+    "admin_login",
+    "admin_window",
+)
+
+# Milliseconds after the first frame before the screen modules are imported
+# and the static images decoded
+WARM_UP_DELAY = 500
+
+
+def import_screen_modules():
+    for module in SCREEN_MODULES:
+        with tracing.span(f"import.{module}"):
+            importlib.import_module(module)
 
 
 class MainWindow(QMainWindow):
@@ -32,8 +56,12 @@ class MainWindow(QMainWindow):
 
         self.setup_ui()
 
-        self.printer_state = None
-        self.is_printer_available()
+        # Follow printer availability from the shared printer monitor
+        self.printer_monitor = get_printer_monitor()
+        self.printer_state = self.printer_monitor.is_available
+        self.printer_monitor.availability_changed.connect(self.update_printer_state)
+
+        self.warm_up_thread = None
 
     def setup_ui(self):
         # Set up the main layout and initialize the slideshow
@@ -52,10 +80,38 @@ class MainWindow(QMainWindow):
         self.movie.finished.connect(self.movie.start)
 
         self.layout.addWidget(self.label)
+
+        # Screens are shown one at a time from a bounded pool
+        self.router = ScreenRouter(self.centralWidget)
+        self.register_screens()
+        self.layout.addWidget(self.router)
+        self.router.hide()
+
         self.setWindowFlag(Qt.FramelessWindowHint)
 
         self.resizeEvent(None)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.warm_up_thread is None:
+            self.warm_up_thread = threading.Thread(
+                target=import_screen_modules, name="screen-warm-up", daemon=True
+            )
+            QTimer.singleShot(WARM_UP_DELAY, self.warm_up)
+
+    def warm_up(self):
+        # Import the screens and decode their images while the slideshow plays
+        self.warm_up_thread.start()
+        background = asset_key(
+            BACKGROUND_PATH, self.background_size, Qt.IgnoreAspectRatio
+        )
+        get_assets().preload((background,) + PRELOAD)
+
+        # Cut the campus map's tiles now if the map is new or has changed
+        import process_images
+
+        process_images.map_tile_builder()
+
     def mousePressEvent(self, event):
         # Hide the slideshow on mouse click and show the home screen
         if self.label.isVisible():
@@ -71,178 +127,203 @@ class MainWindow(QMainWindow):
         if event:
             event.accept()
 
+    @tracing.traced("screen.go_back_to_slideshow")
     def go_back_to_slideshow(self):
         # Show the slideshow
+        self.router.hide()
         self.label.show()
         self.movie.start()
-        self.movie.finished.connect(self.movie.start)
 
-    def show_home_screen(self):
-        # Display the home screen and set up button connections
-        self.home_screen_widget = HomeScreenWidget(self)
-        self.layout.addWidget(self.home_screen_widget)
-        self.is_printer_available()
+    def register_screens(self):
+        # Each factory builds a screen and connects its signals once
+        self.router.register("home", self.create_home_screen)
+        self.router.register("about", self.create_about)
+        self.router.register("admin_login", self.create_admin_login)
+        self.router.register("admin_window", self.create_admin_window)
+        self.router.register("form_list", self.create_form_list)
+        self.router.register("print_preview", self.create_print_preview)
+        self.router.register("print_form", self.create_print_form)
+        self.router.register("view_process", self.create_view_process)
+        self.router.register("controlled_process", self.create_controlled_process)
+
+    def create_home_screen(self):
+        from home_screen_widget import HomeScreenWidget
+
+        home_screen_widget = HomeScreenWidget(self.router)
+        home_screen_widget.start_button_clicked.connect(self.show_form_list)
+        home_screen_widget.admin_button_clicked.connect(self.show_admin_login)
+        home_screen_widget.about_button_clicked.connect(self.show_about)
+        home_screen_widget.go_back_clicked.connect(self.go_back_to_slideshow)
+        return home_screen_widget
+
+    def create_about(self):
+        from about import AboutWidget
+
+        about_widget = AboutWidget(self.router)
+        about_widget.backbt_clicked.connect(self.show_home_screen)
+        return about_widget
+
+    def create_admin_login(self):
+        from admin_login import AdminLoginWidget
+
+        admin_login = AdminLoginWidget(self.router)
+        admin_login.login_clicked.connect(self.show_admin_window)
+        admin_login.home_screen_backbt_clicked.connect(self.show_home_screen)
+        return admin_login
+
+    def create_admin_window(self, printer_state):
+        from admin_window import AdminWindowWidget
+
+        admin_window = AdminWindowWidget(self.router, printer_state)
+        admin_window.home_screen_backbt_clicked.connect(self.show_home_screen)
+        return admin_window
+
+    def create_form_list(self, printer_state):
+        from view_form import ViewFormWidget
+
+        view_form = ViewFormWidget(self.router, printer_state)
+        view_form.view_button_clicked.connect(self.show_print_preview)
+        view_form.view_process_button_clicked.connect(self.show_controlled_process)
+        view_form.go_back_clicked.connect(self.show_home_screen)
+        return view_form
+
+    def create_print_preview(
+        self, title, page_number, printer_status, bondpaper_status, ink_status
+    ):
+        from print_preview import PrintPreviewWidget
 
-        self.home_screen_widget.show()
+        print_preview = PrintPreviewWidget(
+            self.router, title, page_number, printer_status, bondpaper_status, ink_status
+        )
+        print_preview.view_form_backbt_clicked.connect(self.show_form_list)
+        print_preview.view_process_clicked.connect(self.show_view_process)
+        print_preview.print_form_clicked.connect(self.show_print_form)
+        return print_preview
 
-        self.home_screen_widget.start_button_clicked.connect(self.show_form_list)
-        self.home_screen_widget.admin_button_clicked.connect(self.show_admin_login)
-        self.home_screen_widget.about_button_clicked.connect(self.show_about)
-        self.home_screen_widget.go_back_clicked.connect(self.go_back_to_slideshow)
+    def create_print_form(self, title, num_copy, num_pages, total):
+        from print_form import PrintFormWidget
 
-    def show_about(self):
-        # Display the about screen and set up back button connection
-        self.about_widget = AboutWidget(self)
-        self.layout.addWidget(self.about_widget)
+        print_form = PrintFormWidget(self.router, title, num_copy, num_pages, total)
+        print_form.cancel_clicked.connect(self.go_back_print_preview_print_form)
+        print_form.go_back_home.connect(self.go_back_to_slideshow)
+        return print_form
 
-        self.home_screen_widget.setVisible(False)
+    def create_view_process(self, title):
+        from view_process import ViewProcessWidget
 
-        self.about_widget.show()
+        view_process = ViewProcessWidget(self.router, title)
+        view_process.print_preview_backbt_clicked.connect(self.go_back_print_preview)
+        return view_process
 
-        self.about_widget.backbt_clicked.connect(self.show_home_screen)
+    def create_controlled_process(self, title):
+        from view_controlled_process import ViewControlledProcessWidget
 
-    def show_admin_login(self):
-        # Display the admin login screen and set up button connections
-        self.admin_login = AdminLoginWidget(self)
-        self.layout.addWidget(self.admin_login)
+        view_controlled_process = ViewControlledProcessWidget(self.router, title)
+        view_controlled_process.backbt_clicked.connect(self.show_form_list)
+        return view_controlled_process
 
-        self.home_screen_widget.setVisible(False)
+    @tracing.traced("screen.show_home_screen")
+    def show_home_screen(self):
+        # Display the home screen
+        self.load_background_image()
+        self.printer_monitor.refresh()
+        self.router.show()
+        self.router.show_screen("home")
 
-        self.admin_login.show()
+    @tracing.traced("screen.show_about")
+    def show_about(self):
+        # Display the about screen
+        self.router.show_screen("about")
 
-        self.admin_login.login_clicked.connect(self.show_admin_window)
-        self.admin_login.home_screen_backbt_clicked.connect(self.show_home_screen)
+    @tracing.traced("screen.show_admin_login")
+    def show_admin_login(self):
+        # Display the admin login screen
+        self.router.show_screen("admin_login")
 
+    @tracing.traced("screen.show_admin_window")
     def show_admin_window(self):
-        # Display the admin window and set up back button connection
-        self.admin_window = AdminWindowWidget(self, self.printer_state)
-        self.layout.addWidget(self.admin_window)
-
-        self.admin_login.setVisible(False)
-
-        self.admin_window.show()
-
-        self.admin_window.home_screen_backbt_clicked.connect(self.show_home_screen)
+        # Display the admin window
+        self.router.show_screen("admin_window", self.printer_state)
 
+    @tracing.traced("screen.show_form_list")
     def show_form_list(self):
-        # Display the form list and set up button connections
-        self.view_form = ViewFormWidget(self, self.printer_state)
-        self.layout.addWidget(self.view_form)
-
-        self.home_screen_widget.setVisible(False)
-
-        self.view_form.show()
-        self.view_form.view_button_clicked.connect(self.show_print_preview)
-        self.view_form.view_process_button_clicked.connect(self.show_controlled_process)
-        self.view_form.go_back_clicked.connect(self.show_home_screen)
+        # Display the form list
+        self.router.show_screen("form_list", self.printer_state)
 
     @pyqtSlot(str, int, bool, bool, bool)
+    @tracing.traced("screen.show_print_preview")
     def show_print_preview(
         self, title, page_number, printer_status, bondpaper_status, ink_status
     ):
-        # Display the print preview and set up button connections
-        self.print_preview = PrintPreviewWidget(
-            self, title, page_number, printer_status, bondpaper_status, ink_status
+        # Display the print preview
+        self.router.show_screen(
+            "print_preview",
+            title,
+            page_number,
+            printer_status,
+            bondpaper_status,
+            ink_status,
         )
-        self.layout.addWidget(self.print_preview)
-
-        self.view_form.setVisible(False)
-
-        self.print_preview.show()
-        self.print_preview.view_form_backbt_clicked.connect(self.show_form_list)
-        self.print_preview.view_process_clicked.connect(self.show_view_process)
-        self.print_preview.print_form_clicked.connect(self.show_print_form)
 
     @pyqtSlot(str, int, int, int)
+    @tracing.traced("screen.show_print_form")
     def show_print_form(self, title, num_copy, num_pages, total):
-        # Display the print form and set up button connections
-        self.print_form = PrintFormWidget(self, title, num_copy, num_pages, total)
-        self.layout.addWidget(self.print_form)
-
-        self.print_preview.setVisible(False)
-
-        self.print_form.show()
-
-        self.print_form.cancel_clicked.connect(self.go_back_print_preview_print_form)
-        self.print_form.go_back_home.connect(self.go_back_to_slideshow)
+        # Display the print form
+        self.router.show_screen("print_form", title, num_copy, num_pages, total)
 
     @pyqtSlot(str)
+    @tracing.traced("screen.show_view_process")
     def show_view_process(self, title):
-        # Display the view process screen and set up back button connection
-        self.view_process = ViewProcessWidget(self, title)
-        self.layout.addWidget(self.view_process)
-
-        self.print_preview.setVisible(False)
-
-        self.view_process.show()
-        self.view_process.print_preview_backbt_clicked.connect(
-            self.go_back_print_preview
-        )
+        # Display the view process screen
+        self.router.show_screen("view_process", title)
 
     @pyqtSlot(str)
+    @tracing.traced("screen.show_controlled_process")
     def show_controlled_process(self, title):
-        # Display the view process screen and set up back button connection
-        self.view_controlled_process = ViewControlledProcessWidget(self, title)
-        self.layout.addWidget(self.view_controlled_process)
-
-        self.view_form.setVisible(False)
-
-        self.view_controlled_process.show()
-        self.view_controlled_process.backbt_clicked.connect(
-            self.show_form_list
-        )
+        # Display the view process screen for controlled forms
+        self.router.show_screen("controlled_process", title)
 
+    @tracing.traced("screen.go_back_print_preview")
     def go_back_print_preview(self):
         # Go back to the print preview
-        self.print_preview.show()
+        self.router.restore("print_preview")
 
+    @tracing.traced("screen.go_back_print_preview_print_form")
     def go_back_print_preview_print_form(self):
         # Go back to the print preview from print form
-        self.print_preview.show()
-
-    def is_printer_available(self):
-        # Check if an idle printer is available
-        try:
-            conn = cups.Connection()
-            printers = conn.getPrinters()
-
-            if not printers:
-                self.printer_state = False
-                raise Exception("No printers available.")
-
-            idle_printer_found = False
-            for printer_name, printer_attributes in printers.items():
-                if (
-                    "printer-state" in printer_attributes
-                    and printer_attributes["printer-state"] == 3
-                ):
-                    idle_printer_found = True
-                    self.printer_state = True
-                    break
-
-            if not idle_printer_found:
-                self.printer_state = False
-                raise Exception("No idle printer available")
-
-        except Exception as e:
-            print("Error during printing:", e)
+        self.router.restore("print_preview")
+
+    @pyqtSlot(bool)
+    def update_printer_state(self, is_available):
+        # Keep the last printer availability reported by the printer monitor
+        self.printer_state = is_available
 
     def set_background_image(self):
-        # Set the background image to the screen resolution
+        # Cover the screen with the background. The slideshow hides it until
+        # the home screen is first shown, so the image is only loaded then.
         screen_resolution = QDesktopWidget().screenGeometry()
-        pixmap = QPixmap("./img/background.jpg")
-        pixmap = pixmap.scaled(
-            screen_resolution.width(), screen_resolution.height(), Qt.IgnoreAspectRatio
-        )
-        background_label = QLabel(self)
-        background_label.setPixmap(pixmap)
-        background_label.setGeometry(
+        self.background_size = screen_resolution.size()
+        self.background_label = QLabel(self)
+        self.background_label.setGeometry(
             0, 0, screen_resolution.width(), screen_resolution.height()
         )
-        background_label.setScaledContents(True)
+        self.background_label.setScaledContents(True)
+
+    @tracing.traced("image.background")
+    def load_background_image(self):
+        # Set the background image, scaled to the screen resolution, from the
+        # shared asset cache
+        if self.background_label.pixmap() is None:
+            pixmap = get_assets().pixmap(
+                BACKGROUND_PATH, self.background_size, Qt.IgnoreAspectRatio
+            )
+            self.background_label.setPixmap(pixmap)
 
 
 if __name__ == "__main__":
+    # Bring the database schema up to date before any screen reads it
+    migrations.migrate()
+
     # Run the application
     app = QApplication(sys.argv)
     window = MainWindow()
@@ -0,0 +1,235 @@
+"""Versioned schema migrations for the kiosk database."""
+
+import sys
+import sqlite3
+import database
+
+
+# First SQLite with FTS5's trigram tokenizer
+TRIGRAM_SQLITE_VERSION = (3, 34, 0)
+
+
+def add_form_metadata(conn):
+    # Preview paths are a JSON list
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(kiosk_forms)")}
+    for column in ("preview_paths", "content_hash"):
+        if column not in existing:
+            conn.execute(f"ALTER TABLE kiosk_forms ADD COLUMN {column} TEXT")
+
+
+def add_sales_daily(conn):
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS kiosk_sales_daily (
+            day TEXT NOT NULL,
+            form_name TEXT NOT NULL,
+            result TEXT NOT NULL,
+            prints INTEGER NOT NULL DEFAULT 0,
+            copies INTEGER NOT NULL DEFAULT 0,
+            amount REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, result, form_name)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute("DELETE FROM kiosk_sales_daily")
+    # Jobs without a readable date are counted on 1970-01-01, the day
+    # type_print_results dates them to, so the totals match the print log
+    conn.execute(
+        """
+        INSERT INTO kiosk_sales_daily (day, form_name, result, prints, copies, amount)
+        SELECT COALESCE(date(date_printed), '1970-01-01'),
+               COALESCE(form_name, ''), COALESCE(result, ''),
+               COUNT(*), COALESCE(SUM(number_of_copies), 0),
+               COALESCE(SUM(total_amount), 0)
+        FROM kiosk_print_results
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def type_print_results(conn):
+    # The print log gets an integer key and the local "%Y-%m-%d %H:%M" text
+    # timestamp becomes Unix time, so reports compare plain integers. Jobs
+    # without a readable date are kept, dated 0 (the Unix epoch), so that
+    # their sales are not lost; add_sales_daily counts them on that day.
+    undated = conn.execute(
+        """
+        SELECT COUNT(*) FROM kiosk_print_results
+        WHERE strftime('%s', date_printed, 'utc') IS NULL
+        """
+    ).fetchone()[0]
+    conn.execute(
+        """
+        CREATE TABLE kiosk_print_results_new (
+            id INTEGER PRIMARY KEY,
+            printed_at INTEGER NOT NULL,
+            form_name TEXT,
+            number_of_copies INTEGER,
+            total_amount REAL,
+            result TEXT
+        )
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO kiosk_print_results_new
+            (printed_at, form_name, number_of_copies, total_amount, result)
+        SELECT COALESCE(CAST(strftime('%s', date_printed, 'utc') AS INTEGER), 0),
+               form_name, number_of_copies, total_amount, result
+        FROM kiosk_print_results
+        ORDER BY date_printed
+        """
+    )
+    if undated:
+        print(f"Dated {undated} print jobs without a readable date to 1970-01-01")
+    conn.execute("DROP TABLE kiosk_print_results")
+    conn.execute("ALTER TABLE kiosk_print_results_new RENAME TO kiosk_print_results")
+
+    # Covering indexes for the reports by period and by form
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_print_results_date_result
+        ON kiosk_print_results (printed_at, result, total_amount)
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_print_results_form_date
+        ON kiosk_print_results (form_name, printed_at, number_of_copies)
+        """
+    )
+
+
+def add_form_categories(conn):
+    # Categories of the form list in the order of its navigation bar, with
+    # the label shown on their buttons
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS kiosk_form_categories (
+            name TEXT PRIMARY KEY,
+            label TEXT NOT NULL,
+            position INTEGER NOT NULL
+        ) WITHOUT ROWID
+        """
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO kiosk_form_categories VALUES (?, ?, ?)",
+        [
+            ("Accreditation", "Accreditation", 1),
+            ("Clearance", "Clearance", 2),
+            ("Enrollment", "Enrollment", 3),
+            ("Graduation", "Graduation", 4),
+            ("Petition", "Petition", 5),
+            ("Research", "Research", 6),
+            ("Controlled Forms", "Controlled Forms", 7),
+            ("Other", "Others", 8),
+        ],
+    )
+
+
+def add_form_search(conn):
+    # Trigram index of the forms' titles and descriptions for the search
+    # box of the form list, keyed by the form's id (see form_search.py).
+    # Without it, the search matches every word in memory.
+    if sqlite3.sqlite_version_info < TRIGRAM_SQLITE_VERSION:
+        print(f"SQLite {sqlite3.sqlite_version} has no trigram tokenizer, skipping")
+        return
+    conn.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS kiosk_forms_search
+        USING fts5(form_name, form_description, tokenize = 'trigram')
+        """
+    )
+    conn.execute("DELETE FROM kiosk_forms_search")
+    conn.execute(
+        """
+        INSERT INTO kiosk_forms_search (rowid, form_name, form_description)
+        SELECT id, form_name, form_description FROM kiosk_forms
+        """
+    )
+
+
+def add_print_history_indexes(conn):
+    # An index per sortable column of the admin print history, ending in id
+    # like its ORDER BY, so each page is read from where the last one ended
+    # (see print_history.py)
+    for column in (
+        "printed_at",
+        "form_name",
+        "number_of_copies",
+        "total_amount",
+        "result",
+    ):
+        conn.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_print_results_{column}_id
+            ON kiosk_print_results ({column}, id)
+            """
+        )
+
+
+def add_payment_journal(conn):
+    # Coins of the payment sessions (see payment_journal.py). Kiosks that
+    # ran before this migration already have the table.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS kiosk_payment_journal (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session TEXT NOT NULL,
+            amount INTEGER NOT NULL,
+            inserted_at REAL NOT NULL,
+            settled INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+
+
+# (version, migration) in the order they are applied. Append new migrations
+# with the next version number; never change one that has shipped.
+MIGRATIONS = (
+    (1, add_form_metadata),
+    (2, add_sales_daily),
+    (3, type_print_results),
+    (4, add_form_categories),
+    (5, add_form_search),
+    (6, add_print_history_indexes),
+    (7, add_payment_journal),
+)
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(db_path=database.DB_PATH):
+    return database.connect(db_path).execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(db_path=database.DB_PATH):
+    """
+    Applies the pending migrations. Returns the versions that were applied.
+    """
+    conn = database.connect(db_path)
+    applied = []
+
+    for version, migration in MIGRATIONS:
+        if version <= schema_version(db_path):
+            continue
+
+        # Commits the migration and the new version together
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Another process may have migrated while this one waited
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= version:
+                continue
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+
+        print(f"Applied migration {version}: {migration.__name__}")
+        applied.append(version)
+
+    return applied
+
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else database.DB_PATH
+    migrate(db_path)
+    print(f"Schema version {schema_version(db_path)}")
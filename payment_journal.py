@@ -0,0 +1,116 @@
+import time
+import uuid
+import sqlite3
+import threading
+import database
+
+
+# How often (in seconds) recorded pulses are group-committed to the journal
+FLUSH_INTERVAL = 0.25
+
+
+class PaymentJournal:
+    """
+    Append-only journal of coins inserted during a payment session.
+
+    The flusher thread and the caller each use their own thread's connection
+    from the database module, which opens it in WAL mode.
+
+    Coins are recorded in memory and group-committed to the
+    kiosk_payment_journal table (see migrations.py) every FLUSH_INTERVAL
+    seconds, so a coin costs at most one commit instead of one per pulse.
+    kiosk_settings.coins_left is only touched when the session is settled;
+    until then the unsettled journal rows hold the balance, which lets
+    replay() restore coins_left after a power cut.
+    """
+
+    def __init__(self, db_path=database.DB_PATH, flush_interval=FLUSH_INTERVAL):
+        self.db_path = db_path
+        self.session = uuid.uuid4().hex
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.pending = []
+        self.commits = 0
+        self.closed = False
+
+        self.stop_event = threading.Event()
+        self.flusher = threading.Thread(target=self.run_flusher, daemon=True)
+        self.flusher.start()
+
+    def record(self, amount, timestamp=None):
+        """
+        Records a coin in memory. It is written on the next flush.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        with self.lock:
+            self.pending.append((self.session, amount, timestamp))
+
+    def run_flusher(self):
+        while not self.stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all recorded coins to the journal in a single transaction.
+        """
+        with self.lock:
+            if not self.pending:
+                return
+            batch, self.pending = self.pending, []
+            try:
+                with database.connect(self.db_path) as conn:
+                    conn.executemany(
+                        "INSERT INTO kiosk_payment_journal (session, amount, inserted_at) VALUES (?, ?, ?)",
+                        batch,
+                    )
+                self.commits += 1
+            except sqlite3.Error as e:
+                # Keep the coins so the next flush can retry them
+                self.pending = batch + self.pending
+                print(f"Error writing payment journal: {e}")
+
+    def settle(self):
+        """
+        Folds every unsettled journal entry into coins_left and returns the
+        resulting balance.
+        """
+        self.flush()
+        with self.lock:
+            with database.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT COALESCE(SUM(amount), 0) FROM kiosk_payment_journal WHERE settled = 0"
+                )
+                unsettled = cursor.fetchone()[0]
+                if unsettled:
+                    cursor.execute(
+                        "UPDATE kiosk_settings SET coins_left = coins_left + ?",
+                        (unsettled,),
+                    )
+                    cursor.execute(
+                        "UPDATE kiosk_payment_journal SET settled = 1 WHERE settled = 0"
+                    )
+                cursor.execute("SELECT coins_left FROM kiosk_settings LIMIT 1")
+                coins_left = cursor.fetchone()[0]
+            self.commits += 1
+        return coins_left
+
+    def replay(self):
+        """
+        Restores coins_left from entries left unsettled by an interrupted
+        session and returns it.
+        """
+        return self.settle()
+
+    def close(self):
+        """
+        Settles the session and stops the flusher. Safe to call more than once.
+        """
+        if self.closed:
+            return self.coins_left
+        self.closed = True
+        self.stop_event.set()
+        self.flusher.join()
+        self.coins_left = self.settle()
+        return self.coins_left
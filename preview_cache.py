@@ -0,0 +1,225 @@
+from collections import OrderedDict
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor, QImage, QPainter, QPixmap
+import form_metadata
+import tracing
+
+
+PREVIEW_PATH = "./img/form-preview/{title}-{index}.jpg"
+
+# Display size and corner radius of the page shown by the print preview
+PREVIEW_WIDTH = 700
+PREVIEW_HEIGHT = 830
+PREVIEW_RADIUS = 20
+
+# Bytes of decoded pixmaps kept in memory. A 641x830 page is about 2 MB.
+MEMORY_BUDGET = 48 * 1024 * 1024
+
+# Pages rendered at once in the background
+PREFETCH_THREADS = 2
+
+
+@tracing.traced("image.preview")
+def render_preview(path):
+    """
+    Loads a form page, scales it to display size and rounds its corners.
+    Only uses QImage, so it is safe to call from a worker thread.
+    """
+    image = (
+        QImage(path)
+        .scaledToWidth(PREVIEW_WIDTH, Qt.SmoothTransformation)
+        .scaledToHeight(PREVIEW_HEIGHT, Qt.SmoothTransformation)
+    )
+    if image.isNull():
+        return image
+
+    # Create a mask image with the desired border radius
+    mask = QImage(image.size(), QImage.Format_ARGB32)
+    mask.fill(Qt.transparent)
+
+    painter = QPainter(mask)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.setBrush(QBrush(QColor(Qt.white)))
+    painter.setPen(Qt.NoPen)
+    painter.drawRoundedRect(image.rect(), PREVIEW_RADIUS, PREVIEW_RADIUS)
+    painter.end()
+
+    # Apply the mask to the image
+    image.setAlphaChannel(mask)
+    return image
+
+
+def pixmap_bytes(pixmap):
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+class PrefetchJob(QRunnable):
+    def __init__(self, cache, title, index, path, generation):
+        super().__init__()
+        self.cache = cache
+        self.title = title
+        self.index = index
+        self.path = path
+        self.generation = generation
+
+    def run(self):
+        image = render_preview(self.path)
+        # Queued to the GUI thread, where the pixmap is made
+        self.cache.image_rendered.emit(
+            self.title, self.index, self.generation, image
+        )
+
+
+class PreviewCache(QObject):
+    """
+    LRU cache of form preview pages as ready-to-show pixmaps.
+
+    Pages are decoded, scaled and masked in worker threads as QImages and
+    turned into QPixmaps on the GUI thread, so that swiping to a prefetched
+    page only swaps a pixmap. The oldest pages are dropped once the cached
+    pixmaps exceed the memory budget.
+
+    Each invalidate() of a form starts a new generation of it, and pages
+    rendered for an older one are dropped when they arrive.
+    """
+
+    image_rendered = pyqtSignal(str, int, int, QImage)
+    preview_ready = pyqtSignal(str, int)
+
+    def __init__(self, memory_budget=MEMORY_BUDGET, threads=PREFETCH_THREADS):
+        super().__init__()
+        self.memory_budget = memory_budget
+        self.pixmaps = OrderedDict()
+        self.size = 0
+        # Stored metadata of each form, see form_metadata.load()
+        self.metadata = {}
+        self.pending = set()
+        self.generations = {}
+        self.hits = 0
+        self.misses = 0
+
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(threads)
+        self.image_rendered.connect(self.on_image_rendered)
+
+    def load(self, title):
+        """
+        Returns a form's stored metadata, or None if it has none.
+        """
+        if title not in self.metadata:
+            self.metadata[title] = form_metadata.load(title)
+        return self.metadata[title]
+
+    def preview_path(self, title, index):
+        metadata = self.load(title)
+        if metadata is not None and index <= len(metadata["preview_paths"]):
+            return metadata["preview_paths"][index - 1]
+        # Forms added before their metadata was stored
+        return PREVIEW_PATH.format(title=title, index=index)
+
+    def get(self, title, index):
+        """
+        Returns the page's pixmap, rendering it now if it is not cached.
+        """
+        key = (title, index)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+            self.hits += 1
+            return pixmap
+
+        self.misses += 1
+        pixmap = QPixmap.fromImage(render_preview(self.preview_path(title, index)))
+        self.insert(key, pixmap)
+        return pixmap
+
+    def cached(self, title, index):
+        """
+        Returns the page's pixmap, or None if it is not cached.
+        """
+        key = (title, index)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+        return pixmap
+
+    def request(self, title, index):
+        """
+        Returns the page's pixmap if it is cached. Otherwise returns None and
+        renders it in the background; preview_ready is emitted once it is
+        done.
+        """
+        pixmap = self.cached(title, index)
+        if pixmap is not None:
+            self.hits += 1
+            return pixmap
+        self.misses += 1
+        self.prefetch(title, [index])
+        return None
+
+    def prefetch(self, title, indexes):
+        """
+        Renders the given pages in the background if they are not cached.
+        """
+        for index in indexes:
+            key = (title, index)
+            if key in self.pixmaps or key in self.pending:
+                continue
+            self.pending.add(key)
+            path = self.preview_path(title, index)
+            generation = self.generations.get(title, 0)
+            self.pool.start(PrefetchJob(self, title, index, path, generation))
+
+    def on_image_rendered(self, title, index, generation, image):
+        key = (title, index)
+        if generation != self.generations.get(title, 0):
+            # The form was invalidated while the page was rendering
+            return
+        self.pending.discard(key)
+        if key not in self.pixmaps:
+            self.insert(key, QPixmap.fromImage(image))
+        self.preview_ready.emit(title, index)
+
+    def insert(self, key, pixmap):
+        if pixmap.isNull():
+            # Missing pages are not cached so that they show up once added
+            return
+        self.pixmaps[key] = pixmap
+        self.size += pixmap_bytes(pixmap)
+        while self.size > self.memory_budget and len(self.pixmaps) > 1:
+            _, evicted = self.pixmaps.popitem(last=False)
+            self.size -= pixmap_bytes(evicted)
+
+    def invalidate(self, title):
+        """
+        Drops every cached page of a form, e.g. after its file was replaced.
+        """
+        for key in [key for key in self.pixmaps if key[0] == title]:
+            self.size -= pixmap_bytes(self.pixmaps.pop(key))
+        self.pending = {key for key in self.pending if key[0] != title}
+        self.metadata.pop(title, None)
+        self.generations[title] = self.generations.get(title, 0) + 1
+
+    def clear(self):
+        self.pixmaps.clear()
+        self.size = 0
+        self.metadata.clear()
+
+    def wait(self):
+        """
+        Blocks until the background renders are done.
+        """
+        self.pool.waitForDone()
+
+
+_cache = None
+
+
+def get_preview_cache():
+    """
+    Returns the shared PreviewCache, creating it on first use.
+    """
+    global _cache
+    if _cache is None:
+        _cache = PreviewCache()
+    return _cache
@@ -1,7 +1,3 @@
-import time
-import sqlite3
-from gpiozero import Button
-from threading import Event
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -11,10 +7,13 @@ from PyQt5.QtWidgets import (
     QFrame,
     QSpacerItem,
     QSizePolicy,
-    QGraphicsDropShadowEffect,
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QThread
+from PyQt5.QtCore import Qt, pyqtSignal
 from print_window import PrintMessageBox
+from coin_acceptor import CoinAcceptor
+from payment_journal import PaymentJournal
+from kiosk_settings import get_settings
+from shadows import ShadowEffect
 
 
 class PrintFormWidget(QWidget):
@@ -108,10 +107,11 @@ class PrintFormWidget(QWidget):
         )
 
         # Create a shadow effect for square1
-        shadow_effect1 = QGraphicsDropShadowEffect()
+        shadow_effect1 = ShadowEffect()
         shadow_effect1.setBlurRadius(50)
         shadow_effect1.setColor(Qt.gray)
         shadow_effect1.setOffset(0, 15)
+        shadow_effect1.setRadius(85)
 
         square1.setFixedSize(550, 550)
         square1.setGraphicsEffect(shadow_effect1)
@@ -166,10 +166,11 @@ class PrintFormWidget(QWidget):
         square2.setFixedSize(550, 550)
 
         # Create a shadow effect for square2
-        shadow_effect2 = QGraphicsDropShadowEffect()
+        shadow_effect2 = ShadowEffect()
         shadow_effect2.setBlurRadius(50)
         shadow_effect2.setColor(Qt.gray)
         shadow_effect2.setOffset(0, 15)
+        shadow_effect2.setRadius(85)
 
         square2.setGraphicsEffect(shadow_effect2)
 
@@ -191,10 +192,11 @@ class PrintFormWidget(QWidget):
             """
         )
 
-        shadow_effect = QGraphicsDropShadowEffect()
+        shadow_effect = ShadowEffect()
         shadow_effect.setBlurRadius(30)
         shadow_effect.setColor(Qt.gray)
         shadow_effect.setOffset(0, 12)
+        shadow_effect.setRadius(30)
 
         rectangle.setGraphicsEffect(shadow_effect)
 
@@ -271,27 +273,33 @@ class PrintFormWidget(QWidget):
         )
         layout.addLayout(rectangle_layout)
 
-        self.counter_thread = CounterThread(self.counter)
-        self.counter_thread.counter_changed.connect(self.update_counter)
-        self.counter_thread.start()
+        self.coin_acceptor = CoinAcceptor(self.counter)
+        self.coin_acceptor.counter_changed.connect(self.update_counter)
+        # Journal from the acceptor thread so no coin is lost when it stops
+        self.coin_acceptor.coin_accepted.connect(self.record_coin, Qt.DirectConnection)
+        self.coin_acceptor.start()
 
         self.check_total_counter_match()
 
     def connect_db(self):
         """
-        Connects to the database and retrieves the initial counter value.
+        Opens the payment journal and retrieves the initial counter value.
         """
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
+        self.journal = PaymentJournal()
 
-        cursor.execute("SELECT coins_left FROM kiosk_settings LIMIT 1")
-        self.coins_left = cursor.fetchone()[0]
-
-        conn.close()
+        # Restores coins left unsettled by an interrupted session
+        self.coins_left = self.journal.replay()
+        get_settings().refresh(coins_left=self.coins_left)
 
         self.counter = self.coins_left
         # self.counter = 10
 
+    def record_coin(self, value, timestamp):
+        """
+        Records an accepted coin in the payment journal.
+        """
+        self.journal.record(value)
+
     def update_counter(self, counter):
         """
         Updates the counter value and corresponding label.
@@ -299,26 +307,16 @@ class PrintFormWidget(QWidget):
         self.counter = counter
         self.amount_label.setText(f"₱{self.counter:0.2f}")
 
-        self.update_db_counter(self.counter)
         self.check_total_counter_match()
 
-    def update_db_counter(self, counter):
+    def end_session(self):
         """
-        Updates the counter value in the database.
+        Stops the coin slot and settles the payment journal into coins_left.
         """
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE kiosk_settings SET coins_left = ?",
-            (counter,),
-        )
-        conn.commit()
-
-        cursor.execute("SELECT coins_left FROM kiosk_settings LIMIT 1")
-        coins = cursor.fetchone()[0]
-        conn.close()
-
-        print(coins)
+        self.coin_acceptor.stop()
+        self.coin_acceptor.wait()
+        self.counter = self.journal.close()
+        get_settings().refresh(coins_left=self.counter)
 
     def check_total_counter_match(self):
         """
@@ -333,7 +331,7 @@ class PrintFormWidget(QWidget):
         """
         Opens the print window based on the payment status.
         """
-        self.counter_thread.stop()
+        self.end_session()
         if self.counter > self.total:
             message_box = PrintMessageBox(
                 self.title,
@@ -366,7 +364,7 @@ class PrintFormWidget(QWidget):
         """
         Handles the 'Cancel' button click event.
         """
-        self.counter_thread.stop()
+        self.end_session()
         self.setVisible(False)
         self.cancel_clicked.emit()
 
@@ -374,40 +372,7 @@ class PrintFormWidget(QWidget):
         """
         Closes the current widget and emits a signal to go back to the home screen.
         """
-        self.counter_thread.stop()
+        self.end_session()
         self.close()
         self.go_back_home.emit()
 
-
-class CounterThread(QThread):
-    """
-    Thread to continuously monitor the counter using a hardware button.
-    """
-
-    counter_changed = pyqtSignal(int)
-
-    def __init__(self, initial_counter):
-        super().__init__()
-        self.coinslot = Button(16)
-        self.stop_event = Event()
-        self.counter = initial_counter
-
-    def run(self):
-        """
-        Runs the thread and continuously increments the counter when the button is pressed.
-        """
-        while not self.stop_event.is_set():
-            try:
-                if self.coinslot.is_pressed:
-                    self.counter += 1
-                    time.sleep(0.05)
-                    self.counter_changed.emit(self.counter)
-            except Exception as e:
-                print(f"Error reading button state: {e}")
-
-    def stop(self):
-        """
-        Stops the thread.
-        """
-        self.stop_event.set()
-        self.coinslot.close()
@@ -0,0 +1,219 @@
+"""
+Table model of the print history shown in the admin window.
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+import database
+import sales_rollup
+
+
+# (column, header) of the print history as shown in the admin window
+COLUMNS = (
+    ("printed_at", "Date Printed"),
+    ("form_name", "Form Name"),
+    ("number_of_copies", "Number Of Copies"),
+    ("total_amount", "Total Amount"),
+    ("result", "Result"),
+)
+
+# Rows read per query, and pages kept in memory
+PAGE_SIZE = 100
+MAX_PAGES = 20
+
+
+def period_bounds(period, today=None):
+    """
+    Returns the first and last second (as Unix time) of the current day,
+    week, month or year.
+    """
+    first, last = sales_rollup.period_range(period, today)
+    start = datetime.strptime(first, "%Y-%m-%d")
+    # Month ranges end on the 31st even in shorter months, so count days
+    # from the first of the month
+    year, month, day = (int(part) for part in last.split("-"))
+    end = datetime(year, month, 1) + timedelta(days=day)
+    return int(start.timestamp()), int(end.timestamp()) - 1
+
+
+class PrintHistoryModel(QAbstractTableModel):
+    """
+    Read-only table model of kiosk_print_results that reads a page of rows
+    at a time.
+
+    Rows are exposed as the view scrolls (canFetchMore/fetchMore), so opening
+    the table reads one page whatever the size of the history. Pages are kept
+    in a bounded LRU cache; pages dropped from it are read again when
+    scrolled back to. Sorting and the date filter are applied in SQL.
+
+    Each page is read from the (sort column, id) key its previous page ended
+    on, through the index of that column, instead of with an OFFSET that
+    would walk every row before it; the key each page starts after is kept.
+    """
+
+    def __init__(self, db_path=database.DB_PATH, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.sort_column = 0
+        self.sort_order = Qt.DescendingOrder
+        self.date_range = None
+
+        self.pages = OrderedDict()
+        self.page_keys = {}
+        self.loaded_rows = 0
+        self.exhausted = False
+        self.queries = 0
+
+        self.load_first_page()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded_rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return COLUMNS[section][1]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole:
+            return None
+
+        page = self.page(index.row() // PAGE_SIZE)
+        offset = index.row() % PAGE_SIZE
+        if offset >= len(page):
+            return None
+
+        value = page[offset][index.column()]
+        if index.column() == 0:
+            return datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M")
+        return str(value)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.exhausted:
+            return
+        rows = self.page(self.loaded_rows // PAGE_SIZE)
+        self.exhausted = len(rows) < PAGE_SIZE
+        if rows:
+            self.beginInsertRows(
+                QModelIndex(), self.loaded_rows, self.loaded_rows + len(rows) - 1
+            )
+            self.loaded_rows += len(rows)
+            self.endInsertRows()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_column = column
+        self.sort_order = order
+        self.refresh()
+
+    def set_date_range(self, start, end):
+        """
+        Shows only jobs printed between two Unix times (inclusive), or every
+        job if start and end are None.
+        """
+        self.date_range = None if start is None else (start, end)
+        self.refresh()
+
+    def refresh(self):
+        """
+        Drops the cached rows and reads the first page again.
+        """
+        self.beginResetModel()
+        self.load_first_page()
+        self.endResetModel()
+
+    def load_first_page(self):
+        self.pages.clear()
+        self.page_keys.clear()
+        rows = self.page(0)
+        self.loaded_rows = len(rows)
+        self.exhausted = len(rows) < PAGE_SIZE
+
+    def page(self, number):
+        rows = self.pages.get(number)
+        if rows is not None:
+            self.pages.move_to_end(number)
+            return rows
+
+        rows = self.fetch_page(number)
+        self.pages[number] = rows
+        if len(self.pages) > MAX_PAGES:
+            self.pages.popitem(last=False)
+        return rows
+
+    def fetch_page(self, number):
+        # Pages are first read in order, so the key of the row the previous
+        # page ended on is known
+        key = self.page_keys.get(number)
+        rows = []
+        for condition, parameters in self.page_conditions(key):
+            rows += self.fetch_rows(condition, parameters, PAGE_SIZE - len(rows))
+            if len(rows) == PAGE_SIZE:
+                break
+        self.queries += 1
+
+        if len(rows) == PAGE_SIZE:
+            last = rows[-1]
+            self.page_keys[number + 1] = (last[self.sort_column], last[-1])
+        return rows
+
+    def page_conditions(self, key):
+        """
+        Returns (condition, parameters) of the rows that follow key, split so
+        that each is a single range of its column's index, in the order they
+        are shown. NULLs sort first in ascending order and last in descending
+        order, and comparisons with the column skip them.
+        """
+        column = COLUMNS[self.sort_column][0]
+        ascending = self.sort_order == Qt.AscendingOrder
+        after = ">" if ascending else "<"
+        nulls = (f"{column} IS NULL", ())
+        values = (f"{column} IS NOT NULL", ())
+
+        if key is None:
+            return [nulls, values] if ascending else [values, nulls]
+
+        value, row_id = key
+        if value is None:
+            nulls_after = (f"{column} IS NULL AND id {after} ?", (row_id,))
+            return [nulls_after, values] if ascending else [nulls_after]
+
+        # Rows tied with key on the column, then the rows past it
+        ties = (f"{column} = ? AND id {after} ?", (value, row_id))
+        rest = (f"{column} {after} ?", (value,))
+        return [ties, rest] if ascending else [ties, rest, nulls]
+
+    def fetch_rows(self, condition, parameters, limit):
+        column = COLUMNS[self.sort_column][0]
+        direction = "DESC" if self.sort_order == Qt.DescendingOrder else "ASC"
+        if self.date_range is not None:
+            condition += " AND printed_at BETWEEN ? AND ?"
+            parameters = (*parameters, *self.date_range)
+
+        # id comes last, after the shown columns
+        cursor = database.cursor(self.db_path)
+        cursor.execute(
+            f"""
+            SELECT {", ".join(name for name, _ in COLUMNS)}, id
+            FROM kiosk_print_results
+            WHERE {condition}
+            ORDER BY {column} {direction}, id {direction}
+            LIMIT ?
+            """,
+            (*parameters, limit),
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+        return rows
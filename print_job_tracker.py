@@ -0,0 +1,119 @@
+import time
+import tracing
+from PyQt5.QtCore import QThread, pyqtSignal
+
+
+# IPP job-state values (RFC 8011)
+JOB_PENDING = 3
+JOB_HELD = 4
+JOB_PROCESSING = 5
+JOB_STOPPED = 6
+JOB_CANCELED = 7
+JOB_ABORTED = 8
+JOB_COMPLETED = 9
+
+FINISHED_STATES = (JOB_CANCELED, JOB_ABORTED, JOB_COMPLETED)
+
+# Seconds between job-state requests. The interval starts short so that quick
+# jobs are reported promptly and backs off while a long job is printing.
+MIN_POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 1.0
+
+
+def cups_connection():
+    import cups
+
+    # Each call to CUPS is recorded when tracing is on
+    return tracing.TracedCalls(cups.Connection(), "cups")
+
+
+class PrintJobTracker(QThread):
+    """
+    Thread that follows a single print job by id.
+
+    Given a job (printer, file path, title, options) instead of a job id, it
+    submits the job itself first, so printFile never blocks the GUI thread.
+    The printer is checked with CUPS just before, and another idle printer
+    is used if it is no longer idle; a given PrinterMonitor is told what
+    CUPS reported.
+    It asks CUPS for the job's job-state attribute directly, so only this job
+    is ever matched, and emits state_changed on every transition. Once the
+    job reaches a final state status_result reports whether it completed.
+    """
+
+    job_submitted = pyqtSignal(int)
+    state_changed = pyqtSignal(int, int)
+    status_result = pyqtSignal(bool)
+
+    def __init__(
+        self, job_id=None, connection_factory=cups_connection, job=None, monitor=None
+    ):
+        super().__init__()
+        self.job_id = job_id
+        self.job = job
+        self.monitor = monitor
+        self.connection_factory = connection_factory
+        self.stopping = False
+
+    def run(self):
+        try:
+            # Each thread needs its own connection to CUPS
+            conn = self.connection_factory()
+
+            if self.job_id is None:
+                printer_name = self.check_printer(conn)
+                self.job_id = conn.printFile(printer_name, *self.job[1:])
+                print(f"Print job submitted to {printer_name} with ID:", self.job_id)
+                self.job_submitted.emit(self.job_id)
+
+            state = None
+            interval = MIN_POLL_INTERVAL
+
+            while not self.stopping:
+                attributes = conn.getJobAttributes(
+                    self.job_id, requested_attributes=["job-state"]
+                )
+                new_state = attributes["job-state"]
+
+                if new_state != state:
+                    state = new_state
+                    interval = MIN_POLL_INTERVAL
+                    print(f"Job ID {self.job_id} is now in state {state}.")
+                    self.state_changed.emit(self.job_id, state)
+
+                if state in FINISHED_STATES:
+                    self.status_result.emit(state == JOB_COMPLETED)
+                    return
+
+                time.sleep(interval)
+                interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+        except Exception as e:
+            print(f"An error occurred while checking print job status: {e}")
+            self.status_result.emit(False)
+
+    def check_printer(self, conn):
+        """
+        Returns the job's printer if CUPS still reports it idle, or else the
+        first idle printer. Raises an exception if there is none.
+        """
+        # printer_monitor imports this module
+        from printer_monitor import PRINTER_IDLE, find_idle_printer
+
+        # The monitor's printer may be printer_monitor.MAX_POLL_INTERVAL
+        # seconds old, so CUPS is asked again, and the monitor told what it
+        # said
+        printers = conn.getPrinters()
+        if self.monitor is not None:
+            self.monitor.update(printers)
+
+        printer_name = self.job[0]
+        if printers.get(printer_name, {}).get("printer-state") == PRINTER_IDLE:
+            return printer_name
+        printer_name = find_idle_printer(printers)
+        if printer_name is None:
+            raise Exception("No idle printer available")
+        return printer_name
+
+    def stop(self):
+        self.stopping = True
@@ -1,4 +1,3 @@
-import sqlite3
 from PyQt5.QtWidgets import (
     QLabel,
     QPushButton,
@@ -8,17 +7,18 @@ from PyQt5.QtWidgets import (
     QFrame,
     QSpacerItem,
     QSizePolicy,
-    QGraphicsDropShadowEffect,
     QDialog,
 )
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QBrush, QColor, QIcon
 from PyQt5.QtCore import (
     Qt,
     pyqtSignal,
     QPoint,
     QPropertyAnimation,
-    QSize,
 )
+from kiosk_settings import get_settings
+from preview_cache import PREVIEW_HEIGHT, get_preview_cache
+from assets import get_assets, BUTTON_ICON_SIZE
+from shadows import ShadowEffect
 
 
 class MessageBox(QDialog):
@@ -115,20 +115,17 @@ class PrintPreviewWidget(QWidget):
     def setup_ui(
         self, title, page_number, printer_status, bondpaper_status, ink_status
     ):
-        # Connect database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT base_price FROM kiosk_settings LIMIT 1")
-        self.base_price = cursor.fetchone()[0]
-
-        cursor.execute("SELECT bondpaper_quantity FROM kiosk_settings LIMIT 1")
-        self.bondpaper_quantity = cursor.fetchone()[0]
-
-        conn.close()
+        # Read the cached kiosk settings
+        settings = get_settings()
+        self.base_price = settings.base_price
+        self.bondpaper_quantity = settings.bondpaper_quantity
 
         self.title = title
-        self.page_number = page_number
+        # Pages come from the shared preview cache, ready to display
+        self.preview_cache = get_preview_cache()
+        # The page count read from the PDF when the form was added
+        metadata = self.preview_cache.load(title)
+        self.page_number = metadata["number_of_pages"] if metadata else page_number
 
         main_layout = QHBoxLayout(self)
         main_layout.setContentsMargins(0, 55, 0, 0)
@@ -167,19 +164,11 @@ class PrintPreviewWidget(QWidget):
         # Center image
         self.index = 1
 
-        # Load the image
-        self.image = (
-            QImage(f"./img/form-preview/{self.title}-{self.index}.jpg")
-            .scaledToWidth(700, Qt.SmoothTransformation)
-            .scaledToHeight(830, Qt.SmoothTransformation)
-        )
-        # Apply border radius to the image
-        self.apply_border_radius()
-
-        # Create a pixmap from the image
-        pixmap = QPixmap.fromImage(self.image)
+        self.preview_cache.preview_ready.connect(self.on_preview_ready)
         self.center_image = QLabel()
-        self.center_image.setPixmap(pixmap)
+        # Keeps its height while a page is rendering
+        self.center_image.setMinimumHeight(PREVIEW_HEIGHT)
+        self.update_image()
         self.center_image.setAlignment(Qt.AlignCenter)
 
         # Top margin label for center image
@@ -246,11 +235,12 @@ class PrintPreviewWidget(QWidget):
             """
         )
 
-        # Create a QGraphicsDropShadowEffect
-        shadow_effect = QGraphicsDropShadowEffect()
+        # Create a ShadowEffect
+        shadow_effect = ShadowEffect()
         shadow_effect.setBlurRadius(50)
         shadow_effect.setColor(Qt.gray)
         shadow_effect.setOffset(0, 8)
+        shadow_effect.setRadius(45)
 
         # Apply the shadow effect to the square_frame
         square_frame.setGraphicsEffect(shadow_effect)
@@ -380,11 +370,7 @@ class PrintPreviewWidget(QWidget):
 
         # Add image to button
         process_image_label = QLabel()
-        icon = QIcon("./img/view_process_icon.svg")
-        pixmap = icon.pixmap(QSize(200, 200))
-        pixmap = pixmap.scaled(
-            QSize(50, 50), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )  # Adjust size as needed
+        pixmap = get_assets().pixmap("./img/view_process_icon.svg", BUTTON_ICON_SIZE)
         process_image_label.setPixmap(pixmap)
         process_image_label.setContentsMargins(0, 25, 0, 0)
         process_image_label.setAlignment(Qt.AlignCenter)
@@ -434,7 +420,7 @@ class PrintPreviewWidget(QWidget):
             """
         )
         self.print_bt.clicked.connect(
-            lambda: self.print_form_bt_clicked(title, page_number)
+            lambda: self.print_form_bt_clicked(title, self.page_number)
         )
 
         # Create layout for button
@@ -442,11 +428,7 @@ class PrintPreviewWidget(QWidget):
 
         # Add image to button
         self.print_image_label = QLabel()
-        icon = QIcon("./img/print_forms_icon.svg")
-        pixmap = icon.pixmap(QSize(200, 200))
-        pixmap = pixmap.scaled(
-            QSize(50, 50), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )  # Adjust size as needed
+        pixmap = get_assets().pixmap("./img/print_forms_icon.svg", BUTTON_ICON_SIZE)
         self.print_image_label.setPixmap(pixmap)
         self.print_image_label.setContentsMargins(0, 25, 0, 0)
         self.print_image_label.setAlignment(Qt.AlignCenter)
@@ -586,7 +568,7 @@ class PrintPreviewWidget(QWidget):
 
     def previous_image(self):
         # Check if there's a previous image available
-        if self.index > 0:
+        if self.index > 1:
             # Decrement the index to move to the previous image
             self.index -= 1
             # Update the displayed image and bottom label
@@ -594,18 +576,33 @@ class PrintPreviewWidget(QWidget):
             self.update_bottom_label()
 
     def update_image(self):
-        # Load and display the image corresponding to the current index
-        self.image = (
-            QImage(f"./img/form-preview/{self.title}-{self.index}.jpg")
-            .scaledToWidth(700, Qt.SmoothTransformation)
-            .scaledToHeight(830, Qt.SmoothTransformation)
-        )
-        # Apply border radius to the image
-        self.apply_border_radius()
-
-        # Create a pixmap from the updated image and set it to the center image label
-        pixmap = QPixmap.fromImage(self.image)
-        self.center_image.setPixmap(pixmap)
+        # Display the page corresponding to the current index, or wait for
+        # on_preview_ready if it is still rendering
+        pixmap = self.preview_cache.request(self.title, self.index)
+        if pixmap is not None:
+            self.center_image.setPixmap(pixmap)
+        else:
+            self.center_image.clear()
+        self.prefetch_neighbours()
+
+    def on_preview_ready(self, title, index):
+        if (title, index) != (self.title, self.index):
+            return
+        pixmap = self.preview_cache.cached(title, index)
+        if pixmap is not None:
+            self.center_image.setPixmap(pixmap)
+        else:
+            # A page that could not be read is not cached
+            self.center_image.clear()
+
+    def prefetch_neighbours(self):
+        # Render the pages a swipe can reach next in the background
+        neighbours = [
+            index
+            for index in (self.index + 1, self.index - 1)
+            if 1 <= index <= self.page_number
+        ]
+        self.preview_cache.prefetch(self.title, neighbours)
 
     def update_bottom_label(self):
         # Update the bottom label to display the current image index and total number of images
@@ -644,32 +641,12 @@ class PrintPreviewWidget(QWidget):
         # Update the total label to display the calculated total price
         self.total_label.setText(f"₱{self.total:0.2f}")
 
-    def apply_border_radius(self):
-        # Create a mask image with the desired border radius
-        mask = QImage(self.image.size(), QImage.Format_ARGB32)
-        mask.fill(Qt.transparent)
-
-        # Create a QPainter for the mask
-        painter = QPainter(mask)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        painter.setBrush(QBrush(QColor(Qt.white)))
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(
-            self.image.rect(), 20, 20
-        )  # Customize border radius as needed
-        painter.end()
-
-        # Apply the mask to the image
-        self.image.setAlphaChannel(mask)
-
     def disable_print_button(self):
         # Disable the print button and update its appearance
         self.print_bt.setEnabled(False)
-        disabled_icon = QIcon("./img/print_forms_icon_disabled.svg")
-        pixmap = disabled_icon.pixmap(QSize(200, 200))
-        pixmap = pixmap.scaled(
-            QSize(50, 50), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )  # Adjust size as needed
+        pixmap = get_assets().pixmap(
+            "./img/print_forms_icon_disabled.svg", BUTTON_ICON_SIZE
+        )
         self.print_image_label.setPixmap(pixmap)
         self.print_label.setStyleSheet(
             """
@@ -1,7 +1,3 @@
-import cups
-import sqlite3
-import subprocess
-import time
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QWidget,
@@ -14,61 +10,15 @@ from PyQt5.QtWidgets import (
     QSizePolicy,
     QProgressBar,
 )
-from PyQt5.QtCore import Qt, QTimer, QRectF, QThread, pyqtSignal
-from PyQt5.QtGui import QPixmap, QMovie, QPainter, QColor, QPen
-
-
-class PrinterStatusThread(QThread):
-    status_result = pyqtSignal(bool)
-
-    def __init__(self, job_id):
-        super().__init__()
-        self.job_id = job_id
-
-    def run(self):
-        try:
-            while True:
-                active_result = subprocess.run(
-                    ["lpstat", "-o"], capture_output=True, text=True
-                )
-                active_output = active_result.stdout
-
-                if active_output:
-                    print("Active print jobs:")
-                    print(active_output)
-                    if str(self.job_id) in active_output:
-                        print(f"Job ID {self.job_id} is still active.")
-                    else:
-                        print(f"Job ID {self.job_id} is not active.")
-                        break  # Job is not active
-                    # Wait for a few seconds before checking again
-                    time.sleep(3)
-                else:
-                    print("No active print jobs found.")
-                    break  # No active print jobs
-
-            # Check for completed print jobs
-            completed_result = subprocess.run(
-                ["lpstat", "-W", "completed"], capture_output=True, text=True
-            )
-            completed_output = completed_result.stdout
-
-            if completed_output:
-                print("Completed Print Jobs:")
-                print(completed_output)
-                if str(self.job_id) in completed_output:
-                    print(f"Job ID {self.job_id} has been completed.")
-                    self.status_result.emit(True)
-                else:
-                    print(f"Job ID {self.job_id} has not been completed.")
-                    self.status_result.emit(False)
-            else:
-                print("No completed print jobs found.")
-                self.status_result.emit(False)
-
-        except Exception as e:
-            print(f"An error occurred while checking print job status: {e}")
-            self.status_result.emit(False)
+from PyQt5.QtCore import Qt, QTimer, QRectF, pyqtSignal
+from PyQt5.QtGui import QMovie, QPainter, QColor, QPen
+from kiosk_settings import get_settings
+from data_changes import get_data_changes, PRINT_RESULTS
+import database
+import sales_rollup
+from print_job_tracker import PrintJobTracker
+from printer_monitor import get_printer_monitor
+from assets import get_assets
 
 
 class PrintMessageBox(QDialog):
@@ -186,22 +136,12 @@ class PrintInProgress(QWidget):
         self.print_status = None
 
         try:
-            conn = cups.Connection()
-            printers = conn.getPrinters()
-
-            if not printers:
-                raise Exception("No Printers Available.")
-
-            idle_printer_name = None
-            for printer_name, printer_attributes in printers.items():
-                if (
-                    "printer-state" in printer_attributes
-                    and printer_attributes["printer-state"] == 3
-                ):
-                    idle_printer_name = printer_name
-                    break
-
-            else:
+            # Use the idle printer last seen by the printer monitor; the
+            # tracker checks it with CUPS again before submitting the job
+            monitor = get_printer_monitor()
+            idle_printer_name = monitor.idle_printer
+
+            if idle_printer_name is None:
                 raise Exception("No idle printer available")
 
             print(idle_printer_name)
@@ -214,13 +154,11 @@ class PrintInProgress(QWidget):
                 "copies": str(self.num_copy),
             }
 
-            # Submit print jobs
-            job_id = conn.printFile(
-                idle_printer_name, file_path, "Print Job", printer_options
+            # Submit the print job and follow it from a background thread
+            self.status_thread = PrintJobTracker(
+                job=(idle_printer_name, file_path, "Print Job", printer_options),
+                monitor=monitor,
             )
-            print(f"Print job submitted to {idle_printer_name} with ID:", job_id)
-
-            self.status_thread = PrinterStatusThread(job_id)
             self.status_thread.status_result.connect(self.on_status_checked)
             self.status_thread.start()
 
@@ -242,9 +180,9 @@ class PrintInProgress(QWidget):
     def update_database_and_ui(self, print_result):
         self.print_result = print_result
         print(self.print_result)
-        formatted_datetime = datetime.now().strftime("%Y-%m-%d %H:%M")
+        printed_at = datetime.now()
 
-        with sqlite3.connect("./database/kiosk.db") as conn_sqlite:
+        with database.connect() as conn_sqlite:
             cursor = conn_sqlite.cursor()
 
             if self.print_result == "Success":
@@ -261,21 +199,39 @@ class PrintInProgress(QWidget):
                 self.print_failed()
 
             cursor.execute(
-                "INSERT INTO kiosk_print_results (date_printed, form_name, number_of_copies, total_amount, result) VALUES (?, ?, ?, ?, ?)",
+                "INSERT INTO kiosk_print_results (printed_at, form_name, number_of_copies, total_amount, result) VALUES (?, ?, ?, ?, ?)",
                 (
-                    formatted_datetime,
+                    int(printed_at.timestamp()),
                     self.title,
                     self.num_copy,
                     self.total,
                     self.print_result,
                 ),
             )
-            conn_sqlite.commit()
+            # Keep the dashboard's daily totals in the same transaction
+            sales_rollup.record(
+                conn_sqlite,
+                printed_at,
+                self.title,
+                self.num_copy,
+                self.total,
+                self.print_result,
+            )
+
+        get_data_changes().notify(PRINT_RESULTS)
+
+        if self.print_result == "Success":
+            # Mirror the update above in the cached settings
+            settings = get_settings()
+            settings.refresh(
+                bondpaper_quantity=settings.bondpaper_quantity - self.bondpaper_left,
+                ink_level=settings.ink_level - self.ink_left,
+                coins_left=0,
+            )
 
     def print_success(self):
         self.movie.stop()
-        pixmap = QPixmap("./img/static/print_success.png")
-        pixmap = pixmap.scaledToWidth(256, Qt.SmoothTransformation)
+        pixmap = get_assets().static_pixmap("print_success.png", 256, 256)
         self.gif_label.setAlignment(Qt.AlignCenter)
         self.gif_label.setPixmap(pixmap)
         self.gif_label.setStyleSheet("margin-top: 145px;")
@@ -307,8 +263,7 @@ class PrintInProgress(QWidget):
 
     def print_failed(self):
         self.movie.stop()
-        pixmap = QPixmap("./img/static/print_failed.png")
-        pixmap = pixmap.scaledToWidth(256, Qt.SmoothTransformation)
+        pixmap = get_assets().static_pixmap("print_failed.png", 256, 256)
         self.gif_label.setAlignment(Qt.AlignCenter)
         self.gif_label.setPixmap(pixmap)
         self.gif_label.setStyleSheet("margin-top: 145px;")
@@ -369,10 +324,8 @@ class WarningPrint(QWidget):
         self.circle_loading.hide()
 
         self.image_label = QLabel()
-        pixmap = QPixmap("./img/static/warning.png")
-        pixmap = pixmap.scaledToWidth(
-            256, Qt.SmoothTransformation
-        )  # Scale the image width to fit the label
+        # Scaled to fit the label
+        pixmap = get_assets().static_pixmap("warning.png", 256, 256)
         self.image_label.setPixmap(pixmap)
         self.image_label.setAlignment(Qt.AlignCenter)
         self.layout.addWidget(self.image_label)
@@ -0,0 +1,136 @@
+import time
+import threading
+from PyQt5.QtCore import QCoreApplication, QThread, pyqtSignal
+from print_job_tracker import cups_connection
+
+
+# IPP printer-state value of a printer that is ready for a new job
+PRINTER_IDLE = 3
+
+# How long a getPrinters() result is served before it counts as stale
+CACHE_TTL = 2.0
+
+# Seconds between probes. The interval doubles while nothing changes, up to
+# MAX_POLL_INTERVAL, and drops back to MIN_POLL_INTERVAL on any change.
+MIN_POLL_INTERVAL = 2.0
+MAX_POLL_INTERVAL = 30.0
+
+
+def find_idle_printer(printers):
+    """
+    Returns the name of the first idle printer, or None.
+    """
+    for printer_name, printer_attributes in printers.items():
+        if printer_attributes.get("printer-state") == PRINTER_IDLE:
+            return printer_name
+    return None
+
+
+class PrinterMonitor(QThread):
+    """
+    Background thread that owns the kiosk's CUPS connection for printer
+    status.
+
+    It probes getPrinters() on a backing-off schedule and caches the result,
+    so screens read is_available and idle_printer without blocking, and
+    subscribe to availability_changed instead of probing themselves.
+    """
+
+    availability_changed = pyqtSignal(bool)
+
+    def __init__(self, connection_factory=cups_connection):
+        super().__init__()
+        self.connection_factory = connection_factory
+        self.lock = threading.Lock()
+        self.wake_event = threading.Event()
+        self.running = True
+
+        self.printers = {}
+        self.checked_at = None
+        self.is_available = False
+        self.idle_printer = None
+        self.probes = 0
+
+    def run(self):
+        conn = None
+        interval = MIN_POLL_INTERVAL
+
+        while self.running:
+            try:
+                if conn is None:
+                    conn = self.connection_factory()
+                changed = self.probe(conn)
+            except Exception as e:
+                print("Error checking printers:", e)
+                # Reconnect on the next probe
+                conn = None
+                changed = self.update({})
+
+            if changed:
+                interval = MIN_POLL_INTERVAL
+            else:
+                interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+            if self.wake_event.wait(interval):
+                self.wake_event.clear()
+                interval = MIN_POLL_INTERVAL
+
+    def probe(self, conn):
+        """
+        Asks CUPS for the printers. Returns whether availability changed.
+        """
+        self.probes += 1
+        return self.update(conn.getPrinters())
+
+    def update(self, printers):
+        idle_printer = find_idle_printer(printers)
+        with self.lock:
+            self.printers = printers
+            self.checked_at = time.monotonic()
+            changed = idle_printer != self.idle_printer
+            self.idle_printer = idle_printer
+            self.is_available = idle_printer is not None
+
+        if changed:
+            self.availability_changed.emit(self.is_available)
+        return changed
+
+    def get_printers(self):
+        """
+        Returns the cached getPrinters() result. A stale result is still
+        returned, but a new probe is requested.
+        """
+        with self.lock:
+            printers = self.printers
+            checked_at = self.checked_at
+        if checked_at is None or time.monotonic() - checked_at > CACHE_TTL:
+            self.refresh()
+        return printers
+
+    def refresh(self):
+        """
+        Requests a probe as soon as possible without waiting for it.
+        """
+        self.wake_event.set()
+
+    def stop(self):
+        self.running = False
+        self.wake_event.set()
+        self.wait()
+
+
+_monitor = None
+
+
+def get_printer_monitor():
+    """
+    Returns the shared PrinterMonitor, starting it on first use.
+    """
+    global _monitor
+    if _monitor is None:
+        _monitor = PrinterMonitor()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(_monitor.stop)
+        _monitor.start()
+    return _monitor
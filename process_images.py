@@ -0,0 +1,537 @@
+"""Pre-scaled process images and the tiled campus map of the View Process screens."""
+
+import os
+import glob
+import json
+import math
+import shutil
+import tempfile
+from collections import OrderedDict
+from PyQt5.QtCore import (
+    QCoreApplication,
+    QRectF,
+    QSize,
+    Qt,
+    QThread,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt5.QtGui import QBrush, QColor, QImage, QImageReader, QPainter, QPixmap
+from PyQt5.QtWidgets import QGraphicsScene, QGraphicsView
+import tracing
+
+
+PROCESS_DIR = "./img/process"
+CACHE_DIR = "./img/process-cache"
+MAP_PATH = "./img/process/map.jpg"
+TILE_DIR = os.path.join(CACHE_DIR, "map-tiles")
+
+# Process image shown by ProcessWidget, and the View Process / View Map
+# buttons, in pixels
+PROCESS_SIZE = QSize(1280, int(1280 * (2 / 3)))
+PROCESS_RADIUS = 25
+BUTTON_SIZE = QSize(840, 380)
+
+# The map fits this box at zoom 1, as ImageViewer used to scale it
+MAP_VIEW_SIZE = QSize(2560, 1440)
+
+TILE_SIZE = 512
+TILE_QUALITY = 90
+
+# Decoded images kept in memory: process images and button backgrounds, and
+# map tiles. A 512 px tile is 1 MB.
+IMAGE_CACHE_SIZE = 6
+TILE_CACHE_SIZE = 48
+
+
+# Process image path of each title, or None if it has none
+_process_paths = {}
+
+
+def process_path(title):
+    if title not in _process_paths:
+        image_paths = glob.glob(f"{PROCESS_DIR}/{glob.escape(title)}.[pj][np]g")
+        _process_paths[title] = image_paths[0] if image_paths else None
+    return _process_paths[title]
+
+
+def image_name(source_path):
+    return os.path.splitext(os.path.basename(source_path))[0]
+
+
+def cache_path(name, size):
+    return os.path.join(CACHE_DIR, f"{name}-{size.width()}x{size.height()}.png")
+
+
+def round_corners(image, radius):
+    # Create a mask image with the desired border radius
+    mask = QImage(image.size(), QImage.Format_ARGB32)
+    mask.fill(Qt.transparent)
+
+    painter = QPainter(mask)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    painter.setBrush(QBrush(QColor(Qt.white)))
+    painter.setPen(Qt.NoPen)
+    painter.drawRoundedRect(image.rect(), radius, radius)
+    painter.end()
+
+    # Apply the mask to the image
+    image.setAlphaChannel(mask)
+    return image
+
+
+@tracing.traced("image.process_scale")
+def render_scaled(source_path, size, radius=0):
+    """
+    Loads an image, stretches it to size and rounds its corners. Only uses
+    QImage, so it is safe to call from a worker thread.
+    """
+    image = QImage(source_path)
+    if image.isNull():
+        return image
+    image = image.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    if radius:
+        image = round_corners(image, radius)
+    return image
+
+
+def save_atomic(image, path, quality=-1):
+    """
+    Saves an image next to path first and moves it into place once written.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    extension = os.path.splitext(path)[1]
+    fd, temp_path = tempfile.mkstemp(suffix=extension, dir=directory)
+    os.close(fd)
+    try:
+        if not image.save(temp_path, None, quality):
+            raise OSError(f"Could not write {path}")
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def is_fresh(path, source_path):
+    return os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(source_path)
+
+
+def prepare_scaled(source_path, size, radius=0):
+    """
+    Makes the cached copy of an image at a display size if it is missing or
+    older than the image. Returns its path, or None if the image is missing.
+    """
+    if source_path is None or not os.path.exists(source_path):
+        return None
+    path = cache_path(image_name(source_path), size)
+    if not is_fresh(path, source_path):
+        image = render_scaled(source_path, size, radius)
+        if image.isNull():
+            return None
+        save_atomic(image, path)
+    return path
+
+
+_pixmaps = OrderedDict()
+
+
+def cached_pixmap(source_path, size, radius=0):
+    """
+    Returns an image at a display size, from memory or from its cached copy.
+    An empty pixmap is returned if the image is missing.
+    """
+    if source_path is None:
+        return QPixmap()
+    key = (source_path, size.width(), size.height(), radius)
+    pixmap = _pixmaps.get(key)
+    if pixmap is not None and is_fresh(cache_path(image_name(source_path), size), source_path):
+        _pixmaps.move_to_end(key)
+        return pixmap
+
+    path = prepare_scaled(source_path, size, radius)
+    if path is None:
+        return QPixmap()
+    with tracing.span("image.process"):
+        pixmap = QPixmap(path)
+    _pixmaps[key] = pixmap
+    while len(_pixmaps) > IMAGE_CACHE_SIZE:
+        _pixmaps.popitem(last=False)
+    return pixmap
+
+
+def process_pixmap(title):
+    return cached_pixmap(process_path(title), PROCESS_SIZE, PROCESS_RADIUS)
+
+
+def process_button_pixmap(title):
+    return cached_pixmap(process_path(title), BUTTON_SIZE)
+
+
+def map_button_pixmap():
+    return cached_pixmap(MAP_PATH, BUTTON_SIZE)
+
+
+def prepare_process(title):
+    """
+    Makes the cached copies of a form's process image, e.g. after an upload.
+    """
+    _process_paths.pop(title, None)
+    source_path = process_path(title)
+    prepare_scaled(source_path, PROCESS_SIZE, PROCESS_RADIUS)
+    prepare_scaled(source_path, BUTTON_SIZE)
+
+
+def forget_process(title):
+    """
+    Drops a form's process image from memory, e.g. after it was replaced.
+    """
+    _process_paths.pop(title, None)
+    for key in [key for key in _pixmaps if image_name(key[0]) == title]:
+        del _pixmaps[key]
+
+
+def discard_process(title):
+    """
+    Removes the cached copies of a form's process image.
+    """
+    for size in (PROCESS_SIZE, BUTTON_SIZE):
+        path = cache_path(title, size)
+        if os.path.exists(path):
+            os.remove(path)
+    forget_process(title)
+
+
+def map_levels(width, height):
+    """
+    Returns the (width, height) of every level of the map's pyramid, from
+    the full map down to the first level that fits one tile.
+    """
+    levels = [(width, height)]
+    while max(width, height) > TILE_SIZE:
+        width, height = max(1, math.ceil(width / 2)), max(1, math.ceil(height / 2))
+        levels.append((width, height))
+    return levels
+
+
+def tile_path(tile_dir, level, column, row):
+    return os.path.join(tile_dir, str(level), f"{column}_{row}.jpg")
+
+
+def read_manifest(tile_dir=TILE_DIR):
+    try:
+        with open(os.path.join(tile_dir, "manifest.json")) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def tiles_fresh(source_path=MAP_PATH, tile_dir=TILE_DIR):
+    manifest = read_manifest(tile_dir)
+    return (
+        manifest is not None
+        and manifest.get("tile_size") == TILE_SIZE
+        and manifest.get("source_mtime") == os.path.getmtime(source_path)
+    )
+
+
+@tracing.traced("image.map_tiles")
+def build_map_tiles(source_path=MAP_PATH, tile_dir=TILE_DIR):
+    """
+    Cuts the map into its tile pyramid. The tiles are written to a new
+    directory that replaces the old one when complete. Returns the manifest.
+    """
+    image = QImage(source_path)
+    if image.isNull():
+        raise OSError(f"Could not read {source_path}")
+    image = image.convertToFormat(QImage.Format_RGB32)
+
+    parent = os.path.dirname(os.path.abspath(tile_dir))
+    os.makedirs(parent, exist_ok=True)
+    build_dir = tempfile.mkdtemp(prefix="map-tiles-", dir=parent)
+    try:
+        levels = map_levels(image.width(), image.height())
+        for level, (width, height) in enumerate(levels):
+            if (image.width(), image.height()) != (width, height):
+                # Each level is halved from the one before it
+                image = image.scaled(
+                    width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+                )
+            os.makedirs(os.path.join(build_dir, str(level)))
+            for row in range(math.ceil(height / TILE_SIZE)):
+                for column in range(math.ceil(width / TILE_SIZE)):
+                    tile = image.copy(
+                        column * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE
+                    ).copy(
+                        0,
+                        0,
+                        min(TILE_SIZE, width - column * TILE_SIZE),
+                        min(TILE_SIZE, height - row * TILE_SIZE),
+                    )
+                    tile.save(tile_path(build_dir, level, column, row), "JPG", TILE_QUALITY)
+
+        manifest = {
+            "source_mtime": os.path.getmtime(source_path),
+            "tile_size": TILE_SIZE,
+            "levels": levels,
+        }
+        with open(os.path.join(build_dir, "manifest.json"), "w") as file:
+            json.dump(manifest, file)
+
+        if os.path.exists(tile_dir):
+            shutil.rmtree(tile_dir)
+        os.replace(build_dir, tile_dir)
+    except BaseException:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        raise
+    return manifest
+
+
+def ensure_map_tiles(source_path=MAP_PATH, tile_dir=TILE_DIR):
+    """
+    Returns the map's manifest, cutting the tiles first if they are missing
+    or older than the map.
+    """
+    if tiles_fresh(source_path, tile_dir):
+        return read_manifest(tile_dir)
+    print("Building map tiles...")
+    return build_map_tiles(source_path, tile_dir)
+
+
+class MapTileBuilder(QThread):
+    """
+    Cuts the map's tiles in the background, off the GUI thread.
+    """
+
+    built = pyqtSignal(object)
+
+    def __init__(self, source_path, tile_dir, parent=None):
+        super().__init__(parent)
+        self.source_path = source_path
+        self.tile_dir = tile_dir
+
+    def run(self):
+        try:
+            manifest = ensure_map_tiles(self.source_path, self.tile_dir)
+        except OSError as error:
+            print(f"Could not build map tiles: {error}")
+            return
+        self.built.emit(manifest)
+
+
+_tile_builders = {}
+
+
+def map_tile_builder(source_path=MAP_PATH, tile_dir=TILE_DIR):
+    """
+    Returns the thread cutting the map's tiles, started if the tiles are
+    missing or older than the map, or None if they are up to date.
+    """
+    builder = _tile_builders.get(tile_dir)
+    if builder is not None and builder.isRunning():
+        return builder
+    if os.path.exists(source_path) and tiles_fresh(source_path, tile_dir):
+        return None
+
+    builder = MapTileBuilder(source_path, tile_dir)
+    _tile_builders[tile_dir] = builder
+    app = QCoreApplication.instance()
+    if app is not None:
+        app.aboutToQuit.connect(builder.wait)
+    builder.start()
+    return builder
+
+
+class MapViewer(QGraphicsView):
+    """
+    Zoomable, draggable view of the campus map drawn from its tile pyramid.
+
+    Scene coordinates are those of the map fitted to MAP_VIEW_SIZE. The
+    smallest level is always shown underneath, and the tiles in view of the
+    smallest level that is at least as sharp as the current zoom are placed
+    over it. Tiles that leave the view are removed from the scene; their
+    pixmaps stay in a small cache for panning back.
+
+    If the tiles are still being cut, the smallest level is decoded from the
+    map instead and the tiles are shown once they are ready.
+    """
+
+    def __init__(self, source_path=MAP_PATH, tile_dir=TILE_DIR, parent=None):
+        super().__init__(parent)
+        self.scene = QGraphicsScene(self)
+        self.setScene(self.scene)
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.scale_factor = 1.0
+
+        self.tile_dir = tile_dir
+        self.levels = None
+        self.tiles_ready = False
+        self.base_item = None
+
+        self.tile_pixmaps = OrderedDict()
+        # (level, column, row) -> item in the scene
+        self.tile_items = {}
+        self.current_level = None
+
+        builder = map_tile_builder(source_path, tile_dir)
+        if builder is None:
+            self.show_tiles(read_manifest(tile_dir))
+        else:
+            self.show_preview(source_path)
+            builder.built.connect(self.show_tiles)
+            # The manifest is written before built is emitted, so tiles that
+            # were finished before the connection are found here
+            if tiles_fresh(source_path, tile_dir):
+                self.show_tiles(read_manifest(tile_dir))
+
+        self.horizontalScrollBar().valueChanged.connect(self.update_tiles)
+        self.verticalScrollBar().valueChanged.connect(self.update_tiles)
+
+    def set_levels(self, levels):
+        self.levels = levels
+        full_width, full_height = levels[0]
+        fitted = QSize(full_width, full_height).scaled(MAP_VIEW_SIZE, Qt.KeepAspectRatio)
+        # Scene units per pixel of the full map
+        self.unit = fitted.width() / full_width
+        self.scene.setSceneRect(QRectF(0, 0, fitted.width(), fitted.height()))
+
+    def show_base(self, pixmap):
+        # The smallest level, shown underneath the tiles
+        if self.base_item is None:
+            self.base_item = self.scene.addPixmap(pixmap)
+            self.base_item.setTransformationMode(Qt.SmoothTransformation)
+            self.base_item.setScale(self.level_scale(len(self.levels) - 1))
+            self.base_item.setZValue(-1)
+        else:
+            self.base_item.setPixmap(pixmap)
+
+    def show_preview(self, source_path):
+        """
+        Shows the map's smallest level, decoded straight at its size, while
+        the tiles are cut.
+        """
+        reader = QImageReader(source_path)
+        size = reader.size()
+        if not size.isValid():
+            return
+        self.set_levels(map_levels(size.width(), size.height()))
+        reader.setScaledSize(QSize(*self.levels[-1]))
+        with tracing.span("image.map_preview"):
+            image = reader.read()
+        self.show_base(QPixmap.fromImage(image))
+
+    @pyqtSlot(object)
+    def show_tiles(self, manifest):
+        self.set_levels(manifest["levels"])
+        self.tiles_ready = True
+        self.show_base(self.tile_pixmap(len(self.levels) - 1, 0, 0))
+        self.update_tiles()
+
+    def level_scale(self, level):
+        # Scene units per pixel of a level
+        return self.unit * self.levels[0][0] / self.levels[level][0]
+
+    def level_for_zoom(self, zoom):
+        """
+        Returns the smallest level with at least one pixel per screen pixel
+        at this zoom, or the full map.
+        """
+        for level in range(len(self.levels) - 1, -1, -1):
+            if 1 / self.level_scale(level) >= zoom:
+                return level
+        return 0
+
+    def tile_pixmap(self, level, column, row):
+        key = (level, column, row)
+        pixmap = self.tile_pixmaps.get(key)
+        if pixmap is None:
+            with tracing.span("image.map_tile"):
+                pixmap = QPixmap(tile_path(self.tile_dir, level, column, row))
+            self.tile_pixmaps[key] = pixmap
+            while len(self.tile_pixmaps) > TILE_CACHE_SIZE:
+                self.tile_pixmaps.popitem(last=False)
+        else:
+            self.tile_pixmaps.move_to_end(key)
+        return pixmap
+
+    def add_tile(self, level, column, row):
+        scale = self.level_scale(level)
+        item = self.scene.addPixmap(self.tile_pixmap(level, column, row))
+        item.setTransformationMode(Qt.SmoothTransformation)
+        item.setScale(scale)
+        item.setPos(column * TILE_SIZE * scale, row * TILE_SIZE * scale)
+        self.tile_items[(level, column, row)] = item
+        return item
+
+    def update_tiles(self):
+        if not self.tiles_ready:
+            return
+        zoom = self.transform().m11()
+        level = self.level_for_zoom(zoom)
+        scale = self.level_scale(level)
+        width, height = self.levels[level]
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        visible = visible.intersected(self.scene.sceneRect())
+
+        wanted = set()
+        if level != len(self.levels) - 1 and not visible.isEmpty():
+            tile = TILE_SIZE * scale
+            first_column = max(0, int(visible.left() // tile))
+            last_column = min(math.ceil(width / TILE_SIZE) - 1, int(visible.right() // tile))
+            first_row = max(0, int(visible.top() // tile))
+            last_row = min(math.ceil(height / TILE_SIZE) - 1, int(visible.bottom() // tile))
+            wanted = {
+                (level, column, row)
+                for column in range(first_column, last_column + 1)
+                for row in range(first_row, last_row + 1)
+            }
+
+        for key in list(self.tile_items):
+            if key not in wanted:
+                self.scene.removeItem(self.tile_items.pop(key))
+        for key in wanted:
+            if key not in self.tile_items:
+                self.add_tile(*key)
+        self.current_level = level
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_tiles()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_tiles()
+
+    def reset_zoom(self):
+        self.scale_factor = 1.0
+        self.resetTransform()
+        self.update_tiles()
+
+    def zoom_in(self):
+        self.scale_factor *= 1.2
+        self.setTransform(self.transform().scale(1.2, 1.2))
+        self.update_tiles()
+
+    def zoom_out(self):
+        self.scale_factor /= 1.2
+        self.setTransform(self.transform().scale(1 / 1.2, 1 / 1.2))
+        self.update_tiles()
+
+
+def main():
+    for path in sorted(glob.glob(f"{PROCESS_DIR}/*.[pj][np]g")):
+        if os.path.abspath(path) == os.path.abspath(MAP_PATH):
+            continue
+        prepare_process(os.path.splitext(os.path.basename(path))[0])
+    prepare_scaled(MAP_PATH, BUTTON_SIZE)
+    manifest = build_map_tiles()
+    tiles = sum(
+        math.ceil(width / TILE_SIZE) * math.ceil(height / TILE_SIZE)
+        for width, height in manifest["levels"]
+    )
+    print(f"Prepared process images and {tiles} map tiles in {CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Exports the print history and the daily sales totals to CSV or Parquet."""
+
+import os
+import csv
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from PyQt5.QtCore import QThread, pyqtSignal
+import database
+import migrations
+
+
+# Rows read from SQLite per chunk
+CHUNK_SIZE = 5000
+
+# Exported tables: the query, with a placeholder for the date filter, the
+# column that is filtered on, and the (header, Arrow type) of every column.
+# The print history's date filter is in Unix time, the daily totals' by day.
+EXPORTS = {
+    "print_history": {
+        "query": """
+            SELECT strftime('%Y-%m-%d %H:%M', printed_at, 'unixepoch', 'localtime'),
+                   form_name, number_of_copies, total_amount, result
+            FROM kiosk_print_results
+            {where}
+            ORDER BY printed_at, id
+        """,
+        "date_column": "printed_at",
+        "columns": (
+            ("Date Printed", "string"),
+            ("Form Name", "string"),
+            ("Number Of Copies", "int64"),
+            ("Total Amount", "float64"),
+            ("Result", "string"),
+        ),
+    },
+    "sales_daily": {
+        "query": """
+            SELECT day, form_name, result, prints, copies, amount
+            FROM kiosk_sales_daily
+            {where}
+            ORDER BY day, form_name, result
+        """,
+        "date_column": "day",
+        "columns": (
+            ("Day", "string"),
+            ("Form Name", "string"),
+            ("Result", "string"),
+            ("Prints", "int64"),
+            ("Copies", "int64"),
+            ("Amount", "float64"),
+        ),
+    },
+}
+
+FORMATS = ("csv", "parquet")
+
+
+def date_filter(name, since=None, until=None):
+    """
+    Returns the WHERE clause and parameters that keep the rows from day
+    `since` to day `until` (YYYY-MM-DD, both inclusive, either may be None).
+    """
+    column = EXPORTS[name]["date_column"]
+    first, last = since, until
+
+    if column == "printed_at":
+        # Local days to the first and last second of the day in Unix time
+        if since is not None:
+            first = int(datetime.strptime(since, "%Y-%m-%d").timestamp())
+        if until is not None:
+            end = datetime.strptime(until, "%Y-%m-%d") + timedelta(days=1)
+            last = int(end.timestamp()) - 1
+
+    conditions = []
+    parameters = []
+    if first is not None:
+        conditions.append(f"{column} >= ?")
+        parameters.append(first)
+    if last is not None:
+        conditions.append(f"{column} <= ?")
+        parameters.append(last)
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where, parameters
+
+
+def iter_chunks(
+    name, since=None, until=None, db_path=database.DB_PATH, chunk_size=CHUNK_SIZE
+):
+    """
+    Yields the rows of an export as lists of at most chunk_size rows.
+    """
+    where, parameters = date_filter(name, since, until)
+    cursor = database.cursor(db_path)
+    try:
+        cursor.execute(EXPORTS[name]["query"].format(where=where), parameters)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
+    finally:
+        cursor.close()
+
+
+def write_csv(chunks, columns, file):
+    writer = csv.writer(file)
+    writer.writerow(header for header, _ in columns)
+    count = 0
+    for rows in chunks:
+        writer.writerows(rows)
+        count += len(rows)
+    return count
+
+
+def write_parquet(chunks, columns, path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [(header, getattr(pa, arrow_type)()) for header, arrow_type in columns]
+    )
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows in chunks:
+            # One record batch per chunk, built column by column
+            arrays = [
+                pa.array([row[number] for row in rows], type=field.type)
+                for number, field in enumerate(schema)
+            ]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            count += len(rows)
+    return count
+
+
+def export(
+    name, path, file_format=None, since=None, until=None, db_path=database.DB_PATH
+):
+    """
+    Writes an export to path and returns the number of rows written. The
+    format is taken from the file extension unless given. The file is
+    written next to path first and moved into place once complete.
+    """
+    if file_format is None:
+        file_format = os.path.splitext(path)[1].lstrip(".").lower()
+    if file_format not in FORMATS:
+        raise ValueError(f"Unknown export format: {file_format}")
+
+    columns = EXPORTS[name]["columns"]
+    chunks = iter_chunks(name, since, until, db_path)
+
+    fd, temp_path = tempfile.mkstemp(
+        suffix=f".{file_format}", dir=os.path.dirname(os.path.abspath(path))
+    )
+    try:
+        if file_format == "csv":
+            with os.fdopen(fd, "w", newline="", encoding="utf-8") as file:
+                count = write_csv(chunks, columns, file)
+        else:
+            os.close(fd)
+            count = write_parquet(chunks, columns, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        chunks.close()
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return count
+
+
+class ExportThread(QThread):
+    """
+    Thread that runs one export. export_finished(path, rows) is emitted
+    when the file is written and export_failed(message) if it could not be.
+    """
+
+    export_finished = pyqtSignal(str, int)
+    export_failed = pyqtSignal(str)
+
+    def __init__(self, name, path, since=None, until=None, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.path = path
+        self.since = since
+        self.until = until
+
+    def run(self):
+        try:
+            count = export(self.name, self.path, since=self.since, until=self.until)
+        except ImportError:
+            self.export_failed.emit("Parquet export needs pyarrow to be installed.")
+        except Exception as e:
+            print("Error exporting:", e)
+            self.export_failed.emit(str(e))
+        else:
+            self.export_finished.emit(self.path, count)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export the kiosk print history or daily sales totals."
+    )
+    parser.add_argument("name", choices=sorted(EXPORTS))
+    parser.add_argument("path", help="output file, .csv or .parquet")
+    parser.add_argument("--format", choices=FORMATS, dest="file_format")
+    parser.add_argument("--since", help="first day to export, YYYY-MM-DD")
+    parser.add_argument("--until", help="last day to export, YYYY-MM-DD")
+    parser.add_argument("--db", default=database.DB_PATH, help="database file")
+    args = parser.parse_args()
+
+    migrations.migrate(args.db)
+    try:
+        count = export(
+            args.name, args.path, args.file_format, args.since, args.until, args.db
+        )
+    except ImportError:
+        parser.exit(1, "Parquet export needs pyarrow: pip install pyarrow\n")
+    except ValueError as e:
+        parser.exit(1, f"{e}\n")
+    print(f"Exported {count} rows to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Daily totals of kiosk_print_results for the admin dashboard."""
+
+import datetime
+import database
+
+
+PERIODS = ("daily", "weekly", "monthly", "yearly")
+
+
+def record(conn, printed_at, form_name, copies, amount, result):
+    """
+    Adds one print job to the daily totals. Call it on the connection and
+    inside the transaction that inserts the job into kiosk_print_results.
+    """
+    conn.execute(
+        """
+        INSERT INTO kiosk_sales_daily (day, form_name, result, prints, copies, amount)
+        VALUES (?, ?, ?, 1, ?, ?)
+        ON CONFLICT (day, result, form_name) DO UPDATE SET
+            prints = prints + 1,
+            copies = copies + excluded.copies,
+            amount = amount + excluded.amount
+        """,
+        (printed_at.strftime("%Y-%m-%d"), form_name, result, copies, amount),
+    )
+
+
+def period_range(period, today=None):
+    """
+    Returns the first and last day (as YYYY-MM-DD) of the current day, week
+    (Monday to Sunday), month or year.
+    """
+    if today is None:
+        today = datetime.date.today()
+
+    if period == "daily":
+        start = end = today
+    elif period == "weekly":
+        start = today - datetime.timedelta(days=today.weekday())
+        end = start + datetime.timedelta(days=6)
+    elif period == "monthly":
+        return today.strftime("%Y-%m-01"), today.strftime("%Y-%m-31")
+    elif period == "yearly":
+        return today.strftime("%Y-01-01"), today.strftime("%Y-12-31")
+    else:
+        raise ValueError(f"Unknown period: {period}")
+
+    return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+
+
+def total_amount(period, db_path=database.DB_PATH):
+    """
+    Returns the amount paid for successful prints in the period.
+    """
+    cursor = database.cursor(db_path)
+    cursor.execute(
+        """
+        SELECT COALESCE(SUM(amount), 0)
+        FROM kiosk_sales_daily
+        WHERE result = 'Success' AND day BETWEEN ? AND ?
+        """,
+        period_range(period),
+    )
+    total = cursor.fetchone()[0]
+    cursor.close()
+    return total
+
+
+def result_count(result, period, db_path=database.DB_PATH):
+    """
+    Returns the number of print jobs with the given result in the period.
+    """
+    cursor = database.cursor(db_path)
+    cursor.execute(
+        """
+        SELECT COALESCE(SUM(prints), 0)
+        FROM kiosk_sales_daily
+        WHERE result = ? AND day BETWEEN ? AND ?
+        """,
+        (result, *period_range(period)),
+    )
+    count = cursor.fetchone()[0]
+    cursor.close()
+    return count
+
+
+def top_form(period, db_path=database.DB_PATH):
+    """
+    Returns the form with the most successfully printed copies in the
+    period, or 'None'.
+    """
+    cursor = database.cursor(db_path)
+    cursor.execute(
+        """
+        SELECT COALESCE(
+            (SELECT form_name
+                FROM kiosk_sales_daily
+                WHERE result = 'Success' AND day BETWEEN ? AND ?
+                GROUP BY form_name
+                ORDER BY SUM(copies) DESC
+                LIMIT 1
+            ), 'None'
+        )
+        """,
+        period_range(period),
+    )
+    form_name = cursor.fetchone()[0]
+    cursor.close()
+    return form_name
@@ -0,0 +1,121 @@
+from collections import OrderedDict
+from PyQt5.QtWidgets import QStackedWidget
+import tracing
+
+
+# Screens kept alive at most. The least recently shown screen is destroyed
+# first; the screen on display is never evicted.
+MAX_SCREENS = 5
+
+
+class ScreenRouter(QStackedWidget):
+    """
+    Stack that shows one kiosk screen at a time and keeps a bounded pool of
+    screen instances.
+
+    Screens are registered by name with a factory that builds the widget and
+    connects its signals, so each connection is made once per instance.
+    show_screen() reuses a pooled screen when the widget has a reset() method
+    that takes the new parameters, and otherwise replaces it with a fresh
+    instance. Replaced and evicted screens are removed from the stack and
+    deleted.
+    """
+
+    def __init__(self, parent=None, max_screens=MAX_SCREENS):
+        super().__init__(parent)
+        self.max_screens = max_screens
+        self.factories = {}
+        self.screens = OrderedDict()
+        self.created = 0
+        self.reused = 0
+        self.destroyed = 0
+
+    def register(self, name, factory):
+        """
+        Registers a factory(*params) that returns a new screen widget.
+        """
+        self.factories[name] = factory
+
+    def screen(self, name):
+        """
+        Returns the pooled screen with that name, or None.
+        """
+        return self.screens.get(name)
+
+    def show_screen(self, name, *params):
+        """
+        Shows the named screen for the given parameters and returns it.
+        """
+        widget = self.screens.get(name)
+        if widget is not None and hasattr(widget, "reset"):
+            with tracing.span(f"screen.reset.{name}"):
+                widget.reset(*params)
+            self.reused += 1
+        else:
+            if widget is not None:
+                self.discard(name, keep_current=True)
+            with tracing.span(f"screen.build.{name}"):
+                widget = self.factories[name](*params)
+            self.addWidget(widget)
+            self.screens[name] = widget
+            self.created += 1
+
+        return self.activate(name, widget)
+
+    def restore(self, name):
+        """
+        Shows the named screen again as it was left, e.g. when going back to
+        it. Builds it without parameters if it is not pooled.
+        """
+        widget = self.screens.get(name)
+        if widget is None:
+            return self.show_screen(name)
+        self.reused += 1
+        return self.activate(name, widget)
+
+    def activate(self, name, widget):
+        previous = self.currentWidget()
+        self.screens.move_to_end(name)
+        self.setCurrentWidget(widget)
+        # Screens hide themselves before asking for the next screen, and the
+        # stack does not show a widget that is already current again
+        widget.show()
+
+        if previous is not None and previous is not widget and previous not in self.screens.values():
+            self.destroy_widget(previous)
+
+        self.evict()
+        return widget
+
+    def evict(self):
+        current = self.currentWidget()
+        while len(self.screens) > self.max_screens:
+            for name, widget in self.screens.items():
+                if widget is not current:
+                    self.discard(name)
+                    break
+            else:
+                break
+
+    def discard(self, name, keep_current=False):
+        """
+        Drops the named screen from the pool so that it is rebuilt the next
+        time it is shown, e.g. after the data it displays changed.
+        """
+        widget = self.screens.pop(name, None)
+        if widget is None:
+            return
+        if keep_current and widget is self.currentWidget():
+            # Stays on display until the replacement is activated
+            return
+        self.destroy_widget(widget)
+
+    def destroy_widget(self, widget):
+        self.removeWidget(widget)
+        widget.hide()
+        widget.deleteLater()
+        self.destroyed += 1
+
+    def clear(self):
+        for name in list(self.screens):
+            self.discard(name)
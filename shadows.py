@@ -0,0 +1,191 @@
+"""Drop shadows painted from cached nine-patch pixmaps."""
+
+from collections import OrderedDict
+from PyQt5.QtCore import QMargins, QPointF, QRectF, QSize, Qt
+from PyQt5.QtGui import QColor, QPainter, QPixmap
+from PyQt5.QtWidgets import (
+    QGraphicsDropShadowEffect,
+    QGraphicsEffect,
+    QGraphicsPixmapItem,
+    QGraphicsScene,
+    qDrawBorderPixmap,
+)
+
+
+# Nine-patches kept for reuse, one per blur, color, corner radius and size
+# of the sides too short to stretch
+SHADOW_CACHE_SIZE = 32
+
+_patches = OrderedDict()
+
+
+def render_shadow(size, blur, color, radius, device_pixel_ratio=1.0):
+    """
+    Returns the shadow QGraphicsDropShadowEffect draws under a rounded
+    rectangle of the given size, on a transparent pixmap with a margin of
+    `blur` on every side.
+    """
+    shape = QPixmap(size * device_pixel_ratio)
+    shape.setDevicePixelRatio(device_pixel_ratio)
+    shape.fill(Qt.transparent)
+    painter = QPainter(shape)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(Qt.black)
+    painter.drawRoundedRect(QRectF(0, 0, size.width(), size.height()), radius, radius)
+    painter.end()
+
+    # The shadow is drawn beside the shape, clear of it, so that only the
+    # shadow is rendered
+    full_size = size + QSize(2 * blur, 2 * blur)
+    effect = QGraphicsDropShadowEffect()
+    effect.setBlurRadius(blur)
+    effect.setColor(color)
+    effect.setOffset(full_size.width(), 0)
+    item = QGraphicsPixmapItem(shape)
+    item.setGraphicsEffect(effect)
+    scene = QGraphicsScene()
+    scene.addItem(item)
+
+    width, height = full_size.width(), full_size.height()
+    both = QPixmap(QSize(2 * width, height) * device_pixel_ratio)
+    both.setDevicePixelRatio(device_pixel_ratio)
+    both.fill(Qt.transparent)
+    painter = QPainter(both)
+    scene.render(
+        painter,
+        QRectF(0, 0, 2 * width, height),
+        QRectF(-blur, -blur, 2 * width, height),
+    )
+    painter.end()
+
+    # The right half, in device pixels
+    half = both.width() // 2
+    shadow = both.copy(half, 0, both.width() - half, both.height())
+    shadow.setDevicePixelRatio(device_pixel_ratio)
+    return shadow
+
+
+def shadow_patch(size, blur, color, radius, device_pixel_ratio=1.0):
+    """
+    Returns (pixmap, margins) of the nine-patch for the shadow of a rounded
+    rectangle of the given size.
+
+    A side is shortened to the shortest length whose middle the corners'
+    blur does not reach, and that middle is one pixel to stretch. A side
+    already shorter than that is kept whole.
+    """
+    color = QColor(color)
+    core = 2 * (radius + blur) + 1
+    width = min(size.width(), core)
+    height = min(size.height(), core)
+
+    key = (width, height, blur, color.rgba(), radius, device_pixel_ratio)
+    pixmap = _patches.get(key)
+    if pixmap is None:
+        pixmap = render_shadow(
+            QSize(width, height), blur, color, radius, device_pixel_ratio
+        )
+        _patches[key] = pixmap
+        while len(_patches) > SHADOW_CACHE_SIZE:
+            _patches.popitem(last=False)
+    else:
+        _patches.move_to_end(key)
+
+    horizontal = blur + width // 2
+    vertical = blur + height // 2
+    margins = QMargins(horizontal, vertical, horizontal, vertical)
+    return pixmap, margins
+
+
+def paint_shadow(painter, rect, blur, color, radius=0, offset=QPointF(0, 0)):
+    """
+    Paints the shadow of a rounded rectangle covering rect, moved by offset.
+    """
+    if rect.isEmpty():
+        return
+    device_pixel_ratio = painter.device().devicePixelRatioF()
+    pixmap, margins = shadow_patch(
+        rect.size(), blur, color, radius, device_pixel_ratio
+    )
+    target = rect.adjusted(-blur, -blur, blur, blur)
+    target.translate(round(offset.x()), round(offset.y()))
+    qDrawBorderPixmap(painter, target, margins, pixmap)
+
+
+def clear_shadow_cache():
+    _patches.clear()
+
+
+class ShadowEffect(QGraphicsEffect):
+    """
+    Drop shadow of a widget that is a rounded rectangle, with the setters of
+    QGraphicsDropShadowEffect plus setRadius() for its corners.
+
+    setMargins() insets the shadowed rectangle, for a widget that only
+    paints inside its layout's margins.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # QGraphicsDropShadowEffect's defaults
+        self.blur_radius = 1
+        self.shadow_color = QColor(63, 63, 63, 180)
+        self.shadow_offset = QPointF(8, 8)
+        self.corner_radius = 0
+        self.margins = QMargins()
+
+    def blurRadius(self):
+        return self.blur_radius
+
+    def setBlurRadius(self, blur_radius):
+        self.blur_radius = int(blur_radius)
+        self.updateBoundingRect()
+
+    def color(self):
+        return self.shadow_color
+
+    def setColor(self, color):
+        self.shadow_color = QColor(color)
+        self.update()
+
+    def offset(self):
+        return self.shadow_offset
+
+    def setOffset(self, dx, dy=None):
+        self.shadow_offset = QPointF(dx) if dy is None else QPointF(dx, dy)
+        self.updateBoundingRect()
+
+    def setRadius(self, radius):
+        self.corner_radius = radius
+        self.update()
+
+    def setMargins(self, margins):
+        self.margins = QMargins(margins)
+        self.updateBoundingRect()
+
+    def shadow_rect(self, rect):
+        rect = rect.adjusted(
+            self.margins.left(),
+            self.margins.top(),
+            -self.margins.right(),
+            -self.margins.bottom(),
+        )
+        blur = self.blur_radius
+        return rect.adjusted(-blur, -blur, blur, blur).translated(self.shadow_offset)
+
+    def boundingRectFor(self, rect):
+        return rect.united(self.shadow_rect(rect))
+
+    def draw(self, painter):
+        rect = self.sourceBoundingRect(Qt.LogicalCoordinates).toAlignedRect()
+        rect = rect.marginsRemoved(self.margins)
+        paint_shadow(
+            painter,
+            rect,
+            self.blur_radius,
+            self.shadow_color,
+            self.corner_radius,
+            self.shadow_offset,
+        )
+        self.drawSource(painter)
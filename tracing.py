@@ -0,0 +1,216 @@
+"""Tracing of the kiosk's hot paths, switched on with KIOSK_TRACE=1."""
+
+import os
+import json
+import math
+import time
+import functools
+import threading
+from collections import deque
+
+
+BUFFER_SIZE = 20_000
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+enabled = os.environ.get("KIOSK_TRACE", "") not in ("", "0")
+
+# (name, start, seconds, thread id); deque appends are atomic, so threads
+# record without a lock
+_spans = deque(maxlen=BUFFER_SIZE)
+
+# Trace timestamps count from here
+_origin = time.perf_counter()
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def clear():
+    _spans.clear()
+
+
+def record(name, start, seconds):
+    """
+    Records a span timed by the caller, e.g. a query already being timed.
+    """
+    if enabled:
+        _spans.append((name, start, seconds, threading.get_ident()))
+
+
+class Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        _spans.append(
+            (self.name, self.start, time.perf_counter() - self.start, threading.get_ident())
+        )
+        return False
+
+
+class NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_null_span = NullSpan()
+
+
+def span(name):
+    """
+    Context manager that records the time spent in its block as a span.
+    """
+    return Span(name) if enabled else _null_span
+
+
+def traced(name):
+    """
+    Decorator that records every call of the function as a span.
+    """
+
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _spans.append(
+                    (name, start, time.perf_counter() - start, threading.get_ident())
+                )
+
+        return wrapper
+
+    return decorate
+
+
+class TracedCalls:
+    """
+    Wraps an object so that each call of its methods is recorded as a span
+    named after the prefix and the method, e.g. a CUPS connection.
+    """
+
+    def __init__(self, target, prefix):
+        self._target = target
+        self._prefix = prefix
+
+    def __getattr__(self, attribute):
+        value = getattr(self._target, attribute)
+        if callable(value):
+            return traced(f"{self._prefix}.{attribute}")(value)
+        return value
+
+
+def spans():
+    """
+    Returns a copy of the spans in the buffer, oldest first.
+    """
+    return list(_spans)
+
+
+def percentile(ordered, percent):
+    # Nearest rank
+    return ordered[max(0, math.ceil(len(ordered) * percent / 100) - 1)]
+
+
+def span_stats():
+    """
+    Returns (name, count, p50, p95, p99, max) per span name in the buffer,
+    in milliseconds, with the most time spent first.
+    """
+    durations = {}
+    for name, _, seconds, _ in spans():
+        durations.setdefault(name, []).append(seconds * 1000)
+
+    stats = []
+    for name, times in durations.items():
+        times.sort()
+        stats.append(
+            (
+                name,
+                len(times),
+                percentile(times, 50),
+                percentile(times, 95),
+                percentile(times, 99),
+                times[-1],
+                sum(times),
+            )
+        )
+    stats.sort(key=lambda stat: stat[6], reverse=True)
+    return [stat[:6] for stat in stats]
+
+
+def rss_mb():
+    """
+    Returns the resident memory of the kiosk in MB, or None where
+    /proc is not available.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE / (1024 * 1024)
+    except OSError:
+        return None
+
+
+def chrome_trace():
+    """
+    Returns the spans in the buffer as a Chrome trace-event document.
+    """
+    pid = os.getpid()
+    events = [
+        {
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": (start - _origin) * 1e6,
+            "dur": seconds * 1e6,
+            "pid": pid,
+            "tid": thread,
+        }
+        for name, start, seconds, thread in spans()
+    ]
+    # Name the threads that are still running
+    for thread in threading.enumerate():
+        events.append(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread.ident,
+                "args": {"name": thread.name},
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def dump_chrome_trace(path):
+    """
+    Writes the spans in the buffer to path as Chrome trace-event JSON.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(chrome_trace(), file)
+    return path
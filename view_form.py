@@ -1,70 +1,74 @@
-import sqlite3
 from PyQt5.QtWidgets import (
     QPushButton,
-    QGridLayout,
     QFrame,
     QVBoxLayout,
-    QScrollArea,
     QLabel,
     QWidget,
     QHBoxLayout,
     QSizePolicy,
-    QGraphicsDropShadowEffect,
-    QSpacerItem,
     QDialog,
     QTextBrowser,
+    QListView,
+    QAbstractItemView,
+    QStyledItemDelegate,
+    QLineEdit,
 )
-from PyQt5.QtGui import QPixmap, QColor
+from collections import OrderedDict
+from PyQt5.QtGui import QPixmap, QColor, QFont, QPainter
 from PyQt5.QtCore import (
     Qt,
     QTimer,
     QEvent,
-    QPropertyAnimation,
-    QEasingCurve,
+    QRect,
+    QSize,
+    QPoint,
     pyqtSignal,
 )
-
-
-class SmoothScrollArea(QScrollArea):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.verticalScrollBar().setSingleStep(15)  # Set the scrolling step size
-        self._mousePressPos = None
-        self._scrollBarValueAtMousePress = None
-        self._animation = QPropertyAnimation(self.verticalScrollBar(), b"value")
-        self._animation.setEasingCurve(QEasingCurve.OutQuad)
-        self._animation.setDuration(500)
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self._mousePressPos = event.globalPos()
-            self._scrollBarValueAtMousePress = self.verticalScrollBar().value()
-            self._animation.stop()  # Stop any ongoing animation when the user interacts
-        super().mousePressEvent(event)
-
-    def mouseMoveEvent(self, event):
-        if self._mousePressPos:
-            delta = event.globalPos() - self._mousePressPos
-            self.verticalScrollBar().setValue(
-                self._scrollBarValueAtMousePress - delta.y()
-            )
-        super().mouseMoveEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        if self._mousePressPos:
-            delta = event.globalPos() - self._mousePressPos
-            target_value = self._scrollBarValueAtMousePress - delta.y()
-            self.smoothScrollTo(target_value)
-        self._mousePressPos = None
-        self._scrollBarValueAtMousePress = None
-        super().mouseReleaseEvent(event)
-
-    def smoothScrollTo(self, target_value):
-        self._animation.setStartValue(self.verticalScrollBar().value())
-        self._animation.setEndValue(target_value)
-        self._animation.start()
+from kiosk_settings import get_settings
+from printer_monitor import get_printer_monitor
+from form_catalog import get_form_catalog, FormListModel, CategoryFilterProxy, FormRole
+from virtual_keyboard import AlphaNeumericVirtualKeyboard
+from kinetic_scroll import KineticScroller
+import form_search
+from assets import get_assets, set_button_images
+from shadows import ShadowEffect, paint_shadow
+
+
+# Size of a form card in the form list, and of the smallest grid cell it is
+# centred in
+CARD_WIDTH = 308
+CARD_HEIGHT = 428
+CELL_WIDTH = 390
+CELL_HEIGHT = 490
+
+# Shadow around a form card, as its QGraphicsDropShadowEffect used to draw
+# it. A card's item covers the card and its shadow, so the shadow is
+# repainted with the card.
+CARD_SHADOW_BLUR = 30
+CARD_SHADOW_COLOR = QColor(0, 0, 0, 150)
+
+# Rendered cards kept for reuse: the visible cards plus a few rows either side
+CARD_CACHE_SIZE = 32
+
+
+def render_card_background(size, radius, blur, color, device_pixel_ratio=1.0):
+    """
+    Returns a white rounded rectangle of the given size with its drop
+    shadow, on a transparent pixmap with a margin of `blur` on every side.
+    """
+    full_size = size + QSize(2 * blur, 2 * blur)
+    background = QPixmap(full_size * device_pixel_ratio)
+    background.setDevicePixelRatio(device_pixel_ratio)
+    background.fill(Qt.transparent)
+    painter = QPainter(background)
+    card = QRect(QPoint(blur, blur), size)
+    paint_shadow(painter, card, blur, color, radius)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor("#FFFFFF"))
+    painter.drawRoundedRect(card, radius, radius)
+    painter.end()
+    return background
 
 
 class WarningMessageBox(QDialog):
@@ -170,10 +174,7 @@ class HelpMessageButton(QPushButton):
             """
         )
 
-        pixmap = QPixmap("./img/static/next_arrow_img.png")
-        scaled_pixmap = pixmap.scaled(
-            15, 35, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        scaled_pixmap = get_assets().static_pixmap("next_arrow_img.png", 15, 35)
 
         self.image_label = QLabel()
         self.image_label.setPixmap(scaled_pixmap)
@@ -223,8 +224,10 @@ class HelpMessageBox(QDialog):
         self.close_button = QPushButton()
         self.close_button.setFocusPolicy(Qt.NoFocus)
         self.close_button.setStyleSheet(
-            "QPushButton {background-color: transparent; border: none; image: url('img/static/close_img.png');}"
-            "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/close_img_pressed.png');}"
+            "QPushButton {background-color: transparent; border: none;}"
+        )
+        set_button_images(
+            self.close_button, "close_img.png", "close_img_pressed.png", QSize(45, 45)
         )
         self.close_button.setFixedSize(45, 45)
         self.close_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -249,8 +252,10 @@ class HelpMessageBox(QDialog):
         self.back_button.setFocusPolicy(Qt.NoFocus)
         self.back_button.setFixedSize(30, 30)
         self.back_button.setStyleSheet(
-            "QPushButton {background-color: transparent; border: none; image: url('img/static/back_img.png');}"
-            "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/back_img_pressed.png');}"
+            "QPushButton {background-color: transparent; border: none;}"
+        )
+        set_button_images(
+            self.back_button, "back_img.png", "back_img_pressed.png", QSize(30, 30)
         )
         self.back_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.back_button.clicked.connect(self.go_back)
@@ -620,118 +625,210 @@ class HelpMessageBox(QDialog):
         self.close_message_clicked.emit()
 
 
-class ButtonWidget(QWidget):
-    buttonClicked = pyqtSignal(str, str)
-
-    def __init__(self, title_label, page_number_label, description_label, category):
-        super().__init__()
-        self.title_text = title_label
-        self.page_number_text = page_number_label
-        self.description_text = description_label
-        self.category = category
+class FormCardDelegate(QStyledItemDelegate):
+    """
+    Paints a form of the form list as a card with its title, page count,
+    description and a View button.
 
-        self.initUI()
+    The card, its shadow and its text are rendered once into a pixmap that
+    is kept while the card is on or near the screen, so scrolling only
+    copies pixmaps. The View button is painted over it on every paint, as
+    it changes colour while pressed.
+    """
 
-    def initUI(self):
-        layout = QVBoxLayout()
-
-        # Create a QFrame to contain the labels and button
-        self.frame = QFrame(self)
-        # Apply shadow effect to the frame
-        self.applyShadowEffect()
-
-        # Labels
-        self.title_label = QLabel(self.title_text)
-        self.title_label.setWordWrap(True)
-        self.title_label.setStyleSheet(
-            """
-                font-family: Montserrat;
-                font-size: 19px;
-                font-weight: bold;
-                padding-top: 15px;
-                padding-left: 15px;
-                padding-right: 15px;
-                color: #7C2F3E;
-            """
+    def __init__(self, parent=None, cache_size=CARD_CACHE_SIZE):
+        super().__init__(parent)
+        self.paper_pixmap = get_assets().static_pixmap("paper_img.png")
+        # Row whose View button is held down
+        self.pressed_row = None
+
+        self.title_font = QFont("Montserrat")
+        self.title_font.setPixelSize(19)
+        self.title_font.setBold(True)
+        self.description_font = QFont("Open Sans")
+        self.description_font.setPixelSize(13)
+        self.button_font = QFont("Montserrat")
+        self.button_font.setPixelSize(16)
+        self.button_font.setBold(True)
+
+        # Background per device pixel ratio, and (form, ratio) -> card
+        self.backgrounds = {}
+        self.cache_size = cache_size
+        self.cards = OrderedDict()
+
+    def sizeHint(self, option, index):
+        return QSize(CARD_WIDTH + 2 * CARD_SHADOW_BLUR, CARD_HEIGHT + 2 * CARD_SHADOW_BLUR)
+
+    def card_rect(self, item):
+        # The card is centred horizontally in its item, below its shadow
+        x = item.x() + (item.width() - CARD_WIDTH) // 2
+        return QRect(x, item.y() + CARD_SHADOW_BLUR, CARD_WIDTH, CARD_HEIGHT)
+
+    def button_rect(self, item):
+        card = self.card_rect(item)
+        return QRect(card.left() + 36, card.bottom() - 95, card.width() - 72, 70)
+
+    def background(self, size, device_pixel_ratio):
+        if device_pixel_ratio not in self.backgrounds:
+            self.backgrounds[device_pixel_ratio] = render_card_background(
+                size, 15, CARD_SHADOW_BLUR, CARD_SHADOW_COLOR, device_pixel_ratio
+            )
+        return self.backgrounds[device_pixel_ratio]
+
+    def card_pixmap(self, form, size, font, device_pixel_ratio):
+        key = (form, device_pixel_ratio)
+        pixmap = self.cards.get(key)
+        if pixmap is not None:
+            self.cards.move_to_end(key)
+            return pixmap
+
+        pixmap = QPixmap(self.background(size, device_pixel_ratio))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self.paint_text(
+            painter,
+            QRect(CARD_SHADOW_BLUR, CARD_SHADOW_BLUR, size.width(), size.height()),
+            form,
+            font,
         )
+        painter.end()
 
-        self.num_pages_layout = QHBoxLayout()
+        if self.cache_size:
+            self.cards[key] = pixmap
+            while len(self.cards) > self.cache_size:
+                self.cards.popitem(last=False)
+        return pixmap
 
-        self.bondpaper_img = QLabel()
-        self.pixmap = QPixmap("./img/static/paper_img.png")
-        self.bondpaper_img.setPixmap(self.pixmap)
+    def paint_text(self, painter, card, form, font):
+        content = card.adjusted(26, 26, -26, 0)
 
-        self.page_number_label = QLabel(self.page_number_text)
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#7C2F3E"))
+        title_rect = painter.boundingRect(
+            content, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, form.name
+        )
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, form.name)
+
+        y = title_rect.bottom() + 12
+        painter.drawPixmap(content.left(), y, self.paper_pixmap)
+        painter.setFont(font)
+        painter.setPen(QColor("#000000"))
+        painter.drawText(
+            QRect(
+                content.left() + self.paper_pixmap.width() + 8,
+                y,
+                content.width(),
+                self.paper_pixmap.height(),
+            ),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            str(form.pages),
+        )
 
-        self.num_pages_layout.addWidget(self.bondpaper_img)
-        self.num_pages_layout.addWidget(self.page_number_label)
+        # The description stops above the View button
+        y += self.paper_pixmap.height() + 12
+        button_top = card.bottom() - 95
+        painter.setFont(self.description_font)
+        painter.drawText(
+            QRect(content.left(), y, content.width(), button_top - 15 - y),
+            Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap,
+            form.description,
+        )
 
-        self.num_pages_layout.setContentsMargins(15, 0, 180, 0)
+    def paint(self, painter, option, index):
+        form = index.data(FormRole)
+        card = self.card_rect(option.rect)
+        device_pixel_ratio = painter.device().devicePixelRatioF()
 
-        self.description_label = QLabel(self.description_text)
-        self.description_label.setStyleSheet(
-            """
-            font-family: Open Sans;
-            font-size: 13px;
-            """
+        painter.save()
+        painter.drawPixmap(
+            card.topLeft() - QPoint(CARD_SHADOW_BLUR, CARD_SHADOW_BLUR),
+            self.card_pixmap(form, card.size(), option.font, device_pixel_ratio),
         )
-        self.description_label.setWordWrap(True)
-        self.description_label.setContentsMargins(15, 0, 15, 0)
 
-        # Button
-        self.button = QPushButton("View")
-        self.button.setFocusPolicy(Qt.NoFocus)
-        self.button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #7C2F3E; 
-                color: #FAEBD7; 
-                font-family: Montserrat;
-                font-size: 16px; 
-                font-weight: bold; 
-                border-radius: 10px;
-                border: none;
-                margin-left: 25px;
-                margin-right: 25px;
-                margin-bottom: 15px;
-                min-width: 150px;
-                min-height: 70px;
-            }
-            QPushButton:pressed {
-                background-color: #D8973C;
-            }
-            """
-        )
-        self.button.clicked.connect(self.emitButtonClickedSignal)
+        painter.setRenderHint(QPainter.Antialiasing)
+        button = self.button_rect(option.rect)
+        painter.setPen(Qt.NoPen)
+        pressed = self.pressed_row == index.row()
+        painter.setBrush(QColor("#D8973C" if pressed else "#7C2F3E"))
+        painter.drawRoundedRect(button, 10, 10)
+        painter.setFont(self.button_font)
+        painter.setPen(QColor("#FAEBD7"))
+        painter.drawText(button, Qt.AlignCenter, "View")
+        painter.restore()
 
-        # Add labels and button to the layout
-        layout.addWidget(self.title_label)
-        layout.addLayout(self.num_pages_layout)
-        layout.addWidget(self.description_label)
 
-        # Add vertical spacer
-        spacer_item = QSpacerItem(20, 95, QSizePolicy.Minimum, QSizePolicy.Preferred)
-        layout.addItem(spacer_item)
+class FormGridView(QListView):
+    """
+    Grid of form cards over a form list model, scrolled by dragging.
+    form_clicked(form) is emitted when a card's View button is tapped.
+    """
 
-        layout.addWidget(self.button)
+    form_clicked = pyqtSignal(object)
 
-        # Set layout to the QFrame
-        self.frame.setLayout(layout)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.IconMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)
+        # Lay out a few screens of cards at a time, so the first results of
+        # a search are painted before the rest of the grid is laid out
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(48)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setStyleSheet("background-color: transparent;")
+        self.verticalScrollBar().setSingleStep(15)
+
+        self.delegate = FormCardDelegate(self)
+        self.setItemDelegate(self.delegate)
+        self.setGridSize(QSize(CELL_WIDTH, CELL_HEIGHT))
+
+        # Dragging scrolls the grid; a tap on a View button opens the form
+        self.scroller = KineticScroller(self)
+        self.scroller.drag_started.connect(lambda: self.set_pressed_row(None))
+
+    def resizeEvent(self, event):
+        # Spread the columns over the width of the view
+        columns = max(1, self.viewport().width() // CELL_WIDTH)
+        width = max(CELL_WIDTH, self.viewport().width() // columns)
+        if self.gridSize().width() != width:
+            self.setGridSize(QSize(width, CELL_HEIGHT))
+        super().resizeEvent(event)
+
+    def button_index_at(self, pos):
+        index = self.indexAt(pos)
+        if index.isValid() and self.delegate.button_rect(self.visualRect(index)).contains(pos):
+            return index
+        return None
+
+    def set_pressed_row(self, row):
+        self.delegate.pressed_row = row
+        self.viewport().update()
 
-        # Set the main layout for the widget
-        self.setLayout(QVBoxLayout())
-        self.layout().addWidget(self.frame)
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            index = self.button_index_at(event.pos())
+            if index is not None:
+                self.set_pressed_row(index.row())
 
-    def applyShadowEffect(self):
-        shadow_effect = QGraphicsDropShadowEffect()
-        shadow_effect.setBlurRadius(30)
-        shadow_effect.setColor(QColor(0, 0, 0, 150))
-        shadow_effect.setOffset(0, 0)
-        self.frame.setGraphicsEffect(shadow_effect)
+    def mouseMoveEvent(self, event):
+        # Drags are followed by the scroller; QListView would start a
+        # rubber band selection
+        pass
 
-    def emitButtonClickedSignal(self):
-        # Emit the signal with necessary data
-        self.buttonClicked.emit(self.title_label.text(), self.page_number_label.text())
+    def mouseReleaseEvent(self, event):
+        if not self.scroller.dragged:
+            index = self.button_index_at(event.pos())
+            if index is not None and index.row() == self.delegate.pressed_row:
+                self.form_clicked.emit(index.data(FormRole))
+        self.set_pressed_row(None)
 
 
 class ViewFormWidget(QWidget):
@@ -742,17 +839,8 @@ class ViewFormWidget(QWidget):
     def __init__(self, parent, is_printer_available):
         super().__init__(parent)
         self.setup_ui(is_printer_available)
-
-        # Connect navigation buttons to their respective slots
-        self.nav_btn_all.clicked.connect(self.filter_buttons_all)
-        self.nav_btn_category1.clicked.connect(self.filter_buttons_category1)
-        self.nav_btn_category2.clicked.connect(self.filter_buttons_category2)
-        self.nav_btn_category3.clicked.connect(self.filter_buttons_category3)
-        self.nav_btn_category4.clicked.connect(self.filter_buttons_category4)
-        self.nav_btn_category5.clicked.connect(self.filter_buttons_category5)
-        self.nav_btn_category6.clicked.connect(self.filter_buttons_category6)
-        self.nav_btn_category7.clicked.connect(self.filter_buttons_category7)
-        self.nav_btn_category8.clicked.connect(self.filter_buttons_category8)
+        get_settings().settings_changed.connect(self.update_settings_slot)
+        get_printer_monitor().availability_changed.connect(self.update_printer_slot)
 
         # Set the active button initially
         self.active_button = self.nav_btn_all
@@ -766,20 +854,11 @@ class ViewFormWidget(QWidget):
         self.installEventFilter(self)
 
     def setup_ui(self, is_printer_available):
-        # connect database
-        conn = sqlite3.connect("./database/kiosk.db")
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT coins_left FROM kiosk_settings LIMIT 1")
-        self.coins_left = cursor.fetchone()[0]
-
-        cursor.execute("SELECT bondpaper_quantity FROM kiosk_settings LIMIT 1")
-        self.bondpaper_quantity = cursor.fetchone()[0]
-
-        cursor.execute("SELECT ink_level FROM kiosk_settings LIMIT 1")
-        self.ink_level = cursor.fetchone()[0]
-
-        conn.close()
+        # Read the cached kiosk settings
+        settings = get_settings()
+        self.coins_left = settings.coins_left
+        self.bondpaper_quantity = settings.bondpaper_quantity
+        self.ink_level = settings.ink_level
 
         layout = QVBoxLayout(self)
 
@@ -788,8 +867,10 @@ class ViewFormWidget(QWidget):
 
         help_button = QPushButton()
         help_button.setStyleSheet(
-            "QPushButton {background-color: transparent; border: none; image: url('img/static/help_img.png');}"
-            "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/help_img_pressed.png');}"
+            "QPushButton {background-color: transparent; border: none;}"
+        )
+        set_button_images(
+            help_button, "help_img.png", "help_img_pressed.png", QSize(65, 65)
         )
         help_button.setFixedSize(65, 65)
         help_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -805,11 +886,12 @@ class ViewFormWidget(QWidget):
             "QFrame { background-color: #FDFDFD; border-radius: 20px; }"
         )
 
-        # Create a QGraphicsDropShadowEffect
-        shadow_effect = QGraphicsDropShadowEffect()
+        # Create a ShadowEffect
+        shadow_effect = ShadowEffect()
         shadow_effect.setBlurRadius(50)
         shadow_effect.setColor(Qt.gray)
         shadow_effect.setOffset(0, 0)  # Adjust the shadow's offset as needed
+        shadow_effect.setRadius(20)
 
         # Apply the effect to the rectangle
         rectangle.setGraphicsEffect(shadow_effect)
@@ -851,20 +933,20 @@ class ViewFormWidget(QWidget):
         self.bondpaper_warning.clicked.connect(self.low_bondpaper)
         self.bondpaper_warning.hide()
         bondpaper_img = QLabel()
-        pixmap = QPixmap("./img/static/bondpaper_quantity.png")
+        pixmap = get_assets().static_pixmap("bondpaper_quantity.png")
         bondpaper_img.setPixmap(pixmap)
-        bondpaper_label = QLabel(str(self.bondpaper_quantity))
+        self.bondpaper_label = QLabel(str(self.bondpaper_quantity))
         bondpaper_layout.addWidget(self.bondpaper_warning)
         bondpaper_layout.addWidget(bondpaper_img)
-        bondpaper_layout.addWidget(bondpaper_label, alignment=Qt.AlignLeft)
+        bondpaper_layout.addWidget(self.bondpaper_label, alignment=Qt.AlignLeft)
 
         # Coins widgets
         coins_img = QLabel()
-        pixmap = QPixmap("./img/static/coins_img.png")
+        pixmap = get_assets().static_pixmap("coins_img.png")
         coins_img.setPixmap(pixmap)
-        coins_label = QLabel(f"{self.coins_left:0.2f}")
+        self.coins_label = QLabel(f"{self.coins_left:0.2f}")
         coins_layout.addWidget(coins_img)
-        coins_layout.addWidget(coins_label, alignment=Qt.AlignLeft)
+        coins_layout.addWidget(self.coins_label, alignment=Qt.AlignLeft)
 
         # Printer widgets
         self.printer_warning = QPushButton("!")
@@ -888,7 +970,7 @@ class ViewFormWidget(QWidget):
         self.printer_warning.clicked.connect(self.printer_not_connected)
         self.printer_warning.hide()
         printer_img = QLabel()
-        pixmap = QPixmap("./img/static/printer_img.png")
+        pixmap = get_assets().static_pixmap("printer_img.png")
         printer_img.setPixmap(pixmap)
         self.printer_status_symbol = QLabel("✓")
         printer_layout.addWidget(self.printer_warning)
@@ -917,7 +999,7 @@ class ViewFormWidget(QWidget):
         self.ink_warning.clicked.connect(self.low_ink)
         self.ink_warning.hide()
         ink_img = QLabel()
-        pixmap = QPixmap("./img/static/ink_img.png")
+        pixmap = get_assets().static_pixmap("ink_img.png")
         ink_img.setPixmap(pixmap)
         self.ink_status_symbol = QLabel("✓")
         ink_layout.addWidget(self.ink_warning)
@@ -933,184 +1015,142 @@ class ViewFormWidget(QWidget):
         layout.addLayout(rectangle_layout)
 
         self.is_printer_available = is_printer_available
-        self.bondpaper_supply = True
-        self.ink_supply = True
+        self.update_supply_status()
 
-        if self.bondpaper_quantity <= 0:
-            self.bondpaper_supply = False
+        # Navigation bar with a button per category of the form catalog
+        self.catalog = get_form_catalog()
+        self.nav_layout = QHBoxLayout()
+        self.nav_buttons = []
+        self.build_nav_buttons()
 
-        if self.ink_level <= 0:
-            self.ink_supply = False
-            self.printer_status_symbol.setText("✕")
+        # Align the navigation bar to the top
+        self.nav_layout.setAlignment(Qt.AlignTop)
+        self.nav_layout.setSpacing(50)
+        self.nav_layout.setContentsMargins(100, 20, 0, 0)
 
-        if self.bondpaper_quantity <= 5:
-            self.bondpaper_warning.show()
+        # Search box on the right of the navigation bar, typed into with the
+        # on-screen keyboard
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search forms")
+        self.search_input.setStyleSheet(
+            """
+            QLineEdit {
+                font-family: Open Sans;
+                border: 2px solid #b3b3b3;
+                border-radius: 10px;
+                padding-left: 10px;
+                padding-right: 10px;
+                font-size: 14px;
+                background-color: #ffffff;
+                color: #444444;
+            }
+            QLineEdit:focus {
+                border: 2px solid #7C2F3E;
+                background-color: #ffffff;
+            }
+            """
+        )
+        self.search_input.setFixedSize(300, 50)
+        self.search_input.mousePressEvent = self.search_clicked
+        self.search_input.textChanged.connect(self.search_forms)
+
+        self.virtual_keyboard = AlphaNeumericVirtualKeyboard("", parent=self)
+        self.virtual_keyboard.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
+        self.virtual_keyboard.hide()
+
+        nav_bar_layout = QHBoxLayout()
+        nav_bar_layout.addLayout(self.nav_layout)
+        nav_bar_layout.addStretch()
+        nav_bar_layout.addWidget(
+            self.search_input, alignment=Qt.AlignBottom | Qt.AlignRight
+        )
+        nav_bar_layout.setContentsMargins(0, 0, 60, 0)
 
-        if self.ink_level <= 75:
-            self.ink_warning.show()
+        layout.addLayout(nav_bar_layout)
 
-        if not is_printer_available:
-            self.printer_warning.show()
-            self.printer_status_symbol.setText("✕")
+        # Form cards, filtered by category and search through the proxy model
+        self.form_model = FormListModel(self.catalog, self)
+        self.form_proxy = CategoryFilterProxy(self.catalog, self)
+        self.form_proxy.setSourceModel(self.form_model)
+
+        self.form_grid = FormGridView()
+        self.form_grid.setModel(self.form_proxy)
+        self.form_grid.form_clicked.connect(self.open_form)
+        self.form_grid.setContentsMargins(20, 20, 30, 0)
+
+        layout.addWidget(self.form_grid)
+        self.catalog.catalog_changed.connect(self.update_nav_buttons)
+        self.catalog.catalog_changed.connect(self.refresh_search)
 
+    def build_nav_buttons(self):
         self.nav_btn_all = QPushButton("All")
         self.nav_btn_all.setFocusPolicy(Qt.NoFocus)
-        self.nav_btn_category1 = QPushButton("Accreditation")
-        self.nav_btn_category1.setFocusPolicy(Qt.NoFocus)
-        self.nav_btn_category2 = QPushButton("Clearance")
-        self.nav_btn_category2.setFocusPolicy(Qt.NoFocus)
-        self.nav_btn_category3 = QPushButton("Enrollment")
-        self.nav_btn_category3.setFocusPolicy(Qt.NoFocus)
-        self.nav_btn_category4 = QPushButton("Graduation")
-        self.nav_btn_category4.setFocusPolicy(Qt.NoFocus)
-        self.nav_btn_category5 = QPushButton("Petition")
-        self.nav_btn_category5.setFocusPolicy(Qt.NoFocus)
-        self.nav_btn_category6 = QPushButton("Research")
-        self.nav_btn_category6.setFocusPolicy(Qt.NoFocus)
-        self.nav_btn_category7 = QPushButton("Controlled Forms")
-        self.nav_btn_category7.setFocusPolicy(Qt.NoFocus)
-        self.nav_btn_category8 = QPushButton("Others")
-        self.nav_btn_category8.setFocusPolicy(Qt.NoFocus)
-
-        # Set size policy for navigation buttons to Fixed
         self.nav_btn_all.setFixedSize(140, 65)
         self.nav_btn_all.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.nav_btn_category1.setFixedHeight(65)
-        self.nav_btn_category1.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.nav_btn_category2.setFixedHeight(65)
-        self.nav_btn_category2.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.nav_btn_category3.setFixedHeight(65)
-        self.nav_btn_category3.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.nav_btn_category4.setFixedHeight(65)
-        self.nav_btn_category4.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.nav_btn_category5.setFixedHeight(65)
-        self.nav_btn_category5.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.nav_btn_category6.setFixedHeight(65)
-        self.nav_btn_category6.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.nav_btn_category7.setFixedHeight(65)
-        self.nav_btn_category7.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        self.nav_btn_category8.setFixedHeight(65)
-        self.nav_btn_category8.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-
-        self.nav_layout = QHBoxLayout()
-        self.nav_buttons = [
-            self.nav_btn_all,
-            self.nav_btn_category1,
-            self.nav_btn_category2,
-            self.nav_btn_category3,
-            self.nav_btn_category4,
-            self.nav_btn_category5,
-            self.nav_btn_category6,
-            self.nav_btn_category7,
-            self.nav_btn_category8,
-        ]
+        self.nav_btn_all.clicked.connect(self.filter_buttons_all)
+        self.nav_buttons = [self.nav_btn_all]
+
+        for category, label in self.catalog.categories:
+            button = QPushButton(label)
+            button.setFocusPolicy(Qt.NoFocus)
+            button.setFixedHeight(65)
+            button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+            button.clicked.connect(
+                lambda _, button=button, category=category: self.filter_buttons_category(
+                    button, category
+                )
+            )
+            self.nav_buttons.append(button)
 
         for button in self.nav_buttons:
             self.nav_layout.addWidget(button)
 
-        # Apply common CSS style to navigation buttons
-        nav_css = """
-            QPushButton {
-                font-family: Montserrat;
-                font-size: 16px;
-                font-weight: bold;
-                border: none;
-                padding-bottom: 8px;
-            }
-        """
-
-        # Set style sheet for navigation bar buttons
-        self.nav_btn_all.setStyleSheet(
-            """
-            QPushButton { 
-                font-family: Montserrat; 
-                font-size: 16px; 
-                font-weight: bold; 
-                border: none; 
-                border-bottom: 2px solid #7C2F3E; 
-                padding-bottom: 10px; 
-            }
-            """
-        )
-        self.nav_btn_category1.setStyleSheet(nav_css)
-        self.nav_btn_category2.setStyleSheet(nav_css)
-        self.nav_btn_category3.setStyleSheet(nav_css)
-        self.nav_btn_category4.setStyleSheet(nav_css)
-        self.nav_btn_category5.setStyleSheet(nav_css)
-        self.nav_btn_category6.setStyleSheet(nav_css)
-        self.nav_btn_category7.setStyleSheet(nav_css)
-        self.nav_btn_category8.setStyleSheet(nav_css)
-
-        # Align the navigation bar to the top
-        self.nav_layout.setAlignment(Qt.AlignTop)
-        self.nav_layout.setSpacing(50)
-        self.nav_layout.setContentsMargins(100, 20, 0, 0)
+    def update_nav_buttons(self):
+        # Categories may have been added with a new form
+        if [button.text() for button in self.nav_buttons[1:]] == [
+            label for _, label in self.catalog.categories
+        ]:
+            return
 
-        layout.addLayout(self.nav_layout)
-
-        # Add ButtonWidgets
-        button_labels = fetch_button_labels()
-
-        self.grid_layout = QGridLayout()
-        self.grid_layout.setSpacing(20)
-
-        num_forms = len(button_labels["form_names"])
-        num_columns = 4
-        num_rows = (num_forms + num_columns - 1) // num_columns
-
-        for i, (
-            form_name,
-            number_of_pages,
-            form_description,
-            form_category,
-        ) in enumerate(
-            zip(
-                button_labels["form_names"],
-                button_labels["num_of_pages"],
-                button_labels["form_description"],
-                button_labels["form_category"],
-            )
-        ):
-            button_widget = ButtonWidget(
-                form_name, str(number_of_pages), form_description, form_category
-            )
-            button_widget.setFixedHeight(450)
-            button_widget.setFixedWidth(330)
-            button_widget.setStyleSheet(
-                """
-                    background-color: #FFFFFF;
-                    border-radius: 15px
-                """
-            )
-            row = i // num_columns
-            col = i % num_columns
-            self.grid_layout.addWidget(button_widget, row, col)
-
-            # Connect the buttonClicked signal to the handleButtonClicked slot
-            button_widget.buttonClicked.connect(self.handleButtonClicked)
-
-        scroll_area = SmoothScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_widget = QWidget()  # Create a widget to hold the grid layout
-        scroll_widget.setStyleSheet("background-color: transparent;")
-
-        scroll_area_layout = QVBoxLayout(scroll_widget)
-        scroll_area_layout.addLayout(self.grid_layout)
-        scroll_area_layout.setContentsMargins(20, 20, 30, 0)
-
-        scroll_area.setWidget(
-            scroll_widget
-        )  # Set the scroll widget as the scroll area's widget
-        scroll_area.setStyleSheet(
-            """
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            """
-        )
+        for button in self.nav_buttons:
+            self.nav_layout.removeWidget(button)
+            button.deleteLater()
+        self.build_nav_buttons()
+        self.active_button = self.nav_btn_all
+        self.form_proxy.set_category(None)
+        self.update_button_styles()
 
-        layout.addWidget(scroll_area)
+    # Slot to keep the labels in step with the cached kiosk settings
+    def update_settings_slot(self, field, value):
+        if field == "bondpaper_quantity":
+            self.bondpaper_quantity = value
+            self.bondpaper_label.setText(str(value))
+        elif field == "coins_left":
+            self.coins_left = value
+            self.coins_label.setText(f"{value:0.2f}")
+        elif field == "ink_level":
+            self.ink_level = value
+        if field in ("bondpaper_quantity", "ink_level"):
+            self.update_supply_status()
+
+    # Slot to follow printer availability from the printer monitor
+    def update_printer_slot(self, is_available):
+        self.is_printer_available = is_available
+        self.update_supply_status()
+
+    def update_supply_status(self):
+        # Work out what can be printed from the bondpaper, ink and printer
+        self.bondpaper_supply = self.bondpaper_quantity > 0
+        self.ink_supply = self.ink_level > 0
+
+        self.bondpaper_warning.setVisible(self.bondpaper_quantity <= 5)
+        self.ink_warning.setVisible(self.ink_level <= 75)
+        self.printer_warning.setVisible(not self.is_printer_available)
+
+        if self.ink_supply and self.is_printer_available:
+            self.printer_status_symbol.setText("✓")
+        else:
+            self.printer_status_symbol.setText("✕")
 
     def update_button_styles(self):
         # Reset style for all buttons
@@ -1147,93 +1187,41 @@ class ViewFormWidget(QWidget):
         self.update_button_styles()
         self.reset_inactivity_timer()
 
-    def filter_buttons_category1(self):
-        self.active_button = self.nav_btn_category1
-        self.filter_buttons("Accreditation")  # Filter by category
+    def filter_buttons_category(self, button, category):
+        self.active_button = button
+        self.filter_buttons(category)  # Filter by category
         self.update_button_styles()
         self.reset_inactivity_timer()
 
-    def filter_buttons_category2(self):
-        self.active_button = self.nav_btn_category2
-        self.filter_buttons("Clearance")  # Filter by category
-        self.update_button_styles()
-        self.reset_inactivity_timer()
-
-    def filter_buttons_category3(self):
-        self.active_button = self.nav_btn_category3
-        self.filter_buttons("Enrollment")  # Filter by category
-        self.update_button_styles()
-        self.reset_inactivity_timer()
-
-    def filter_buttons_category4(self):
-        self.active_button = self.nav_btn_category4
-        self.filter_buttons("Graduation")  # Filter by category
-        self.update_button_styles()
-        self.reset_inactivity_timer()
-
-    def filter_buttons_category5(self):
-        self.active_button = self.nav_btn_category5
-        self.filter_buttons("Petition")  # Filter by category
-        self.update_button_styles()
-        self.reset_inactivity_timer()
+    def filter_buttons(self, category):
+        # Only the forms in the catalog's index for the category are shown
+        self.form_proxy.set_category(category)
+        self.form_grid.scrollToTop()
 
-    def filter_buttons_category6(self):
-        self.active_button = self.nav_btn_category6
-        self.filter_buttons("Research")  # Filter by category
-        self.update_button_styles()
+    def search_clicked(self, event):
+        self.virtual_keyboard.display(self.search_input)
         self.reset_inactivity_timer()
 
-    def filter_buttons_category7(self):
-        self.active_button = self.nav_btn_category7
-        self.filter_buttons("Controlled Forms")  # Filter by category
-        self.update_button_styles()
+    def search_forms(self, text):
+        # Runs on every keystroke; the index answers in well under a frame
+        self.form_proxy.set_search_ids(form_search.search(text, self.catalog))
+        self.form_grid.scrollToTop()
         self.reset_inactivity_timer()
 
-    def filter_buttons_category8(self):
-        self.active_button = self.nav_btn_category8
-        self.filter_buttons("Other")  # Filter by category
-        self.update_button_styles()
-        self.reset_inactivity_timer()
-
-    def filter_buttons(self, category):
-        visible_widgets = []  # Maintain a list of visible widgets
-        for i in range(self.grid_layout.count()):
-            item = self.grid_layout.itemAt(i)
-            if isinstance(item.widget(), ButtonWidget):
-                widget = item.widget()
-                if category is None or widget.category == category:
-                    widget.show()
-                    visible_widgets.append(widget)  # Add visible widgets to the list
-                else:
-                    widget.hide()
-
-        # Calculate the number of columns based on the number of visible widgets
-        num_visible_widgets = len(visible_widgets)
-        num_columns = min(num_visible_widgets, self.grid_layout.columnCount())
-
-        # Adjust the layout to accommodate the visible widgets
-        row = 0
-        col = 0
-        for i, widget in enumerate(visible_widgets):
-            if col >= num_columns:
-                row += 1
-                col = 0
-            self.grid_layout.addWidget(widget, row, col)
-            col += 1
-
-        # If the number of visible widgets is less than or equal to 3, align the layout to the left
-        if num_visible_widgets <= 3:
-            self.grid_layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-            self.grid_layout.setContentsMargins(40, 0, 0, 0)
-        else:
-            self.grid_layout.setAlignment(Qt.AlignTop | Qt.AlignCenter)
-            self.grid_layout.setContentsMargins(0, 0, 0, 0)
+    def refresh_search(self):
+        # A form was added, edited or deleted while a search is shown
+        if self.search_input.text().strip():
+            self.form_proxy.set_search_ids(
+                form_search.search(self.search_input.text(), self.catalog)
+            )
 
-        self.grid_layout.setHorizontalSpacing(60)
+    def open_form(self, form):
+        self.handleButtonClicked(form.name, str(form.pages))
 
     # Function to handle the emitted signal
     def handleButtonClicked(self, title, page_number):
         self.inactivity_timer.stop()
+        self.virtual_keyboard.hide()
         controlled_form = [
             "Completion Form for Incomplete Grades",
             "Removal Form",
@@ -1303,40 +1291,18 @@ class ViewFormWidget(QWidget):
             self.inactivity_timer.stop()
         self.inactivity_timer.start()
 
+    def reset(self, is_printer_available):
+        # Called when the screen is shown again instead of building a new one
+        settings = get_settings()
+        for field in ("bondpaper_quantity", "coins_left", "ink_level"):
+            self.update_settings_slot(field, getattr(settings, field))
+        self.update_printer_slot(is_printer_available)
+        self.search_input.clear()
+        self.filter_buttons_all()
+
     def go_back(self):
         self.inactivity_timer.stop()
+        self.virtual_keyboard.hide()
         self.setVisible(False)
         self.go_back_clicked.emit()
 
-
-def fetch_button_labels():
-    conn = sqlite3.connect("./database/kiosk.db")
-    cursor = conn.cursor()
-
-    cursor.execute(
-        "SELECT form_name, number_of_pages, form_description, form_category FROM kiosk_forms"
-    )
-    rows = cursor.fetchall()
-
-    conn.close()
-
-    form_names = []
-    num_of_pages = []
-    form_description = []
-    form_category = []
-
-    for row in rows:
-        form_names.append(row[0])
-        num_of_pages.append(row[1])
-        form_description.append(row[2])
-        form_category.append(row[3])
-
-    # Create a dictionary to store the lists
-    button_labels = {
-        "form_names": form_names,
-        "num_of_pages": num_of_pages,
-        "form_description": form_description,
-        "form_category": form_category,
-    }
-
-    return button_labels
@@ -1,25 +1,20 @@
-import glob
+import process_images
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QPushButton,
     QLabel,
     QHBoxLayout,
-    QGraphicsDropShadowEffect,
     QSizePolicy,
-    QGraphicsView,
-    QGraphicsScene,
 )
-from PyQt5.QtCore import Qt, QRectF, pyqtSignal
+from PyQt5.QtCore import Qt, QRectF, QSize, pyqtSignal
 from PyQt5.QtGui import (
-    QPixmap,
     QIcon,
-    QImage,
     QPainter,
-    QBrush,
-    QColor,
     QPainterPath,
 )
+from assets import get_assets, set_button_images
+from shadows import ShadowEffect
 
 
 class ProcessButton(QPushButton):
@@ -29,14 +24,10 @@ class ProcessButton(QPushButton):
         self.border_radius = 35  # Set the desired border radius here
         self.setFocusPolicy(Qt.NoFocus)
 
-        # Use glob to search for both .png and .jpg files
-        image_paths = glob.glob(f"./img/process/{title}.[pj][np]g")
-        if image_paths:
-            self.image_path = image_paths[0]
-            self.pixmap = QPixmap(self.image_path)
-        else:
+        # Process image scaled to the button's size, or an empty pixmap
+        self.pixmap = process_images.process_button_pixmap(title)
+        if self.pixmap.isNull():
             print(f"Image not found: {title}.png or {title}.jpg")
-            self.pixmap = QPixmap()  # Create an empty pixmap if image is not found
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -64,10 +55,9 @@ class ProcessButton(QPushButton):
 
 
 class MapButton(QPushButton):
-    def __init__(self, image_path, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.image_path = image_path
-        self.pixmap = QPixmap(self.image_path)
+        self.pixmap = process_images.map_button_pixmap()
         self.border_radius = 35  # Set the desired border radius here
         self.setFocusPolicy(Qt.NoFocus)
 
@@ -129,7 +119,7 @@ class ButtonWidget(QWidget):
         layout.addWidget(process_button)
 
         # Create a map button
-        map_button = MapButton("./img/process/map.jpg", self)
+        map_button = MapButton(self)
         map_button.setText("View Map")
         map_button.setStyleSheet(
             """
@@ -182,41 +172,35 @@ class ProcessWidget(QWidget):
         close_bt.setFocusPolicy(Qt.NoFocus)
         close_bt.setFixedSize(50, 50)
         close_bt.setStyleSheet(
-            "QPushButton {background-color: transparent; border: none; image: url('img/static/error.png'); margin-right: 5px;}"
-            "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/error_pressed.png');}"
+            "QPushButton {background-color: transparent; border: none; margin-right: 5px;}"
         )
+        set_button_images(close_bt, "error.png", "error_pressed.png", QSize(45, 45))
         close_bt.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         close_bt.clicked.connect(self.close)
         layout.addWidget(close_bt, alignment=Qt.AlignCenter)
 
-        # Create a QGraphicsDropShadowEffect
-        shadow_effect = QGraphicsDropShadowEffect()
+        # Create a ShadowEffect
+        shadow_effect = ShadowEffect()
         shadow_effect.setBlurRadius(35)
         shadow_effect.setColor(Qt.gray)
         shadow_effect.setOffset(0, 8)
+        shadow_effect.setRadius(process_images.PROCESS_RADIUS)
 
         # Create a label for displaying the process image
         self.image_label = QLabel()
 
-        image_paths = glob.glob(f"./img/process/{title}.[pj][np]g")
-        if image_paths:
-            image_path = image_paths[0]
-            self.image = QImage(image_path)
-            self.image = self.image.scaledToWidth(1280, Qt.SmoothTransformation)
-            self.image = self.image.scaledToHeight(
-                int(1280 * (2 / 3)), Qt.SmoothTransformation
-            )
-        else:
+        # Pre-scaled with rounded corners, see process_images.py
+        pixmap = process_images.process_pixmap(title)
+        if pixmap.isNull():
             print(f"Image not found: {title}.png or {title}.jpg")
-
-        self.apply_border_radius()
-
-        pixmap = QPixmap.fromImage(self.image)
+        else:
+            # The shadow follows the label, so it is fitted to the image
+            self.image_label.setFixedSize(pixmap.size())
+            self.image_label.setGraphicsEffect(shadow_effect)
         self.image_label.setPixmap(pixmap)
-        self.image_label.setGraphicsEffect(shadow_effect)
         self.image_label.setAlignment(Qt.AlignCenter)
 
-        layout.addWidget(self.image_label)
+        layout.addWidget(self.image_label, alignment=Qt.AlignCenter)
 
         # Set the layout for the widget
         self.setLayout(layout)
@@ -226,52 +210,6 @@ class ProcessWidget(QWidget):
         self.hide()
         self.close_bt_clicked.emit()
 
-    def apply_border_radius(self):
-        # Create a mask image with the desired border radius
-        mask = QImage(self.image.size(), QImage.Format_ARGB32)
-        mask.fill(Qt.transparent)
-
-        # Create a QPainter for the mask
-        painter = QPainter(mask)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        painter.setBrush(QBrush(QColor(Qt.white)))
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(self.image.rect(), 25, 25)
-        painter.end()
-
-        # Apply the mask to the image
-        self.image.setAlphaChannel(mask)
-
-
-class ImageViewer(QGraphicsView):
-    def __init__(self):
-        super().__init__()
-        self.scene = QGraphicsScene()
-        self.setScene(self.scene)
-        self.setDragMode(QGraphicsView.ScrollHandDrag)
-
-        self.image_item = None
-        self.scale_factor = 1.0
-
-    def load_image(self, image_path):
-        pixmap = QPixmap(image_path)
-        scaled_pixmap = pixmap.scaled(
-            2560,
-            1440,
-            aspectRatioMode=Qt.KeepAspectRatio,
-            transformMode=Qt.SmoothTransformation,
-        )
-        self.image_item = self.scene.addPixmap(scaled_pixmap)
-
-    def zoom_in(self):
-        self.scale_factor *= 1.2
-        self.setTransform(self.transform().scale(1.2, 1.2))
-
-    def zoom_out(self):
-        self.scale_factor /= 1.2
-        self.setTransform(self.transform().scale(1 / 1.2, 1 / 1.2))
-
-
 class MapWidget(QWidget):
     close_bt_clicked = pyqtSignal()
 
@@ -288,23 +226,22 @@ class MapWidget(QWidget):
         close_bt.setFocusPolicy(Qt.NoFocus)
         close_bt.setFixedSize(50, 50)
         close_bt.setStyleSheet(
-            "QPushButton {background-color: transparent; border: none; image: url('img/static/error.png'); margin-right: 15px;}"
-            "QPushButton:pressed {background-color: transparent; border: none; image: url('img/static/error_pressed.png');}"
+            "QPushButton {background-color: transparent; border: none; margin-right: 15px;}"
         )
+        set_button_images(close_bt, "error.png", "error_pressed.png", QSize(35, 35))
         close_bt.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         close_bt.clicked.connect(self.close)
         layout.addWidget(close_bt, alignment=Qt.AlignCenter)
 
         # Add shadow effect to the image
-        shadow_effect = QGraphicsDropShadowEffect()
+        shadow_effect = ShadowEffect()
         shadow_effect.setBlurRadius(35)
         shadow_effect.setColor(Qt.gray)
         shadow_effect.setOffset(0, 0)
 
-        # Create an image viewer
-        self.image_viewer = ImageViewer()
+        # Create an image viewer showing the map's tiles
+        self.image_viewer = process_images.MapViewer()
         layout.addWidget(self.image_viewer)
-        self.image_viewer.load_image("./img/process/map.jpg")
         self.image_viewer.setGraphicsEffect(shadow_effect)
 
         # Create zoom buttons layout
@@ -317,7 +254,7 @@ class MapWidget(QWidget):
             "QPushButton {background-color: #7C2F3E; border: none; border-radius: 12px;}"
             "QPushButton:pressed {background-color: #444444; }"
         )
-        zoom_out_button.setIcon(QIcon("./img/static/zoom_out.png"))
+        zoom_out_button.setIcon(QIcon(get_assets().static_pixmap("zoom_out.png")))
         zoom_out_button.setFixedSize(55, 55)
         zoom_out_button.clicked.connect(self.image_viewer.zoom_out)
         zoom_buttons.addWidget(zoom_out_button)
@@ -328,7 +265,7 @@ class MapWidget(QWidget):
             "QPushButton {background-color: #7C2F3E; border: none; border-radius: 12px;}"
             "QPushButton:pressed {background-color: #444444; }"
         )
-        zoom_in_button.setIcon(QIcon("./img/static/zoom_in.png"))
+        zoom_in_button.setIcon(QIcon(get_assets().static_pixmap("zoom_in.png")))
         zoom_in_button.setFixedSize(55, 55)
         zoom_in_button.clicked.connect(self.image_viewer.zoom_in)
         zoom_buttons.addWidget(zoom_in_button)
@@ -394,19 +331,28 @@ class ViewProcessWidget(QWidget):
         self.buttons_widget.map_clicked.connect(self.show_map)
         self.layout.addWidget(self.buttons_widget)
 
+        self.process_widget = None
+        self.map_widget = None
+
     def show_process(self):
-        # Show process widget and hide buttons widget
-        self.process_widget = ProcessWidget(self.title, self)
-        self.process_widget.close_bt_clicked.connect(self.go_back_button)
-        self.layout.addWidget(self.process_widget)
+        # Show process widget and hide buttons widget, made on the first open
+        if self.process_widget is None:
+            self.process_widget = ProcessWidget(self.title, self)
+            self.process_widget.close_bt_clicked.connect(self.go_back_button)
+            self.layout.addWidget(self.process_widget)
+        self.process_widget.show()
 
         self.back_bt.hide()
 
     def show_map(self):
-        # Show map widget and hide buttons widget
-        self.map_widget = MapWidget(self)
-        self.map_widget.close_bt_clicked.connect(self.go_back_button)
-        self.layout.addWidget(self.map_widget)
+        # Show map widget and hide buttons widget, made on the first open
+        if self.map_widget is None:
+            self.map_widget = MapWidget(self)
+            self.map_widget.close_bt_clicked.connect(self.go_back_button)
+            self.layout.addWidget(self.map_widget)
+        else:
+            self.map_widget.image_viewer.reset_zoom()
+        self.map_widget.show()
 
         self.back_bt.hide()
 